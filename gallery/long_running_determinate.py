@@ -1,6 +1,5 @@
 import textwrap
 from time import sleep
-from queue import Queue
 from random import randint
 from threading import Thread
 import ttkbootstrap as ttk
@@ -10,12 +9,13 @@ from ttkbootstrap.dialogs import Messagebox
 
 class LongRunning(ttk.Frame):
 
-    threadqueue = Queue()
-
     def __init__(self, master):
         super().__init__(master, padding=5, bootstyle=INFO)
         self.pack(fill=BOTH, expand=YES)
         self.message = ttk.StringVar(value='')
+        self.tasks_completed = 0
+        # widgets are only touched on the UI thread, so look the app up here
+        self.app = self.winfo_toplevel()
         self.create_elements()
 
     def create_elements(self):
@@ -47,29 +47,27 @@ class LongRunning(ttk.Frame):
     def start_task(self):
         """Start the progressbar and run the task in another thread"""
         self.start_btn.configure(state=DISABLED)
+        self.tasks_completed = 0
+        self.progressbar.configure(value=0)
         for i in range(1, 11):
             thread = Thread(
                 target=self.simulate_io_task, 
                 args=[i], 
                 daemon=True
             )
-            LongRunning.threadqueue.put(thread.start())
-        self.listen_for_complete_task()
+            thread.start()
 
-    def listen_for_complete_task(self):
-        """Check to see if task is complete; if so, stop the 
-        progressbar and show and alert
+    def on_task_complete(self, threadnum):
+        """Runs on the UI thread each time a task finishes; update the 
+        progressbar, and show an alert when every task is done
         """
-        if LongRunning.threadqueue.unfinished_tasks == 0:
-            self.progressbar.configure(value=10)
+        self.tasks_completed += 1
+        self.progressbar.configure(value=self.tasks_completed)
+        self.message.set(f'Finished task on Thread: {threadnum}')
+        if self.tasks_completed == self.progressbar.cget('maximum'):
             Messagebox.ok(title='alert', message="process complete")
             self.start_btn.configure(state=NORMAL)
             self.message.set('')
-            return
-        max_value = self.progressbar.cget('maximum')
-        tasks_completed = max_value - LongRunning.threadqueue.unfinished_tasks
-        self.progressbar.configure(value=tasks_completed)
-        self.after(500, self.listen_for_complete_task)
 
     def simulate_io_task(self, threadnum):
         """Simulate an IO operation to run for a random interval 
@@ -77,8 +75,8 @@ class LongRunning(ttk.Frame):
         """
         seconds_to_run = randint(1, 15)
         sleep(seconds_to_run)
-        LongRunning.threadqueue.task_done()
-        self.message.set(f'Finished task on Thread: {threadnum}')
+        # hand the UI update back to the main thread
+        self.app.call_soon_threadsafe(self.on_task_complete, threadnum)
 
 
 if __name__ == '__main__':
@@ -90,6 +90,8 @@ from ttkbootstrap.themes.legacy import install_legacy_themes
 from ttkbootstrap.utils import (
     enable_high_dpi_awareness,
     scale_size,
+    refresh_scaling,
+    watch_dpi,
     windowing_system,
     color_to_rgb,
     color_to_hex,
@@ -283,12 +285,14 @@ from ttkbootstrap.widgets import (
     M,
     Meter,
     ScrolledFrame,
+    ScrolledList,
     ScrolledText,
     TableColumn,
     TableRow,
     Tableview,
     ToastNotification,
     ToolTip,
+    ToolTipRegistry,
 )
 from ttkbootstrap.window import App, Toplevel, Window
 
@@ -302,6 +306,7 @@ from ttkbootstrap.dialogs import (
     ColorDropperDialog,
     DatePickerDialog,
     Dialog,
+    DialogPool,
     FontDialog,
     MessageDialog,
     Messagebox,
@@ -320,6 +325,10 @@ from ttkbootstrap.localization import L, LocaleVar, set_locale
 # package; `ttkbootstrap.validation` remains the canonical home / import path.
 from ttkbootstrap.validation import Validation, validator, ValidationEvent
 
+# Declarative widget-tree construction (`ttk.build(spec, parent)`); needs the
+# concrete widget classes above, which a spec names by their exported names.
+from ttkbootstrap.spec import build
+
 # Re-export the stdlib file dialog as `ttk.filedialog`. It is the one standard
 # dialog ttkbootstrap does not supersede (native OS chrome), so surfacing the
 # module here spares callers a bare `from tkinter import filedialog`; the themed
@@ -368,6 +377,8 @@ __all__ = [
     # Public utilities
     "enable_high_dpi_awareness",
     "scale_size",
+    "refresh_scaling",
+    "watch_dpi",
     "windowing_system",
     "color_to_rgb",
     "color_to_hex",
@@ -392,6 +403,9 @@ __all__ = [
     "validator",
     "ValidationEvent",
 
+    # Declarative construction
+    "build",
+
     # Stdlib file dialog (native; not superseded)
     "filedialog",
 
@@ -408,10 +422,12 @@ __all__ = [
     "Meter",
     "ScrolledText",
     "ScrolledFrame",
+    "ScrolledList",
     "Tableview",
     "TableColumn",
     "TableRow",
     "ToolTip",
+    "ToolTipRegistry",
     "ToastNotification",
     "M",
 
@@ -419,6 +435,7 @@ __all__ = [
     "Messagebox",
     "Querybox",
     "Dialog",
+    "DialogPool",
     "MessageDialog",
     "QueryDialog",
     "DatePickerDialog",
@@ -72,6 +72,7 @@ from ttkbootstrap.dialogs import (
     ColorDropperDialog as ColorDropperDialog,
     DatePickerDialog as DatePickerDialog,
     Dialog as Dialog,
+    DialogPool as DialogPool,
     FontDialog as FontDialog,
     MessageDialog as MessageDialog,
     Messagebox as Messagebox,
@@ -83,6 +84,7 @@ from ttkbootstrap.localization import (
     LocaleVar as LocaleVar,
     set_locale as set_locale,
 )
+from ttkbootstrap.spec import build as build
 from ttkbootstrap.style import (
     Assets as Assets,
     AutoStyleMixin as AutoStyleMixin,
@@ -117,12 +119,14 @@ from ttkbootstrap.utils import (
     contrast_color as contrast_color,
     enable_high_dpi_awareness as enable_high_dpi_awareness,
     on_theme_change as on_theme_change,
+    refresh_scaling as refresh_scaling,
     remove_theme_change_callback as remove_theme_change_callback,
     scale_size as scale_size,
     set_default_button as set_default_button,
     set_global_family as set_global_family,
     theme_aware as theme_aware,
     update_hsl_value as update_hsl_value,
+    watch_dpi as watch_dpi,
     windowing_system as windowing_system,
 )
 from ttkbootstrap.validation import (
@@ -138,12 +142,14 @@ from ttkbootstrap.widgets import (
     M as M,
     Meter as Meter,
     ScrolledFrame as ScrolledFrame,
+    ScrolledList as ScrolledList,
     ScrolledText as ScrolledText,
     TableColumn as TableColumn,
     TableRow as TableRow,
     Tableview as Tableview,
     ToastNotification as ToastNotification,
     ToolTip as ToolTip,
+    ToolTipRegistry as ToolTipRegistry,
 )
 from ttkbootstrap.window import App as App, Toplevel as Toplevel, Window as Window
 
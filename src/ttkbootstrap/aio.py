@@ -0,0 +1,240 @@
+"""Run a ttkbootstrap application on an asyncio event loop.
+
+``mainloop()`` owns the thread it runs on, so asyncio code normally has to live
+on another thread and marshal every widget update back. This module turns that
+around: Tk is pumped from a task on the asyncio loop, so coroutines touch
+widgets directly and dialogs can be awaited.
+
+```python
+import ttkbootstrap as ttk
+from ttkbootstrap.dialogs import Messagebox
+
+async def main(app):
+    data = await fetch()                    # any asyncio code
+    label.configure(text=data)              # widgets, no hand-off needed
+    if await Messagebox.ayesno("Save?", parent=app) == "Yes":
+        ...
+
+app = ttk.App()
+label = ttk.Label(app)
+label.pack()
+app.run_async(main(app))
+```
+
+The pump handles every pending Tk event, then sleeps until there is something
+to do. On X11 the loop watches the display connection itself, so input wakes
+it at once; the sleep between turns grows while the application is idle (Tk
+timers have no descriptor to watch), and shrinks back as soon as events flow.
+Work queued from other threads with ``call_soon_threadsafe`` wakes the loop
+through asyncio's own wakeup.
+"""
+import asyncio
+import sys
+import tkinter
+from typing import Any, Awaitable, List, Optional
+
+import _tkinter
+
+from ttkbootstrap.internal.dispatch import UIDispatcher
+
+__all__ = ["run", "serve", "wait_window"]
+
+# The most Tk events handled in one turn before the pump yields to the loop, so
+# a flood of events (a drag, a redraw storm) cannot starve other tasks.
+_BURST = 100
+
+# Idle sleep bounds, in seconds. The sleep starts short after any activity and
+# doubles each idle turn. With the X connection watched, input wakes the loop
+# immediately and the cap only bounds the latency of Tk timers; without it,
+# the cap is also the input latency, so it stays near one frame.
+_MIN_IDLE_SLEEP = 0.001
+_MAX_IDLE_SLEEP_WATCHED = 0.02
+_MAX_IDLE_SLEEP = 0.01
+
+
+def run(app: tkinter.Tk, main: Optional[Awaitable[Any]] = None) -> Any:
+    """Run `app` and the awaitable `main` on a new asyncio loop.
+
+    Blocks like ``mainloop()`` until the window is closed. If `main` finishes
+    first the application keeps running; if the window closes first, `main`
+    is cancelled. Returns the result of `main` (``None`` without one).
+    """
+    return asyncio.run(_run(app, main))
+
+
+async def _run(app: tkinter.Tk, main: Optional[Awaitable[Any]]) -> Any:
+    server = asyncio.ensure_future(serve(app))
+    if main is None:
+        await server
+        return None
+    task = asyncio.ensure_future(main)
+    try:
+        await asyncio.wait({server, task}, return_when=asyncio.FIRST_COMPLETED)
+        if not task.done():
+            # The window was closed while main was still running.
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            server.result()  # re-raises an error from the pump
+            return None
+        result = task.result()  # re-raises an exception from main
+        await server
+        return result
+    finally:
+        for pending in (task, server):
+            if not pending.done():
+                pending.cancel()
+
+
+async def serve(app: tkinter.Misc) -> None:
+    """Pump the Tk events of `app` until its root window is destroyed.
+
+    Run it as a task next to your own coroutines; cancelling the task stops
+    the pump and leaves the application alive (``mainloop()`` can take over).
+    """
+    root = app._root()
+    try:
+        if not root.winfo_exists():
+            return
+    except tkinter.TclError:
+        return
+    pump = _TkPump(root, asyncio.get_running_loop())
+    try:
+        await pump.run()
+    finally:
+        pump.close()
+
+
+async def wait_window(window: tkinter.Misc) -> None:
+    """Wait until `window` is destroyed, without blocking the event loop.
+
+    The asyncio counterpart of ``Misc.wait_window``; needs the Tk events to be
+    pumped (:func:`serve`, ``App.run_async``) while it waits.
+    """
+    try:
+        if not window.winfo_exists():
+            return
+    except tkinter.TclError:
+        return
+    closed = asyncio.get_running_loop().create_future()
+
+    def on_destroy(event: tkinter.Event) -> None:
+        if str(event.widget) == str(window) and not closed.done():
+            closed.set_result(None)
+
+    # The binding is left in place when the wait is cancelled: unbinding one
+    # script would drop every other <Destroy> binding of the window on the
+    # Pythons before 3.13, and a settled future turns it into a no-op.
+    window.bind("<Destroy>", on_destroy, "+")
+    try:
+        await closed
+    finally:
+        if not closed.done():
+            closed.cancel()
+
+
+class _TkPump:
+    """Drives the Tk event queue of one root from an asyncio loop."""
+
+    def __init__(self, root: tkinter.Misc, loop: asyncio.AbstractEventLoop) -> None:
+        self._root = root
+        self._loop = loop
+        self._closed = loop.create_future()
+        self._waiter: Optional[asyncio.Future] = None
+        # Never unbound, for the reason given in wait_window.
+        root.bind("<Destroy>", self._on_root_destroy, "+")
+        self._fds: List[int] = []
+        fd = _x11_connection_fd(root)
+        if fd is not None:
+            try:
+                loop.add_reader(fd, self._wake)
+                self._fds.append(fd)
+            except (NotImplementedError, OSError, ValueError):
+                pass
+        self._dispatcher = UIDispatcher.for_widget(root)
+        self._dispatcher.set_waker(self._on_dispatch)
+
+    async def run(self) -> None:
+        dooneevent = self._root.tk.dooneevent
+        cap = _MAX_IDLE_SLEEP_WATCHED if self._fds else _MAX_IDLE_SLEEP
+        delay = _MIN_IDLE_SLEEP
+        while not self._closed.done():
+            handled = 0
+            while handled < _BURST and dooneevent(_tkinter.DONT_WAIT):
+                handled += 1
+            if self._closed.done():
+                break
+            if handled >= _BURST:
+                delay = _MIN_IDLE_SLEEP
+                await asyncio.sleep(0)
+                continue
+            await self._sleep(delay)
+            delay = _MIN_IDLE_SLEEP if handled else min(delay * 2, cap)
+
+    async def _sleep(self, delay: float) -> None:
+        waiter = self._waiter = self._loop.create_future()
+        handle = self._loop.call_later(delay, self._wake)
+        try:
+            await waiter
+        finally:
+            handle.cancel()
+            self._waiter = None
+
+    def _wake(self) -> None:
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def _on_dispatch(self) -> None:
+        # Called from a worker thread by the dispatcher.
+        self._loop.call_soon_threadsafe(self._drain)
+
+    def _drain(self) -> None:
+        self._dispatcher.drain()
+        self._wake()  # let Tk redraw whatever the callbacks changed
+
+    def _on_root_destroy(self, event: tkinter.Event) -> None:
+        if event.widget is self._root and not self._closed.done():
+            self._closed.set_result(None)
+            self._wake()
+
+    def close(self) -> None:
+        for fd in self._fds:
+            self._loop.remove_reader(fd)
+        self._fds = []
+        self._dispatcher.set_waker(None)
+        if not self._closed.done():
+            self._closed.cancel()  # stopped while the root lives on
+
+
+def _x11_connection_fd(root: tkinter.Misc) -> Optional[int]:
+    """The descriptor of the X server connection of `root`, if it can be found.
+
+    Tk does not expose it, so it is read through the Tk C API: the main
+    window's first field is its ``Display *``. Returns ``None`` on other
+    windowing systems or whenever a symbol cannot be resolved.
+    """
+    if sys.platform in ("win32", "darwin"):
+        return None
+    try:
+        if root.tk.call("tk", "windowingsystem") != "x11":
+            return None
+        import ctypes
+
+        lib = ctypes.CDLL(_tkinter.__file__)
+        lib.Tk_MainWindow.restype = ctypes.c_void_p
+        lib.Tk_MainWindow.argtypes = [ctypes.c_void_p]
+        lib.XConnectionNumber.restype = ctypes.c_int
+        lib.XConnectionNumber.argtypes = [ctypes.c_void_p]
+        tkwin = lib.Tk_MainWindow(root.tk.interpaddr())
+        if not tkwin:
+            return None
+        display = ctypes.c_void_p.from_address(tkwin).value
+        if not display:
+            return None
+        fd = lib.XConnectionNumber(display)
+    except Exception:
+        return None
+    return fd if fd >= 0 else None
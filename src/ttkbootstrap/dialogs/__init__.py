@@ -6,7 +6,7 @@ from .colorchooser import (
 from .colordropper import (
     ColorDropperDialog,
 )
-from .base import Dialog
+from .base import Dialog, DialogPool
 from .message import MessageDialog, Messagebox
 from .query import QueryDialog, Querybox
 from .datepicker import DatePickerDialog
@@ -15,6 +15,7 @@ from .fontdialog import FontDialog
 __all__ = [
     # Base / core dialogs
     "Dialog",
+    "DialogPool",
     "MessageDialog",
     "QueryDialog",
     "DatePickerDialog",
@@ -6,9 +6,10 @@ dialog implementations in this package.
 
 import tkinter
 from tkinter import BaseWidget
-from typing import Any, Optional, Tuple
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
 import ttkbootstrap as ttk
+from ttkbootstrap.aio import wait_window
 from ttkbootstrap.internal.positioning import (
     center_on_parent,
     center_on_screen,
@@ -16,6 +17,92 @@ from ttkbootstrap.internal.positioning import (
 )
 from ttkbootstrap.utils import windowing_system
 
+# The root attribute the dialog pool is stored under (one per root).
+_POOL_ATTRIBUTE = "_ttkbootstrap_dialog_pool"
+
+
+class DialogPool:
+    """Opt-in reuse of built `Messagebox` and `Querybox` dialogs.
+
+    Building a dialog -- its toplevel, widget tree, button styles, and icon --
+    is most of the cost of showing it. With the pool enabled, a dialog closed
+    by the user is withdrawn instead of destroyed and kept per root, one for
+    each *template*: the dialog kind, its parent, and the settings that shape
+    its widgets (the button set, icon, and so on). The next call with the same
+    template reuses it, updating only the title, text, and result, and
+    recenters it with the size it already measured unless its text changed.
+
+    Enable it once, early::
+
+        DialogPool.enable()
+
+    Dialogs created directly (``MessageDialog(...).show()``) and the awaitable
+    ``Messagebox.a*`` methods are never pooled.
+    """
+
+    _enabled = False
+
+    def __init__(self, root: tkinter.Misc) -> None:
+        self._root = root
+        self._idle: Dict[Hashable, "Dialog"] = {}
+
+    @classmethod
+    def enable(cls, enabled: bool = True) -> None:
+        """Turn dialog reuse on (or off) for the whole application.
+
+        Turning it off stops dialogs being reused; the ones already kept are
+        released with `clear` or when their root is destroyed.
+        """
+        cls._enabled = bool(enabled)
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """Whether `Messagebox` and `Querybox` reuse their dialogs."""
+        return cls._enabled
+
+    @classmethod
+    def for_widget(cls, widget: tkinter.Misc) -> "DialogPool":
+        """Return the pool attached to `widget`'s root, creating it once."""
+        root = widget._root()
+        pool = getattr(root, _POOL_ATTRIBUTE, None)
+        if pool is None:
+            pool = cls(root)
+            setattr(root, _POOL_ATTRIBUTE, pool)
+        return pool
+
+    def adopt(self, dialog: "Dialog") -> "Dialog":
+        """Return the dialog to show in place of the freshly made `dialog`.
+
+        That is a kept dialog of the same template, carrying `dialog`'s text,
+        or `dialog` itself -- marked to return to the pool when it closes.
+        """
+        key = dialog._template_key()
+        if key is None or not self._enabled:
+            return dialog
+        kept = self._idle.pop(key, None)
+        if kept is None or not kept._is_built():
+            dialog._pool_key = key
+            return dialog
+        kept._take_settings(dialog)
+        return kept
+
+    def release(self, dialog: "Dialog") -> None:
+        """Keep a closed, withdrawn `dialog` for reuse (one per template)."""
+        key = dialog._pool_key
+        if key in self._idle or not self._enabled:
+            dialog.close()
+            return
+        self._idle[key] = dialog
+
+    def clear(self) -> None:
+        """Destroy every kept dialog."""
+        idle, self._idle = self._idle, {}
+        for dialog in idle.values():
+            dialog.close()
+
+    def __len__(self) -> int:
+        return len(self._idle)
+
 
 class Dialog(BaseWidget):
     """A simple dialog base class."""
@@ -45,6 +132,10 @@ class Dialog(BaseWidget):
         self._result = None
         self._alert = alert
         self._initial_focus = None
+        # Set when the dialog came from (and returns to) a `DialogPool`.
+        self._pool_key: Optional[Hashable] = None
+        self._known_size: Optional[Tuple[int, int]] = None
+        self._closed_var: Optional[tkinter.IntVar] = None
 
     def _footprint(self) -> Tuple[int, int]:
         """The size the dialog occupies once mapped.
@@ -53,7 +144,12 @@ class Dialog(BaseWidget):
         size and its *requested* size ignores the `minsize` floor `build` pins --
         measuring that instead centers and clamps a smaller window than the one
         the user sees.
+
+        A pooled dialog shown again with unchanged text reuses the size it
+        measured the first time.
         """
+        if self._known_size is not None:
+            return self._known_size
         toplevel = self._toplevel
         min_width, min_height = toplevel.wm_minsize()
         return (
@@ -77,7 +173,8 @@ class Dialog(BaseWidget):
         multi-head setup.
         """
         toplevel = self._toplevel
-        toplevel.update_idletasks()
+        if self._known_size is None:
+            toplevel.update_idletasks()
         x, y = self._center()
         try:
             x, y = ensure_on_screen(toplevel, x, y, size=self._footprint())
@@ -97,9 +194,13 @@ class Dialog(BaseWidget):
             wait_for_result (bool):
                 Grab input focus and block until the dialog is closed.
         """
-        self.update_idletasks()
         self._result = None
-        self.build()
+        if self._pool_key is not None and self._is_built():
+            if self._reuse():
+                self._fit()
+        else:
+            self.update_idletasks()
+            self.build()
 
         if position is None:
             self._locate()
@@ -120,9 +221,38 @@ class Dialog(BaseWidget):
         if self._initial_focus:
             self._initial_focus.focus_force()
 
+        if self._pool_key is not None and self._known_size is None:
+            self._known_size = self._footprint()
+
         if wait_for_result:
             self._toplevel.grab_set()
-            self._toplevel.wait_window()
+            if self._pool_key is None:
+                self._toplevel.wait_window()
+            else:
+                self._wait_closed()
+
+    async def ashow(self, position: Optional[Tuple[int, int]] = None) -> Any:
+        """Show the dialog modally and await its result.
+
+        The asyncio counterpart of `show`: the caller's coroutine waits for
+        the dialog to close while the event loop keeps running. Tk must be
+        pumped by ``App.run_async`` or ``ttkbootstrap.aio.serve``. Cancelling
+        the await closes the dialog.
+
+        Parameters:
+
+            position (tuple[int, int], optional):
+                The x and y coordinates used to position the dialog. If not
+                given, the dialog is centered on the parent window.
+        """
+        self.show(position, wait_for_result=False)
+        self._toplevel.grab_set()
+        try:
+            await wait_window(self._toplevel)
+        except BaseException:
+            self.close()
+            raise
+        return self.result
 
     def create_body(self, master: tkinter.Misc) -> None:
         """Create the dialog body.
@@ -177,7 +307,7 @@ class Dialog(BaseWidget):
         self._toplevel.withdraw()  # reset the iconify state
 
         # bind <Escape> event to window close
-        self._toplevel.bind("<Escape>", lambda _: self.close())
+        self._toplevel.bind("<Escape>", lambda _: self._finish())
 
         # create widgets
         self.create_body(self._toplevel)
@@ -211,6 +341,73 @@ class Dialog(BaseWidget):
             # the application is destroyed); nothing left to close.
             pass
 
+    # -- reuse (see DialogPool) ------------------------------------------------ #
+    def _is_built(self) -> bool:
+        """Whether the toplevel exists and can be shown again."""
+        try:
+            return self._toplevel is not None and bool(self._toplevel.winfo_exists())
+        except tkinter.TclError:
+            return False
+
+    def _template_key(self) -> Optional[Hashable]:
+        """What must match for a kept dialog to stand in for this one.
+
+        None (the default) means the dialog is never pooled.
+        """
+        return None
+
+    def _take_settings(self, other: "Dialog") -> None:
+        """Adopt the per-call settings (title, text, ...) of `other`."""
+        self._title = other._title
+        self._alert = other._alert
+        self._parent = other._parent
+
+    def _reuse(self) -> bool:
+        """Push the adopted settings into the built widgets.
+
+        Returns whether the content changed size, so it must be measured
+        again.
+        """
+        self._toplevel.title(self._title)
+        return False
+
+    def _fit(self) -> None:
+        """Resize the toplevel to its changed content."""
+        toplevel = self._toplevel
+        self._known_size = None
+        toplevel.geometry("")
+        toplevel.update_idletasks()
+        width = toplevel.winfo_reqwidth()
+        height = toplevel.winfo_reqheight()
+        if width > 0 and height > 0:
+            toplevel.geometry(f"{width}x{height}")
+
+    def _wait_closed(self) -> None:
+        """Block until a pooled dialog is withdrawn by `_finish` or destroyed."""
+        toplevel = self._toplevel
+        if self._closed_var is None:
+            closed = self._closed_var = tkinter.IntVar(toplevel._root())
+
+            def on_destroy(event: tkinter.Event) -> None:
+                if event.widget is toplevel:
+                    closed.set(1)
+
+            toplevel.bind("<Destroy>", on_destroy, "+")
+        self._closed_var.set(0)
+        toplevel.wait_variable(self._closed_var)
+
+    def _finish(self) -> None:
+        """End the dialog: back into its pool if it came from one, else close."""
+        if self._pool_key is None or not self._is_built():
+            self.close()
+            return
+        toplevel = self._toplevel
+        toplevel.grab_release()
+        toplevel.withdraw()
+        if self._closed_var is not None:
+            self._closed_var.set(1)
+        DialogPool.for_widget(toplevel).release(self)
+
     @property
     def result(self) -> Any:
         """Returns the result of the dialog.
@@ -8,7 +8,8 @@ import tkinter
 from collections import namedtuple
 from typing import Any, List, Optional, Tuple
 
-from PIL import ImageColor
+from PIL import Image, ImageColor, ImageTk
+from PIL.Image import Resampling
 
 import ttkbootstrap as ttk
 from ttkbootstrap import utils
@@ -32,6 +33,54 @@ ColorValues = namedtuple('ColorValues', 'h s l r g b hex')
 PEN = '✛'
 
 
+def _render_spectrum(width: int, height: int, cell: int) -> Image.Image:
+    """Render the hue/saturation spectrum as a grid of `cell`-sized blocks.
+
+    Each block carries the color `ColorChooser.color_from_coords` reports for
+    its top-left corner. The conversion runs over whole bands instead of per
+    block: at 50% lightness, HSL is HSV with `v = (1 + s) / 2` and
+    `s_v = 2s / (1 + s)`, so hue varies by column only, the other two by row
+    only, and Pillow converts the merged grid in one call.
+    """
+    xs = range(0, width, cell)
+    ys = range(0, height, cell)
+    cols, rows = len(xs), len(ys)
+    hues = [int(min(HUE, max(0, (HUE / width) * x))) for x in xs]
+    sats = [int(min(SAT, max(0, SAT - ((SAT / height) * y)))) / SAT for y in ys]
+
+    hue = Image.new('L', (cols, 1))
+    hue.putdata([round(h / HUE * 255) for h in hues])
+    sat = Image.new('L', (1, rows))
+    sat.putdata([round(2 * s / (1 + s) * 255) for s in sats])
+    val = Image.new('L', (1, rows))
+    val.putdata([round((1 + s) / 2 * 255) for s in sats])
+
+    grid = Image.merge('HSV', (
+        hue.resize((cols, rows), Resampling.NEAREST),
+        sat.resize((cols, rows), Resampling.NEAREST),
+        val.resize((cols, rows), Resampling.NEAREST),
+    )).convert('RGB')
+    blocks = grid.resize((cols * cell, rows * cell), Resampling.NEAREST)
+    return blocks.crop((0, 0, width, height))
+
+
+def _render_luminance(hexcolor: str, width: int, height: int) -> Image.Image:
+    """Render the luminance strip for `hexcolor` as `height`-wide blocks."""
+    cells = [
+        ImageColor.getrgb(utils.update_hsl_value(
+            color=hexcolor,
+            lum=l / width * LUM,
+            inmodel='hex',
+            outmodel='hex'
+        ))
+        for l in range(0, width, height)
+    ]
+    strip = Image.new('RGB', (len(cells), 1))
+    strip.putdata(cells)
+    blocks = strip.resize((len(cells) * height, height), Resampling.NEAREST)
+    return blocks.crop((0, 0, width, height))
+
+
 @validator
 def validate_color(event: Any) -> bool:
     try:
@@ -126,24 +175,26 @@ class ColorChooser(ttk.Frame):
         self.create_luminance_indicator()
 
     def create_spectrum(self, master: tkinter.Misc) -> ttk.Canvas:
-        """Create the color spectrum canvas"""
-        # canvas and point dimensions
+        """Create the color spectrum canvas.
+
+        The spectrum is one image item. It depends only on its pixel size, so
+        it is rendered once per size and shared by every chooser through the
+        engine's image cache.
+        """
         width = self.spectrum_width
         height = self.spectrum_height
-        xf = yf = self.spectrum_point
+        cell = self.spectrum_point
 
         # create canvas widget and binding
         canvas = ttk.Canvas(master, width=width, height=height, cursor='tcross')
         canvas.bind("<B1-Motion>", self.on_spectrum_interaction, add="+")
         canvas.bind("<Button-1>", self.on_spectrum_interaction, add="+")
 
-        # add color points
-        for x, colorx in enumerate(range(0, width, xf)):
-            for y, colory in enumerate(range(0, height, yf)):
-                values = self.color_from_coords(colorx, colory)
-                fill = values.hex
-                bbox = [x * xf, y * yf, (x * xf) + xf, (y * yf) + yf]
-                canvas.create_rectangle(*bbox, fill=fill, width=0)
+        image = self.style._get_or_create_image(
+            ('colorchooser-spectrum', (width, height), cell),
+            lambda: ImageTk.PhotoImage(_render_spectrum(width, height, cell)),
+        )
+        canvas.create_image(0, 0, image=image, anchor=NW)
         return canvas
 
     def create_spectrum_indicator(self) -> None:
@@ -332,21 +383,15 @@ class ColorChooser(ttk.Frame):
 
         values = self.get_variables()
         canvas = ttk.Canvas(master, height=height, width=width)
-
-        # add color points to scale
-        for x, l in enumerate(range(0, width, xf)):
-            lum = l / width * LUM
-            fill = utils.update_hsl_value(
-                color=values.hex,
-                lum=lum,
-                inmodel='hex',
-                outmodel='hex'
-            )
-            bbox = [x * xf, 0, (x * xf) + xf, height]
-            tag = f'color{x}'
-            canvas.create_rectangle(*bbox, fill=fill, width=0, tags=[tag])
-            canvas.bind("<B1-Motion>", self.on_luminance_interaction, add="+")
-            canvas.bind("<Button-1>", self.on_luminance_interaction, add="+")
+        canvas.bind("<B1-Motion>", self.on_luminance_interaction, add="+")
+        canvas.bind("<Button-1>", self.on_luminance_interaction, add="+")
+
+        # The strip changes with every hue/saturation change, so it is one
+        # image owned by this chooser and repainted in place rather than a
+        # cache entry per color.
+        self._luminance_image = ImageTk.PhotoImage(
+            _render_luminance(values.hex, width, xf), master=canvas)
+        canvas.create_image(0, 0, image=self._luminance_image, anchor=NW)
         return canvas
 
     def create_luminance_indicator(self) -> None:
@@ -419,18 +464,8 @@ class ColorChooser(ttk.Frame):
     def update_luminance_scale(self) -> None:
         """Update the luminance scale with the change in hue and saturation"""
         values = self.get_variables()
-        width = self.spectrum_width
-        xf = self.spectrum_point
-        for x, l in enumerate(range(0, width, xf)):
-            lum = l / width * LUM
-            fill = utils.update_hsl_value(
-                color=values.hex,
-                lum=lum,
-                inmodel='hex',
-                outmodel='hex'
-            )
-            tag = f'color{x}'
-            self.luminance_scale.itemconfig(tag, fill=fill)
+        self._luminance_image.paste(_render_luminance(
+            values.hex, self.spectrum_width, self.spectrum_point))
 
     def update_luminance_indicator(self) -> None:
         """Update the position of the luminance indicator"""
@@ -2,10 +2,16 @@
 
 Captures a screenshot and shows a magnified view so the user can click anywhere
 on screen to pick a color, returned as RGB/HSL/HEX. Windows and Linux only.
+
+The screenshot is grabbed on a worker thread -- a multi-monitor desktop takes
+seconds to capture -- and the overlay appears once it arrives. Pointer motion
+only records the position; the loupe is redrawn at most once per event-loop
+turn, and only when the pixel under the cursor or the zoom level changed.
 """
+import threading
 import tkinter as tk
 from collections import namedtuple
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 from PIL import ImageGrab, ImageTk
 from PIL.Image import Resampling
@@ -14,6 +20,8 @@ import ttkbootstrap as ttk
 from ttkbootstrap import utils
 from ttkbootstrap.constants import *
 from ttkbootstrap.internal import wheel
+from ttkbootstrap.internal.dispatch import UIDispatcher
+from ttkbootstrap.internal.render_queue import RenderQueue
 
 ColorChoice = namedtuple('ColorChoice', 'rgb hsl hex')
 
@@ -46,10 +54,15 @@ class ColorDropperDialog:
         self._touchpad = wheel.PixelAccumulator()
 
     def build_screenshot_canvas(self) -> None:
-        """Build the screenshot canvas"""
+        """Build the screenshot canvas.
+
+        Uses the screenshot taken by `show`, grabbing one now if there is
+        none yet.
+        """
         self.screenshot_canvas: ttk.Canvas = ttk.Canvas(
             self.toplevel, cursor='tcross', autostyle=False)
-        self.screenshot_data = ImageGrab.grab()
+        if getattr(self, "screenshot_data", None) is None:
+            self.screenshot_data = ImageGrab.grab()
         self.screenshot_image: ImageTk.PhotoImage = ImageTk.PhotoImage(self.screenshot_data)
         self.screenshot_canvas.create_image(
             0, 0, image=self.screenshot_image, anchor=NW)
@@ -107,6 +120,7 @@ class ColorDropperDialog:
         hsl = utils.color_to_hsl(hx)
         rgb = utils.color_to_rgb(hx)
         self.result.set(ColorChoice(rgb, hsl, hx))
+        self._discard_render()
         if self.toplevel:
             self.toplevel.destroy()
             self.toplevel.grab_release()
@@ -116,6 +130,7 @@ class ColorDropperDialog:
 
     def on_right_click(self, _: tk.Event) -> None:
         """Close the color dropper without saving any color information"""
+        self._discard_render()
         if self.zoom_toplevel:
             self.zoom_toplevel.destroy()
         if self.toplevel:
@@ -123,40 +138,109 @@ class ColorDropperDialog:
             self.toplevel.destroy()
 
     def on_mouse_motion(self, event: Optional[tk.Event] = None) -> None:
-        """Callback for mouse motion"""
+        """Callback for mouse motion.
+
+        Records the pointer position; the loupe follows it at the next idle
+        pass, once however many motion events arrived in between.
+        """
         if event is None:
             x, y = self.toplevel.winfo_pointerxy()  # type: ignore[union-attr]
         else:
             x = event.x
             y = event.y
-        # move snip window
-        self.zoom_toplevel.geometry(
-            f'+{x + self.zoom_xoffset}+{y + self.zoom_yoffset}')
-        # update the snip image
+        self._pointer = (x, y)
+        RenderQueue.for_widget(self.toplevel).invalidate(
+            (self.toplevel._w, "loupe"), self._render_loupe)
+
+    def _render_loupe(self) -> None:
+        """Move the zoom window to the pointer and redraw it if needed."""
+        if self.zoom_toplevel is None or not self.zoom_toplevel.winfo_exists():
+            return
+        x, y = self._pointer
+        key = (x, y, self.zoom_level)
+        if key == self._loupe_key:
+            return
+        if (x, y) != self._loupe_key[:2]:
+            self.zoom_toplevel.geometry(
+                f'+{x + self.zoom_xoffset}+{y + self.zoom_yoffset}')
+        self._loupe_key = key
         bbox = (x - self.zoom_level, y - self.zoom_level,
                 x + self.zoom_level + 1, y + self.zoom_level + 1)
         size = (self.zoom_width, self.zoom_height)
         self.zoom_data = self.screenshot_data.crop(
             bbox).resize(size, Resampling.BOX)
-        self.zoom_image: ImageTk.PhotoImage = ImageTk.PhotoImage(self.zoom_data)
-        self.zoom_canvas.itemconfig('image', image=self.zoom_image)
-        hover_color = self.get_hover_color()
-        contrast_color = utils.contrast_color(hover_color, 'hex')
-        self.zoom_canvas.itemconfig('indicator', fill=contrast_color)
+        if self.zoom_image is None:
+            self.zoom_image = ImageTk.PhotoImage(self.zoom_data)
+            self.zoom_canvas.itemconfig('image', image=self.zoom_image)
+        else:
+            # same size every time: repaint the existing Tk image in place
+            self.zoom_image.paste(self.zoom_data)
+        contrast_color = utils.contrast_color(self.get_hover_color(), 'hex')
+        if contrast_color != self._indicator_color:
+            self._indicator_color = contrast_color
+            self.zoom_canvas.itemconfig('indicator', fill=contrast_color)
+
+    def _discard_render(self) -> None:
+        if self.toplevel is not None:
+            RenderQueue.for_widget(self.toplevel).discard(
+                (self.toplevel._w, "loupe"))
 
     def get_hover_color(self) -> str:
         """Get the color that is hovered over by the mouse cursor."""
-        x1, y1, x2, y2 = self.zoom_canvas.bbox('indicator')
-        x = x1 + (x2 - x1) // 2
-        y = y1 + (y2 - y2) // 2
-        r, g, b = self.zoom_data.getpixel((x, y))
-        hx = utils.color_to_hex((r, g, b))
-        return hx
+        width, height = self.screenshot_data.size
+        x, y = self._pointer
+        pixel = self.screenshot_data.getpixel(
+            (min(max(x, 0), width - 1), min(max(y, 0), height - 1)))
+        return utils.color_to_hex(tuple(pixel[:3]))
 
     def show(self) -> None:
-        """Show the toplevel window"""
-        self.toplevel = ttk.Toplevel(alpha=1)
+        """Show the toplevel window.
+
+        The screenshot is taken on a worker thread, so the application keeps
+        responding while a large desktop is captured. The fullscreen overlay
+        is mapped once the screenshot arrives, which also keeps the overlay
+        itself out of the capture. Calls made while a capture is still
+        pending are ignored.
+        """
+        if self._capture_pending():
+            return
+        toplevel = self.toplevel = ttk.Toplevel(alpha=1)
+        toplevel.withdraw()
+        self.screenshot_data = None
+        dispatcher = UIDispatcher.for_widget(toplevel)
+        threading.Thread(
+            target=self._grab_screenshot, args=(dispatcher, toplevel),
+            name="ttkbootstrap-color-dropper", daemon=True,
+        ).start()
+
+    def _capture_pending(self) -> bool:
+        """Whether a screenshot is being taken for a still-open overlay."""
+        return (self.toplevel is not None and self.screenshot_data is None
+                and bool(self.toplevel.winfo_exists()))
+
+    def _grab_screenshot(self, dispatcher: UIDispatcher, toplevel: tk.Toplevel) -> None:
+        """Worker thread: capture the screen and hand it to the UI thread."""
+        try:
+            image = ImageGrab.grab()
+            if image.mode != "RGB":
+                image = image.convert("RGB")
+        except Exception as exc:
+            dispatcher.call_soon(self._on_screenshot, toplevel, None, exc)
+        else:
+            dispatcher.call_soon(self._on_screenshot, toplevel, image, None)
+
+    def _on_screenshot(
+        self, toplevel: tk.Toplevel, image: Any, error: Optional[BaseException]
+    ) -> None:
+        """Build and map the overlay around the screenshot (UI thread)."""
+        if toplevel is not self.toplevel or not toplevel.winfo_exists():
+            return  # closed or replaced while the screenshot was being taken
+        if error is not None:
+            self.toplevel.destroy()
+            raise error
+        self.screenshot_data = image
         self.toplevel.wm_attributes('-fullscreen', True)
+        self.toplevel.deiconify()
         self.build_screenshot_canvas()
 
         # event binding
@@ -175,6 +259,10 @@ class ColorDropperDialog:
         self.zoom_toplevel: Optional[ttk.Toplevel] = None
         self.zoom_data: Any = None
         self.zoom_image: Optional[ImageTk.PhotoImage] = None
+        self._pointer: Tuple[int, int] = (0, 0)
+        # (x, y, zoom level) the loupe was last drawn for
+        self._loupe_key: Tuple[Any, ...] = (None, None, None)
+        self._indicator_color: Optional[str] = None
         self.zoom_height: int = utils.scale_size(self.toplevel, 100)
         self.zoom_width: int = utils.scale_size(self.toplevel, 100)
         self.zoom_xoffset: int = utils.scale_size(self.toplevel, 10)
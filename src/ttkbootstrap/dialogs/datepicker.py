@@ -1,11 +1,15 @@
 """DatePickerDialog implementation (calendar popup)."""
 
+import asyncio
 import calendar
 import tkinter
 from datetime import date, datetime
+from functools import lru_cache
+from tkinter.ttk import Widget as _ttkWidget
 from typing import Any, List, Optional, Tuple
 
 import ttkbootstrap as ttk
+from ttkbootstrap.aio import wait_window
 from ttkbootstrap.constants import *
 from ttkbootstrap.localization import MessageCatalog
 from ttkbootstrap.internal.positioning import (
@@ -15,8 +19,31 @@ from ttkbootstrap.internal.positioning import (
     ensure_on_screen,
 )
 from ttkbootstrap.utils import windowing_system
+from ttkbootstrap.style import Bootstyle, Style
 from ttkbootstrap.style._compat import normalize_datepicker_kwargs
 
+# The day grid is always 6 weeks x 7 days; a month spans 4-6 of those weeks.
+_GRID_ROWS = 6
+_GRID_COLS = 7
+
+# The root attribute the reusable pickers are kept under (one dict per root).
+_PICKERS_ATTRIBUTE = "_ttkbootstrap_date_pickers"
+
+
+@lru_cache(maxsize=64)
+def _month_layout(
+        first_weekday: int, year: int, month: int
+) -> Tuple[Tuple[Tuple[int, ...], ...], Tuple[Tuple[date, ...], ...]]:
+    """Return the ``(monthdays, monthdates)`` week tables for a month.
+
+    Both tables come from :class:`calendar.Calendar` and are cached, so
+    browsing back and forth between months does not recompute them.
+    """
+    cal = calendar.Calendar(firstweekday=first_weekday)
+    monthdays = tuple(tuple(week) for week in cal.monthdayscalendar(year, month))
+    monthdates = tuple(tuple(week) for week in cal.monthdatescalendar(year, month))
+    return monthdays, monthdates
+
 
 class DatePickerDialog:
     """A dialog that displays a calendar popup and returns the
@@ -41,6 +68,10 @@ class DatePickerDialog:
     The bootstyle api may be used to change the style of the widget.
     The available colors include -> primary, secondary, success,
     info, warning, danger, light, dark.
+
+    A popup that is opened again and again (the `DateEntry` button) can
+    be obtained with :meth:`for_widget` instead: it is built once per
+    root and then only moved, reset, and hidden again.
     """
 
     def __init__(
@@ -152,6 +183,11 @@ class DatePickerDialog:
         self._dismiss_after_id: Optional[str] = None
         self._dismiss_binding_root: Optional[tkinter.Misc] = None
         self._dismiss_handler_ids: List[Tuple[str, str]] = []
+        # A kept popup (see for_widget) is withdrawn on close instead of
+        # destroyed; `_closed_var` is bumped on every close so show() can wait.
+        self._kept = False
+        self._showing = False
+        self._closed_var = tkinter.IntVar(self.root)
         self.first_weekday = first_weekday
         self.start_date = start_date or datetime.today().date()
         self.bootstyle = bootstyle or PRIMARY
@@ -170,9 +206,69 @@ class DatePickerDialog:
         self.datevar = ttk.IntVar()
 
         self._setup_calendar()
+        self.root.bind("<Escape>", self._cancel, "+")
+        self.root.bind("<Destroy>", self._on_root_destroy, "+")
         if autoshow:
             self.show()
 
+    @classmethod
+    def for_widget(
+            cls,
+            parent: tkinter.Misc,
+            title: str = " ",
+            first_weekday: int = 6,
+            start_date: Optional[date] = None,
+            bootstyle: str = PRIMARY,
+            show_outside_days: bool = True,
+    ) -> "DatePickerDialog":
+        """Return a withdrawn picker for `parent`, built once and then reused.
+
+        Pickers are kept per root and per ``(first_weekday, bootstyle,
+        show_outside_days)``. The first call builds the popup; later calls
+        retarget the kept one at `parent`, reset it to `start_date` and
+        update its day grid in place. Closing a kept picker withdraws it
+        rather than destroying it. Call :meth:`show` on the result and read
+        :attr:`result` afterward, as with ``autoshow=False``.
+        """
+        root = parent._root()
+        pickers = getattr(root, _PICKERS_ATTRIBUTE, None)
+        if pickers is None:
+            pickers = {}
+            setattr(root, _PICKERS_ATTRIBUTE, pickers)
+        key = (first_weekday, bootstyle or PRIMARY, show_outside_days)
+        picker = pickers.get(key)
+        if picker is not None and picker.root.winfo_exists():
+            if not picker._showing:
+                picker._retarget(parent, title, start_date)
+                return picker
+            # The kept popup is already open (a nested call): hand out a
+            # one-off picker rather than stealing it.
+            return cls(parent, title, first_weekday, start_date, bootstyle,
+                       autoshow=False, show_outside_days=show_outside_days)
+        picker = cls(parent, title, first_weekday, start_date, bootstyle,
+                     autoshow=False, show_outside_days=show_outside_days)
+        picker._kept = True
+        pickers[key] = picker
+        return picker
+
+    def _retarget(self, parent: tkinter.Misc, title: str,
+                  start_date: Optional[date]) -> None:
+        """Point a kept picker at a new target and redraw it for `start_date`."""
+        self.parent = parent
+        self.root.title(title)
+        self.root.transient(parent)
+        self.start_date = start_date or datetime.today().date()
+        self.date_selected = self.start_date
+        self.date = self.start_date
+        self._selection_made = False
+        headers = tuple(self._header_columns())
+        if headers != self._header_texts:
+            # the locale changed since the popup was built
+            for label, text in zip(self._header_labels, headers):
+                label.configure(text=text)
+            self._header_texts = headers
+        self._draw_calendar()
+
     def show(self, position: Optional[Tuple[int, int]] = None, wait_for_result: bool = True) -> None:
         """Show the frameless popup and (optionally) block until it closes.
 
@@ -201,9 +297,47 @@ class DatePickerDialog:
         self.root.deiconify()
         self.root.lift()
         self.root.focus_force()
+        self._showing = True
         self._arm_dismiss()
         if wait_for_result:
-            self.root.wait_window()
+            if self._kept:
+                self.root.wait_variable(self._closed_var)
+            else:
+                self.root.wait_window()
+
+    async def ashow(self, position: Optional[Tuple[int, int]] = None) -> Optional[date]:
+        """Show the popup and await the selected ``date`` (``None`` if cancelled).
+
+        The asyncio counterpart of `show`, for applications run with
+        ``App.run_async``. Cancelling the await dismisses the popup.
+        """
+        self.show(position, wait_for_result=False)
+        try:
+            if self._kept:
+                await self._wait_closed()
+            else:
+                await wait_window(self.root)
+        except BaseException:
+            self._cancel()
+            raise
+        return self.result
+
+    async def _wait_closed(self) -> None:
+        """Wait until a kept popup is withdrawn (or destroyed)."""
+        closed = asyncio.get_running_loop().create_future()
+
+        def on_close(*_: Any) -> None:
+            if not closed.done():
+                closed.set_result(None)
+
+        name = self._closed_var.trace_add("write", on_close)
+        try:
+            await closed
+        finally:
+            try:
+                self._closed_var.trace_remove("write", name)
+            except tkinter.TclError:
+                pass
 
     @property
     def result(self) -> Optional[date]:
@@ -215,9 +349,19 @@ class DatePickerDialog:
     def _cancel(self, *_: Any) -> None:
         """Dismiss the popup without recording a selection."""
         if self.root.winfo_exists():
-            self.root.destroy()
+            self._close()
         self._return_focus()
 
+    def _close(self) -> None:
+        """Destroy the popup, or withdraw it if it is kept for reuse."""
+        self._showing = False
+        if not self._kept:
+            self.root.destroy()
+            return
+        self._disarm_dismiss()
+        self.root.withdraw()
+        self._closed_var.set(self._closed_var.get() + 1)
+
     def _return_focus(self) -> None:
         """Hand input focus back to the parent after the popup closes.
 
@@ -243,9 +387,11 @@ class DatePickerDialog:
             pass
 
     def _arm_dismiss(self) -> None:
-        """Bind Escape + outside-click so the frameless popup can be dismissed."""
-        self.root.bind("<Escape>", self._cancel, "+")
-        self.root.bind("<Destroy>", self._on_root_destroy, "+")
+        """Watch for outside clicks so the frameless popup can be dismissed.
+
+        ``Escape`` and the teardown on ``<Destroy>`` are bound once, when the
+        popup is built.
+        """
         # Delay the outside-click binding so the mouse press that opened the
         # popup (still being dispatched) doesn't immediately dismiss it.
         self._dismiss_after_id = self.root.after(100, self._bind_outside_click)
@@ -303,6 +449,17 @@ class DatePickerDialog:
         """Tear down the dismissal bindings when the popup is destroyed."""
         if event.widget is not self.root:
             return
+        self._disarm_dismiss()
+        if self._showing:
+            # a kept popup destroyed while open: release show()'s wait
+            self._showing = False
+            try:
+                self._closed_var.set(self._closed_var.get() + 1)
+            except tkinter.TclError:
+                pass
+
+    def _disarm_dismiss(self) -> None:
+        """Remove the outside-click watch armed by :meth:`_arm_dismiss`."""
         if self._dismiss_after_id is not None:
             try:
                 self.root.after_cancel(self._dismiss_after_id)
@@ -334,6 +491,7 @@ class DatePickerDialog:
 
         # create visual components
         self._draw_titlebar()
+        self._build_day_grid()
         self._draw_calendar()
 
         # Actualize geometry but stay withdrawn -- show() positions the popup and
@@ -341,66 +499,142 @@ class DatePickerDialog:
         # (notably with autoshow=False, e.g. Querybox.get_date / DateEntry).
         self.root.update_idletasks()
 
+    def _build_day_grid(self) -> None:
+        """Create the (initially empty) 6x7 day grid.
+
+        The grid is built once per popup; :meth:`_draw_calendar` fills it in
+        place on every navigation. Each cell's widgets are created the first
+        time a month needs them -- a Radiobutton for a day of the displayed
+        month, a muted Label for an outside day -- and are then reused.
+        """
+        self.frm_dates = ttk.Frame(self.frm_calendar).pack(fill=BOTH, expand=YES)
+        for col in range(_GRID_COLS):
+            self.frm_dates.columnconfigure(col, weight=1)
+        self._day_buttons: List[List[Optional[ttk.Radiobutton]]] = [
+            [None] * _GRID_COLS for _ in range(_GRID_ROWS)]
+        self._day_labels: List[List[Optional[ttk.Label]]] = [
+            [None] * _GRID_COLS for _ in range(_GRID_ROWS)]
+        # What each cell currently shows, as (kind, text, style); kind is "day",
+        # "outside", or None for a cell in an unused sixth week.
+        self._cell_state: List[List[Optional[Tuple[Any, ...]]]] = [
+            [None] * _GRID_COLS for _ in range(_GRID_ROWS)]
+        self._day_styles: Optional[Tuple[str, str]] = None
+        self._day_styles_version: Optional[int] = None
+
+    def _resolve_day_styles(self) -> Tuple[str, str]:
+        """Return the ttk style names for the selected and the other days.
+
+        Resolved once per theme: a theme change bumps the style engine's
+        theme version, and the next redraw re-resolves (and, if needed,
+        rebuilds) both styles for the new theme.
+        """
+        version = Style.get_instance()._theme_version
+        if self._day_styles is None or self._day_styles_version != version:
+            self._day_styles = (
+                Bootstyle.update_ttk_widget_style(None, f"{self.bootstyle}-toolbutton"),
+                Bootstyle.update_ttk_widget_style(None, f"{self.bootstyle}-calendar"),
+            )
+            self._day_styles_version = version
+        return self._day_styles
+
     def _draw_calendar(self) -> None:
+        """Update the day grid in place for the displayed month."""
         self._set_title()
         self._current_month_days()
-        self.frm_dates = ttk.Frame(self.frm_calendar).pack(fill=BOTH, expand=YES)
+        selected_style, day_style = self._resolve_day_styles()
+        in_selected_month = (
+            self.date.year == self.date_selected.year
+            and self.date.month == self.date_selected.month
+        )
 
         # All day cells share `datevar`; a Radiobutton is "selected" when its
-        # value equals it. Clear it to a value no cell uses (days are 1..31) so a
-        # month other than the selected one shows no selection -- the match
-        # branch below re-sets it to the selected day only when this redraw is of
-        # the selected month. Without this reset, `datevar` stays pinned to the
-        # selected day number and that day is spuriously highlighted in every
-        # month the user browses to.
-        self.datevar.set(0)
-
-        for row, weekday_list in enumerate(self.monthdays):
-            for col, day in enumerate(weekday_list):
-                self.frm_dates.columnconfigure(col, weight=1)
+        # value equals it. It is set to the selected day only when this redraw
+        # is of the selected month, and otherwise to a value no cell uses (days
+        # are 1..31), so browsing to another month shows no selection instead
+        # of highlighting the selected day number in every month.
+        selected_day = 0
+        weeks = len(self.monthdays)
+        for row in range(_GRID_ROWS):
+            for col in range(_GRID_COLS):
+                if row >= weeks:
+                    self._update_cell(row, col, None)
+                    continue
+                day = self.monthdays[row][col]
                 if day == 0:
                     # A cell for a day in the previous/next month. When
                     # show_outside_days is off, leave it blank (empty label keeps
                     # the grid geometry intact); otherwise show the muted number.
                     text = self.monthdates[row][col].day if self.show_outside_days else ""
-                    ttk.Label(
-                        master=self.frm_dates,
-                        text=text,
-                        anchor=CENTER,
-                        padding=5,
-                        state=DISABLED,
-                    ).grid(row=row, column=col, sticky=NSEW)
+                    self._update_cell(row, col, "outside", text)
+                elif in_selected_month and day == self.date_selected.day:
+                    # The toolbutton style plus the ttk "selected" state gives
+                    # this day its ON look; without it the day sits in the
+                    # (quiet + muted) OFF state and reads as a disabled button.
+                    selected_day = day
+                    self._update_cell(row, col, "day", day, selected_style)
                 else:
-                    if all(
-                            [
-                                day == self.date_selected.day,
-                                self.date.month == self.date_selected.month,
-                                self.date.year == self.date_selected.year,
-                            ]
-                    ):
-                        day_style = f"{self.bootstyle}-toolbutton"
-                        # Put this day in the ttk "selected" state so the
-                        # toolbutton renders its ON look. Without this the day
-                        # sits in the (now quiet + muted) OFF state and reads as
-                        # a disabled button.
-                        self.datevar.set(day)
-                    else:
-                        day_style = f"{self.bootstyle}-calendar"
-
-                    def selected(x=row, y=col):
-                        self._on_date_selected(x, y)
-
-                    btn = ttk.Radiobutton(
-                        master=self.frm_dates,
-                        variable=self.datevar,
-                        value=day,
-                        text=day,
-                        takefocus=True,
-                        bootstyle=day_style,
-                        padding=4,
-                        command=selected,
-                    )
-                    btn.grid(row=row, column=col, sticky=NSEW)
+                    self._update_cell(row, col, "day", day, day_style)
+        self.datevar.set(selected_day)
+
+    def _update_cell(self, row: int, col: int, kind: Optional[str],
+                     text: Any = "", style: str = "") -> None:
+        """Show ``text`` in a grid cell, touching only what changed."""
+        state = (kind, text, style)
+        previous = self._cell_state[row][col]
+        if previous == state:
+            return
+        self._cell_state[row][col] = state
+        button = self._day_buttons[row][col]
+        label = self._day_labels[row][col]
+
+        if kind == "day":
+            if button is None:
+                button = self._day_buttons[row][col] = self._create_day_button(
+                    row, col, text, style)
+            else:
+                # The style is an already-resolved ttk style name, so configure
+                # the stock widget directly rather than re-running bootstyle
+                # resolution for every cell on every navigation.
+                _ttkWidget.configure(button, text=text, value=text, style=style)
+        elif kind == "outside":
+            if label is None:
+                label = self._day_labels[row][col] = ttk.Label(
+                    master=self.frm_dates,
+                    text=text,
+                    anchor=CENTER,
+                    padding=5,
+                    state=DISABLED,
+                )
+            else:
+                _ttkWidget.configure(label, text=text)
+
+        previous_kind = previous[0] if previous else None
+        if previous_kind == kind:
+            return
+        for widget, widget_kind in ((button, "day"), (label, "outside")):
+            if widget is None:
+                continue
+            if widget_kind == kind:
+                widget.grid(row=row, column=col, sticky=NSEW)
+            elif previous_kind == widget_kind:
+                widget.grid_remove()
+
+    def _create_day_button(self, row: int, col: int, day: int, style: str) -> ttk.Radiobutton:
+        """Create the Radiobutton for a day cell (done once per cell)."""
+
+        def selected(x=row, y=col):
+            self._on_date_selected(x, y)
+
+        return ttk.Radiobutton(
+            master=self.frm_dates,
+            variable=self.datevar,
+            value=day,
+            text=day,
+            takefocus=True,
+            style=style,
+            padding=4,
+            command=selected,
+        )
 
     def _draw_titlebar(self) -> None:
         """Draw the calendar title bar and navigation controls."""
@@ -451,15 +685,19 @@ class DatePickerDialog:
         self.title.bind("<Button-1>", self.on_reset_date)
 
         # create and pack days of the week header
-        for col in self._header_columns():
-            ttk.Label(
+        self._header_texts = tuple(self._header_columns())
+        self._header_labels: List[ttk.Label] = []
+        for col in self._header_texts:
+            label = ttk.Label(
                 master=self.frm_header,
                 text=col,
                 anchor=CENTER,
                 padding=4,
                 font="-size 8 -weight bold",
                 bootstyle="secondary"
-            ).pack(side=LEFT, fill=X, expand=YES)
+            )
+            label.pack(side=LEFT, fill=X, expand=YES)
+            self._header_labels.append(label)
 
     def _set_title(self) -> None:
         _titledate_month = MessageCatalog.translate(f'{self.date.strftime("%B")}')
@@ -469,8 +707,8 @@ class DatePickerDialog:
 
     def _current_month_days(self) -> None:
         """Fetch day numbers and dates for current month."""
-        self.monthdays = self.calendar.monthdayscalendar(year=self.date.year, month=self.date.month)
-        self.monthdates = self.calendar.monthdatescalendar(year=self.date.year, month=self.date.month)
+        self.monthdays, self.monthdates = _month_layout(
+            self.first_weekday, self.date.year, self.date.month)
 
     def _header_columns(self) -> List[str]:
         """Create weekday headers based on `first_weekday`."""
@@ -490,7 +728,7 @@ class DatePickerDialog:
         """Callback for selecting a date."""
         self.date_selected = self.monthdates[row][col]
         self._selection_made = True
-        self.root.destroy()
+        self._close()
         self._return_focus()
 
     def _selection_callback(func):
@@ -498,7 +736,6 @@ class DatePickerDialog:
 
         def inner(self, *args):
             func(self, *args)
-            self.frm_dates.destroy()
             self._draw_calendar()
 
         return inner
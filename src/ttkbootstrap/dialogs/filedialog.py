@@ -16,16 +16,25 @@ as, and choose a directory. Callers reach them through
 The directory-listing / filetype-filtering / hidden-file logic is pure Python
 (module-level functions), kept separate from the widgets so it is unit-testable
 without a display.
+
+Listing never blocks the dialog on a slow or huge directory: the scan runs on a
+worker thread, the dialog polls it with ``after`` and streams the rows into the
+tree in batches, and a navigation cancels a listing still in flight. Scans are
+cached per directory and reused while the directory's mtime is unchanged, and
+sizes/dates are read (``stat``) only for the rows scrolled into view.
 """
 
 import fnmatch
 import os
+import threading
 import tkinter
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import Any, List, Optional, Sequence, Tuple, Union
 
 import ttkbootstrap as ttk
+from ttkbootstrap.aio import wait_window
 from ttkbootstrap.constants import *
 from ttkbootstrap.localization import MessageCatalog
 from ttkbootstrap.style import Assets
@@ -53,6 +62,17 @@ _ICON_SIZE = 16
 # Glob patterns that mean "match everything", normalized to a single "*".
 _ALL_PATTERNS = frozenset(("*", "*.*", ""))
 
+# Listing pacing: how long _refresh waits for the worker before showing the
+# tree empty and streaming (a local directory usually finishes well within it,
+# so it appears at once without a flash), the poll interval while the worker
+# runs, and how many rows are inserted per event-loop turn.
+_SYNC_WAIT = 0.05
+_POLL_MS = 15
+_BATCH_ROWS = 500
+
+# How many directory scans the listing cache keeps.
+_CACHE_SIZE = 32
+
 
 # ---------------------------------------------------------------------------
 # Pure-Python backend (no Tk) — filetype parsing, filtering, listing.
@@ -138,56 +158,187 @@ class _Entry:
         self.mtime = mtime
 
 
-def _list_directory(
-    dirpath: str,
+# A raw scan row: (name, path, is_dir, hidden). Filtering and stat happen later.
+_ScanRow = Tuple[str, str, bool, bool]
+
+
+def _scan_directory(
+    dirpath: str, cancelled: Optional[threading.Event] = None,
+) -> Optional[Tuple[_ScanRow, ...]]:
+    """Read the names in ``dirpath`` without stat-ing them.
+
+    Safe to call from a worker thread. Returns ``None`` if ``cancelled`` is set
+    part-way through; an unreadable ``dirpath`` yields ``()``, and unreadable
+    entries are skipped.
+    """
+    rows: List[_ScanRow] = []
+    try:
+        with os.scandir(dirpath) as it:
+            for e in it:
+                if cancelled is not None and cancelled.is_set():
+                    return None
+                try:
+                    is_dir = e.is_dir()
+                except OSError:
+                    continue
+                rows.append((e.name, e.path, is_dir, _is_hidden(e.name, e.path)))
+    except OSError:
+        return ()
+    return tuple(rows)
+
+
+class _ListingCache:
+    """Directory scans keyed by path, valid while the directory's mtime holds.
+
+    Adding, removing, or renaming an entry bumps the directory's mtime, so a
+    matching mtime means the cached names are still current. Shared by every
+    dialog and touched from worker threads, hence the lock; the least recently
+    used scans are dropped past ``maxsize``.
+    """
+
+    def __init__(self, maxsize: int = _CACHE_SIZE) -> None:
+        self._maxsize = maxsize
+        self._scans: "OrderedDict[str, Tuple[int, Tuple[_ScanRow, ...]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, dirpath: str, mtime: int) -> Optional[Tuple[_ScanRow, ...]]:
+        with self._lock:
+            cached = self._scans.get(dirpath)
+            if cached is None or cached[0] != mtime:
+                return None
+            self._scans.move_to_end(dirpath)
+            return cached[1]
+
+    def put(self, dirpath: str, mtime: int, scan: Tuple[_ScanRow, ...]) -> None:
+        with self._lock:
+            self._scans[dirpath] = (mtime, scan)
+            self._scans.move_to_end(dirpath)
+            while len(self._scans) > self._maxsize:
+                self._scans.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._scans.clear()
+
+
+_listing_cache = _ListingCache()
+
+
+def _cached_scan(
+    dirpath: str, cancelled: Optional[threading.Event] = None,
+) -> Optional[Tuple[_ScanRow, ...]]:
+    """:func:`_scan_directory` through the mtime-validated listing cache."""
+    try:
+        mtime = os.stat(dirpath).st_mtime_ns
+    except OSError:
+        return ()
+    scan = _listing_cache.get(dirpath, mtime)
+    if scan is None:
+        scan = _scan_directory(dirpath, cancelled)
+        if scan is not None:
+            _listing_cache.put(dirpath, mtime, scan)
+    return scan
+
+
+def _filter_scan(
+    scan: Sequence[_ScanRow],
     globs: Sequence[str],
     *,
     show_hidden: bool,
     dirs_only: bool = False,
 ) -> Tuple[List[_Entry], List[_Entry]]:
-    """Return ``(dirs, files)`` for ``dirpath``, each name-sorted.
+    """Split a scan into name-sorted ``(dirs, files)`` rows, not yet stat-ed.
 
     ``globs`` filters files only — directories are always listed so the user can
     navigate. Hidden entries are dropped unless ``show_hidden``. In
     ``dirs_only`` mode (directory chooser) files are skipped entirely.
-    Unreadable entries are skipped; an unreadable ``dirpath`` yields ``([], [])``.
     """
     dirs: List[_Entry] = []
     files: List[_Entry] = []
-    try:
-        with os.scandir(dirpath) as it:
-            for e in it:
-                try:
-                    is_dir = e.is_dir()
-                except OSError:
-                    continue
-                if not show_hidden and _is_hidden(e.name, e.path):
-                    continue
-                if is_dir:
-                    dirs.append(_Entry(e.name, e.path, True, None, _safe_mtime(e)))
-                elif not dirs_only and _matches(e.name, globs):
-                    size, mtime = _safe_stat(e)
-                    files.append(_Entry(e.name, e.path, False, size, mtime))
-    except OSError:
-        return [], []
+    for name, path, is_dir, hidden in scan:
+        if hidden and not show_hidden:
+            continue
+        if is_dir:
+            dirs.append(_Entry(name, path, True, None, None))
+        elif not dirs_only and _matches(name, globs):
+            files.append(_Entry(name, path, False, None, None))
     dirs.sort(key=lambda x: x.name.lower())
     files.sort(key=lambda x: x.name.lower())
     return dirs, files
 
 
-def _safe_stat(entry: "os.DirEntry") -> Tuple[Optional[int], Optional[float]]:
+def _stat_entry(entry: _Entry) -> None:
+    """Fill in ``entry``'s size (files only) and mtime; unreadable stays blank."""
     try:
-        st = entry.stat()
-        return st.st_size, st.st_mtime
+        st = os.stat(entry.path)
     except OSError:
-        return None, None
+        return
+    entry.mtime = st.st_mtime
+    if not entry.is_dir:
+        entry.size = st.st_size
 
 
-def _safe_mtime(entry: "os.DirEntry") -> Optional[float]:
-    try:
-        return entry.stat().st_mtime
-    except OSError:
-        return None
+def _list_directory(
+    dirpath: str,
+    globs: Sequence[str],
+    *,
+    show_hidden: bool,
+    dirs_only: bool = False,
+) -> Tuple[List[_Entry], List[_Entry]]:
+    """Return ``(dirs, files)`` for ``dirpath``, each name-sorted and stat-ed.
+
+    The synchronous, uncached form of what the dialog does incrementally; see
+    :func:`_filter_scan` for the filtering rules. Unreadable entries are
+    skipped; an unreadable ``dirpath`` yields ``([], [])``.
+    """
+    dirs, files = _filter_scan(
+        _scan_directory(dirpath), globs,
+        show_hidden=show_hidden, dirs_only=dirs_only)
+    for entry in dirs + files:
+        _stat_entry(entry)
+    return dirs, files
+
+
+class _ListingJob:
+    """One directory listing running on a worker thread.
+
+    The worker only scans and filters; it never touches Tk. The dialog polls
+    :attr:`done` from the UI thread and inserts :attr:`entries` itself, keeping
+    its own place in them in :attr:`position`.
+    """
+
+    def __init__(self, dirpath: str, globs: Sequence[str], *,
+                 show_hidden: bool, dirs_only: bool) -> None:
+        self.dirpath = dirpath
+        self.cancelled = threading.Event()
+        self.done = threading.Event()
+        self.entries: List[_Entry] = []
+        self.position = 0
+        self._globs = tuple(globs)
+        self._show_hidden = show_hidden
+        self._dirs_only = dirs_only
+        self._thread = threading.Thread(
+            target=self._run, name="ttkbootstrap-filedialog-listing", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def cancel(self) -> None:
+        self.cancelled.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self.done.wait(timeout)
+
+    def _run(self) -> None:
+        try:
+            scan = _cached_scan(self.dirpath, self.cancelled)
+            if scan is not None and not self.cancelled.is_set():
+                dirs, files = _filter_scan(
+                    scan, self._globs,
+                    show_hidden=self._show_hidden, dirs_only=self._dirs_only)
+                self.entries = dirs + files
+        finally:
+            self.done.set()
 
 
 def _ancestors(path: str) -> List[str]:
@@ -275,6 +426,15 @@ class FileDialog:
         # Built in _build(); the current filetype's globs default to all-files.
         self._current_globs: Tuple[str, ...] = ("*",)
         self._rows: dict = {}
+        # Listing state: the job being streamed in, the row iids in display
+        # order, the rows not yet stat-ed, and the rows showing the selected
+        # icon variant.
+        self._listing: Optional[_ListingJob] = None
+        self._pump_after: Optional[str] = None
+        self._stat_after: Optional[str] = None
+        self._order: List[str] = []
+        self._unstated: set = set()
+        self._icon_selected: set = set()
         self._toplevel: Optional[tkinter.Toplevel] = None
         # the size _build applies; positioning measures this, not the content
         self._footprint: Optional[Tuple[int, int]] = None
@@ -285,21 +445,39 @@ class FileDialog:
         self, position: Optional[Tuple[int, int]] = None
     ) -> Union[str, Tuple[str, ...], None]:
         """Build, show modally, and return the result (also on :attr:`result`)."""
-        self._build()
-        self._navigate(self._cwd)
-        self._locate(position)
-        self._toplevel.deiconify()
-        self._name_entry.focus_set()
-        self._toplevel.grab_set()
+        self._present(position)
         self._toplevel.wait_window()
         return self._result
 
+    async def ashow(
+        self, position: Optional[Tuple[int, int]] = None
+    ) -> Union[str, Tuple[str, ...], None]:
+        """Awaitable `show`, for applications run with ``App.run_async``.
+
+        Cancelling the await closes the dialog without a result.
+        """
+        self._present(position)
+        try:
+            await wait_window(self._toplevel)
+        except BaseException:
+            self._cancel()
+            raise
+        return self._result
+
     @property
     def result(self) -> Union[str, Tuple[str, ...], None]:
         return self._result
 
     # -- construction ------------------------------------------------------
 
+    def _present(self, position: Optional[Tuple[int, int]]) -> None:
+        self._build()
+        self._navigate(self._cwd)
+        self._locate(position)
+        self._toplevel.deiconify()
+        self._name_entry.focus_set()
+        self._toplevel.grab_set()
+
     def _build(self) -> None:
         # A parentless call still needs an interpreter to read the windowing
         # system from -- Querybox's native-vs-themed routing falls back to the
@@ -395,8 +573,8 @@ class FileDialog:
         # Framework code writes via the internal _build_configure, not the public
         # Style.configure -- rowheight is a durable option, and the public path
         # would capture this as a fake user override (replayed on theme switch).
-        style._build_configure(
-            _ROW_STYLE, rowheight=max(icon_h, linespace) + round(0.7 * linespace))
+        self._row_height = max(icon_h, linespace) + round(0.7 * linespace)
+        style._build_configure(_ROW_STYLE, rowheight=self._row_height)
         tree.configure(style=_ROW_STYLE)
         tree.heading("#0", text=MessageCatalog.translate("Name"), anchor=W)
         tree.heading("size", text=MessageCatalog.translate("Size"), anchor=W)
@@ -405,7 +583,9 @@ class FileDialog:
         tree.column("size", width=90, stretch=False, anchor=E)
         tree.column("modified", width=140, stretch=False)
         vsb = ttk.Scrollbar(frame, orient=VERTICAL, command=tree.yview)
-        tree.configure(yscrollcommand=vsb.set)
+        # Routed through the dialog so scrolling also stats newly visible rows.
+        tree.configure(yscrollcommand=self._on_tree_yscroll)
+        self._vsb = vsb
         vsb.pack(side=RIGHT, fill=Y)
         tree.pack(side=LEFT, fill=BOTH, expand=YES)
         tree.bind("<<TreeviewSelect>>", self._on_select)
@@ -480,25 +660,98 @@ class FileDialog:
                 label=anc, command=lambda p=anc: self._navigate(p))
 
     def _refresh(self) -> None:
+        """Relist the current directory, cancelling any listing in flight."""
+        self._cancel_listing()
         tree = self._tree
         tree.delete(*tree.get_children())
         self._rows = {}
-        dirs, files = _list_directory(
+        self._order = []
+        self._unstated = set()
+        self._icon_selected = set()
+        job = _ListingJob(
             self._cwd,
             self._current_globs,
             show_hidden=self._hidden_var.get(),
             dirs_only=self._mode == DIRECTORY,
         )
-        for e in dirs:
-            iid = tree.insert(
-                "", END, text=f" {e.name}", image=self._folder_img,
-                values=("", _format_mtime(e.mtime)))
-            self._rows[iid] = e
-        for e in files:
+        self._listing = job
+        job.start()
+        job.wait(_SYNC_WAIT)
+        self._pump_listing()
+
+    def _pump_listing(self) -> None:
+        """Insert the next batch of the current listing, or poll until it's ready."""
+        self._pump_after = None
+        job = self._listing
+        tree = self._tree
+        if job is None or job.cancelled.is_set():
+            return
+        if not tree.winfo_exists():
+            self._cancel_listing()
+            return
+        if not job.done.is_set():
+            self._pump_after = tree.after(_POLL_MS, self._pump_listing)
+            return
+        end = min(len(job.entries), job.position + _BATCH_ROWS)
+        for e in job.entries[job.position:end]:
+            # Size and date are filled in by _stat_visible once the row is seen.
             iid = tree.insert(
-                "", END, text=f" {e.name}", image=self._file_img,
-                values=(_format_size(e.size), _format_mtime(e.mtime)))
+                "", END, text=f" {e.name}",
+                image=self._folder_img if e.is_dir else self._file_img,
+                values=("", ""))
             self._rows[iid] = e
+            self._order.append(iid)
+            self._unstated.add(iid)
+        job.position = end
+        if end < len(job.entries):
+            # yield to the event loop between batches so the dialog stays live
+            self._pump_after = tree.after(1, self._pump_listing)
+        else:
+            self._listing = None
+        self._schedule_stat()
+
+    def _cancel_listing(self) -> None:
+        if self._listing is not None:
+            self._listing.cancel()
+            self._listing = None
+        if self._pump_after is not None:
+            try:
+                self._tree.after_cancel(self._pump_after)
+            except tkinter.TclError:
+                pass
+            self._pump_after = None
+
+    def _on_tree_yscroll(self, first: str, last: str) -> None:
+        self._vsb.set(first, last)
+        self._schedule_stat()
+
+    def _schedule_stat(self) -> None:
+        if self._stat_after is None and self._unstated:
+            self._stat_after = self._tree.after_idle(self._stat_visible)
+
+    def _stat_visible(self) -> None:
+        """Read size/date for the rows in view that haven't been stat-ed yet.
+
+        The visible slice comes from the tree's scroll fraction and a page of
+        rows (the viewport height, or the tree's ``height`` before it is
+        mapped), so no per-row Tcl query is needed to find it.
+        """
+        self._stat_after = None
+        tree = self._tree
+        if not self._unstated or not tree.winfo_exists():
+            return
+        first = float(tree.yview()[0])
+        page = max(int(tree.cget("height")), tree.winfo_height() // self._row_height)
+        lo = int(first * len(self._order))
+        for iid in self._order[lo:lo + page + 1]:
+            if iid not in self._unstated:
+                continue
+            self._unstated.discard(iid)
+            entry = self._rows[iid]
+            _stat_entry(entry)
+            tree.item(iid, values=(
+                "" if entry.is_dir else _format_size(entry.size),
+                _format_mtime(entry.mtime)))
 
     def _set_filetype(self, globs: Tuple[str, ...], display: str) -> None:
         self._current_globs = globs
@@ -516,15 +769,20 @@ class FileDialog:
 
         A static icon color can vanish into the neutral selection background, so
         selected rows use the `selectfg`-colored variant (which always contrasts
-        the selection) and the rest keep the field-background variant.
+        the selection) and the rest keep the field-background variant. Only the
+        rows whose selection state changed are touched.
         """
         selected = set(self._tree.selection())
-        for iid, entry in self._rows.items():
+        for iid in selected.symmetric_difference(self._icon_selected):
+            entry = self._rows.get(iid)
+            if entry is None:
+                continue
             if iid in selected:
                 img = self._folder_img_sel if entry.is_dir else self._file_img_sel
             else:
                 img = self._folder_img if entry.is_dir else self._file_img
             self._tree.item(iid, image=img)
+        self._icon_selected = selected
 
     def _on_select(self, event: Any = None) -> None:
         self._update_row_icons()
@@ -627,6 +885,7 @@ class FileDialog:
         tl = self._toplevel
         if tl is None:
             return
+        self._cancel_listing()
         try:
             if tl.winfo_exists():
                 tl.grab_release()
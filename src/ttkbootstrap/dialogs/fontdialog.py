@@ -1,14 +1,233 @@
 """FontDialog implementation for selecting and previewing fonts."""
 
+import bisect
+import time
 import tkinter
 from tkinter import font
-from typing import Any, Optional
+from typing import Any, Callable, Optional, Sequence
 
 import ttkbootstrap as ttk
 from ttkbootstrap import utils
 from ttkbootstrap.constants import *
+from ttkbootstrap.internal import wheel
+from ttkbootstrap.internal.render_queue import RenderQueue
 from ttkbootstrap.localization import MessageCatalog
 from ttkbootstrap.dialogs.base import Dialog
+from ttkbootstrap.utils.fonts import Fonts
+
+# Keystrokes further apart than this (in seconds) start a new type-ahead search.
+_TYPEAHEAD_TIMEOUT = 1.0
+
+# The listable families, derived from the last `Fonts.families()` tuple seen;
+# reused while that tuple is, so opening the dialog does no per-family work.
+_listed_source: Optional[tuple] = None
+_listed: "tuple[list[str], list[str]]" = ([], [])
+
+
+def _listed_families() -> "tuple[list[str], list[str]]":
+    """The families the dialog lists, in case-insensitive order, and their
+    casefolded names (the type-ahead index)."""
+    global _listed_source, _listed
+    source = Fonts.families()
+    if source is not _listed_source:
+        names = sorted(
+            (f for f in source
+             if f and not f.startswith("@") and "emoji" not in f.lower()),
+            key=str.casefold,
+        )
+        _listed = (names, [f.casefold() for f in names])
+        _listed_source = source
+    return _listed
+
+
+class _FamilyList:
+    """A virtual list of font families on top of a `Treeview`.
+
+    Only the rows in view exist as tree items; scrolling relabels them. The
+    cost of opening the dialog and of rendering the per-family preview fonts
+    is therefore bounded by the list's height, not by how many families are
+    installed. Typing selects the first family starting with the typed text.
+    """
+
+    def __init__(
+            self, tree: ttk.Treeview, scrollbar: ttk.Scrollbar,
+            families: Sequence[str], keys: Sequence[str], size: int,
+            command: Callable[[str], Any]) -> None:
+        self._tree = tree
+        self._scrollbar = scrollbar
+        self._families = families
+        self._keys = keys
+        self._size = size
+        self._command = command
+        self._top = 0
+        self._rows = 0
+        self._index: Optional[int] = None
+        self._typed = ""
+        self._typed_at = 0.0
+        self._pixels = wheel.PixelAccumulator()
+
+        scrollbar.configure(command=self.yview)
+        tree.bind("<Configure>", self._on_configure)
+        tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        tree.bind("<Key>", self._on_key)
+        for sequence, step in (("<Up>", -1), ("<Down>", 1)):
+            tree.bind(sequence, lambda _, step=step: self._step(step))
+        tree.bind("<Prior>", lambda _: self._step(-max(self._rows - 1, 1)))
+        tree.bind("<Next>", lambda _: self._step(max(self._rows - 1, 1)))
+        tree.bind("<Home>", lambda _: self._step(-len(self._families)))
+        tree.bind("<End>", lambda _: self._step(len(self._families)))
+        for sequence in wheel.wheel_sequences(tree):
+            tree.bind(sequence, self._on_wheel)
+        if wheel.has_touchpad_scroll():
+            tree.bind(wheel.TOUCHPAD_SCROLL, self._on_touchpad)
+        self._set_rows(int(tree.cget("height")))
+
+    # -- model ---------------------------------------------------------------- #
+    @property
+    def selection(self) -> Optional[str]:
+        """The selected family, or None."""
+        if self._index is None:
+            return None
+        return self._families[self._index]
+
+    def select(self, family: str) -> None:
+        """Select `family` and scroll it into view (the command is not called)."""
+        index = bisect.bisect_left(self._keys, family.casefold())
+        for i in range(index, len(self._keys)):
+            if self._families[i] == family:
+                self._index = i
+                break
+            if self._keys[i] != family.casefold():
+                break
+        self._see(self._index)
+
+    def select_prefix(self, prefix: str) -> bool:
+        """Select the first family starting with `prefix` (case-insensitive)."""
+        key = prefix.casefold()
+        index = bisect.bisect_left(self._keys, key)
+        if index == len(self._keys) or not self._keys[index].startswith(key):
+            return False
+        self._choose(index)
+        return True
+
+    def _choose(self, index: int) -> None:
+        index = min(max(index, 0), len(self._families) - 1)
+        if index < 0:
+            return
+        changed = index != self._index
+        self._index = index
+        self._see(index)
+        if changed:
+            self._command(self._families[index])
+
+    # -- view ----------------------------------------------------------------- #
+    def yview(self, *args: Any) -> None:
+        """Scrollbar protocol: ``moveto fraction`` or ``scroll n units|pages``."""
+        count = len(self._families)
+        if args[0] == "moveto":
+            top = round(float(args[1]) * count)
+        else:
+            amount = int(args[1])
+            if args[2] == "pages":
+                amount *= max(self._rows - 1, 1)
+            top = self._top + amount
+        self._scroll_to(top)
+
+    def _see(self, index: Optional[int]) -> None:
+        top = self._top
+        if index is not None:
+            if index < top:
+                top = index
+            elif index >= top + self._rows:
+                top = index - self._rows + 1
+        self._scroll_to(top, force=True)
+
+    def _scroll_to(self, top: int, force: bool = False) -> None:
+        top = max(0, min(top, len(self._families) - self._rows))
+        if top != self._top or force:
+            self._top = top
+            self._render()
+
+    def _set_rows(self, rows: int) -> None:
+        rows = max(rows, 1)
+        if rows == self._rows:
+            return
+        tree = self._tree
+        for row in range(self._rows, rows):
+            tree.insert("", END, iid=str(row), values=[""])
+        for row in range(rows, self._rows):
+            tree.delete(str(row))
+        self._rows = rows
+        self._see(self._index)
+
+    def _render(self) -> None:
+        tree = self._tree
+        size = self._size
+        for row in range(self._rows):
+            index = self._top + row
+            if index < len(self._families):
+                family = self._families[index]
+                tag = f"row{row}"
+                tree.tag_configure(tag, font=(family, size))
+                tree.item(str(row), values=[family], tags=[tag])
+            else:
+                tree.item(str(row), values=[""], tags=[])
+        selected = self._index
+        if selected is not None and self._top <= selected < self._top + self._rows:
+            tree.selection_set(str(selected - self._top))
+        else:
+            tree.selection_set(())
+        count = len(self._families) or 1
+        self._scrollbar.set(self._top / count, min((self._top + self._rows) / count, 1.0))
+
+    def _row_height(self) -> int:
+        style = self._tree.cget("style") or "Treeview"
+        try:
+            return int(float(ttk.Style.get_instance().lookup(style, "rowheight")))
+        except (TypeError, ValueError, tkinter.TclError):
+            return utils.scale_size(self._tree, 20)
+
+    # -- events --------------------------------------------------------------- #
+    def _on_configure(self, event: tkinter.Event) -> None:
+        self._set_rows(event.height // max(self._row_height(), 1))
+
+    def _on_tree_select(self, _: tkinter.Event) -> None:
+        # Clicks select a tree row; map it back to the family it shows. The
+        # selection the list sets itself maps back to the current family.
+        selection = self._tree.selection()
+        if selection and self._top + int(selection[0]) != self._index:
+            self._choose(self._top + int(selection[0]))
+
+    def _step(self, amount: int) -> str:
+        start = self._top if self._index is None else self._index
+        self._choose(start + amount)
+        return "break"
+
+    def _on_key(self, event: tkinter.Event) -> Optional[str]:
+        char = event.char
+        if not char or not char.isprintable():
+            return None
+        now = time.monotonic()
+        if now - self._typed_at > _TYPEAHEAD_TIMEOUT:
+            self._typed = ""
+        self._typed_at = now
+        self._typed += char
+        if not self.select_prefix(self._typed):
+            # nothing continues the typed text: start over from this key
+            self._typed = char
+            self.select_prefix(char)
+        return "break"
+
+    def _on_wheel(self, event: tkinter.Event) -> str:
+        self._scroll_to(self._top - round(wheel.wheel_notches(self._tree, event)) * 3)
+        return "break"
+
+    def _on_touchpad(self, event: tkinter.Event) -> str:
+        _, dy = wheel.precise_deltas(event)
+        _, rows = self._pixels.add(0, dy, 1, self._row_height())
+        if rows:
+            self._scroll_to(self._top - rows)
+        return "break"
 
 
 class FontDialog(Dialog):
@@ -21,6 +240,13 @@ class FontDialog(Dialog):
     The font object is returned when the OK button is pressed and
     can be passed to any widget that accepts a `font` configuration
     option.
+
+    The installed families are enumerated once per application (see
+    `Fonts.families`; call `Fonts.refresh_families` to pick up fonts
+    installed while the app runs) and the family list only creates the
+    rows in view, so the dialog opens equally fast however many fonts are
+    installed.
+    Type the start of a family name to jump to it.
     """
 
     def __init__(
@@ -64,19 +290,24 @@ class FontDialog(Dialog):
         self._overstrike = ttk.Variable(value=self._actual["overstrike"])
         self._underline = ttk.Variable(value=self._actual["underline"])
         self._preview_font = font.Font()
-        self._slant.trace_add("write", self._update_font_preview)
-        self._weight.trace_add("write", self._update_font_preview)
-        self._overstrike.trace_add("write", self._update_font_preview)
-        self._underline.trace_add("write", self._update_font_preview)
+        self._slant.trace_add("write", self._schedule_preview)
+        self._weight.trace_add("write", self._schedule_preview)
+        self._overstrike.trace_add("write", self._schedule_preview)
+        self._underline.trace_add("write", self._schedule_preview)
 
         _headingfont = font.nametofont("TkHeadingFont")
         _headingfont.configure(weight="bold")
 
         self._update_font_preview()
-        self._families = set([self._family.get()])
-        for f in font.families():
-            if all([f, not f.startswith("@"), "emoji" not in f.lower()]):
-                self._families.add(f)
+        # The installed families are enumerated once per application (see
+        # `Fonts.families`); opening the dialog again reuses them.
+        self._families, self._family_keys = _listed_families()
+        family = self._family.get()
+        if family not in self._families:
+            index = bisect.bisect_left(self._family_keys, family.casefold())
+            self._families = [*self._families[:index], family, *self._families[index:]]
+            self._family_keys = [*self._family_keys[:index], family.casefold(),
+                                 *self._family_keys[index:]]
 
     def create_body(self, master: tkinter.Misc) -> None:
         width = utils.scale_size(master, 600)
@@ -151,14 +382,10 @@ class FontDialog(Dialog):
         listbox.pack(side=LEFT, fill=BOTH, expand=YES)
         listbox.configure(yscrollcommand=listbox_vbar.set)
 
-        for f in sorted(self._families):
-            listbox.insert("", iid=f, index=END, tags=[f], values=[f])
-            listbox.tag_configure(f, font=(f, self._size.get()))
-
-        iid = self._family.get()
-        listbox.selection_set(iid)  # select default value
-        listbox.see(iid)  # ensure default is visible
-        listbox.bind("<<TreeviewSelect>>", lambda e: self._on_select_font_family(e))
+        self._family_list = _FamilyList(
+            listbox, listbox_vbar, self._families, self._family_keys,
+            self._size.get(), self._on_select_font_family)
+        self._family_list.select(self._family.get())  # select default value
         return listbox
 
     def _font_size_selector(self, master: tkinter.Misc) -> None:
@@ -273,26 +500,31 @@ class FontDialog(Dialog):
         self._preview_text.pack(fill=BOTH, expand=YES)
         container.pack_propagate(False)
 
-    def _on_select_font_family(self, e: tkinter.Event) -> None:
-        tree: ttk.Treeview = self._toplevel.nametowidget(e.widget)
-        fontfamily = tree.selection()[0]
-        self._family.set(value=fontfamily)
-        self._update_font_preview()
+    def _on_select_font_family(self, family: str) -> None:
+        self._family.set(value=family)
+        self._schedule_preview()
 
     def _on_select_font_size(self, e: tkinter.Event) -> None:
         tree: ttk.Treeview = self._toplevel.nametowidget(e.widget)
         fontsize = tree.selection()[0]
         self._size.set(value=fontsize)
-        self._update_font_preview()
+        self._schedule_preview()
 
     def _on_submit(self) -> font.Font:
+        RenderQueue.for_widget(self).flush((self._w, "preview"))
         self._toplevel.destroy()
         return self.result
 
     def _on_cancel(self) -> None:
+        RenderQueue.for_widget(self).discard((self._w, "preview"))
         self._result = None
         self._toplevel.destroy()
 
+    def _schedule_preview(self, *_: Any) -> None:
+        # Selections and option changes arrive in bursts (holding an arrow key
+        # in the family list); the preview font is rebuilt once per idle pass.
+        RenderQueue.for_widget(self).invalidate((self._w, "preview"), self._update_font_preview)
+
     def _update_font_preview(self, *_: Any) -> None:
         family = self._family.get()
         size = self._size.get()
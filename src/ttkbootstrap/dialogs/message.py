@@ -3,13 +3,13 @@
 import textwrap
 import tkinter
 import warnings
-from typing import Any, Callable, List, Optional, Tuple, Union
+from typing import Any, Callable, Hashable, List, Optional, Tuple, Union
 
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 from ttkbootstrap.localization import MessageCatalog
 from ttkbootstrap.style._compat import warn_deprecated
-from .base import Dialog
+from .base import Dialog, DialogPool
 
 
 # The glyph size used by every dialog icon -- the four default alert glyphs below
@@ -151,14 +151,32 @@ class MessageDialog(Dialog):
                 # centers the icon against the block.
                 icon_lbl.pack(side=LEFT, anchor=CENTER, padx=(0, 5))
 
+        self._msg_labels: List[ttk.Label] = []
+        self._shown_message = self._message
         if self._message:
-            msg_frame = ttk.Frame(container)
-            for msg in self._message.split("\n"):
-                message = "\n".join(textwrap.wrap(msg, width=self._width))
-                ttk.Label(msg_frame, text=message).pack(pady=(0, 3), fill=X, anchor=N)
-            msg_frame.pack(side=LEFT, fill=X, expand=True, anchor=CENTER)
+            self._msg_frame = ttk.Frame(container)
+            self._set_message_lines()
+            self._msg_frame.pack(side=LEFT, fill=X, expand=True, anchor=CENTER)
         container.pack(fill=X, expand=True)
 
+    def _set_message_lines(self) -> None:
+        """Show `self._message`, one wrapped label per line, reusing labels."""
+        lines = [
+            "\n".join(textwrap.wrap(msg, width=self._width))
+            for msg in self._message.split("\n")
+        ]
+        labels = self._msg_labels
+        for label, text in zip(labels, lines):
+            label.configure(text=text)
+        for text in lines[len(labels):]:
+            label = ttk.Label(self._msg_frame, text=text)
+            label.pack(pady=(0, 3), fill=X, anchor=N)
+            labels.append(label)
+        for label in labels[len(lines):]:
+            label.destroy()
+        del labels[len(lines):]
+        self._shown_message = self._message
+
     def _create_icon_label(self, container: tkinter.Misc) -> "Optional[ttk.Label]":
         """Build the icon Label from ``self._icon``, or None if it is unusable.
 
@@ -261,13 +279,111 @@ class MessageDialog(Dialog):
         command = self._command
         if command is not None:
             command()
-        self._toplevel.after_idle(self._toplevel.destroy)
+        self._toplevel.after_idle(self._finish)
+
+    def _template_key(self) -> Optional[Hashable]:
+        icon = self._icon
+        return (
+            "message",
+            str(self.master),
+            tuple(self._buttons),
+            self._default,
+            self._localize,
+            None if icon is None else str(icon),
+            repr(self._padding),
+            bool(self._message),
+        )
+
+    def _take_settings(self, other: Dialog) -> None:
+        super()._take_settings(other)
+        self._message = other._message
+        self._command = other._command
+        self._width = other._width
+
+    def _reuse(self) -> bool:
+        super()._reuse()
+        if self._message == self._shown_message:
+            return False
+        self._set_message_lines()
+        return True
 
     def show(self, position: Optional[Tuple[int, int]] = None, wait_for_result: bool = True) -> None:
         """Create and display the popup messagebox."""
         super().show(position, wait_for_result=wait_for_result)
 
 
+# The defaults of each `Messagebox` method (and its awaitable twin): the
+# buttons, the alert glyph (see ``_ALERT_ICONS``), and whether it rings the
+# bell -- the `alert` default both signatures carry. ``None`` buttons leave
+# `MessageDialog`'s own OK/Cancel pair.
+_MESSAGEBOX_DEFAULTS = {
+    "show_info": (["OK:primary"], "info", False),
+    "show_warning": (["OK:primary"], "warning", True),
+    "show_error": (["OK:primary"], "error", True),
+    "show_question": (["OK:primary"], "question", False),
+    "ok": (["OK:primary"], None, False),
+    "okcancel": (None, None, False),
+    "yesno": (["No", "Yes"], None, False),
+    "yesnocancel": (["Cancel", "No", "Yes"], None, False),
+    "retrycancel": (["Cancel", "Retry"], None, False),
+}
+
+
+def _messagebox_kwargs(
+        method: str,
+        *,
+        buttons: Optional[List[str]] = None,
+        icon: "Optional[Union[str, tkinter.PhotoImage]]" = None,
+        **kwargs: Any,
+) -> "dict[str, Any]":
+    """The `MessageDialog` arguments for a `Messagebox` method call.
+
+    Fills in the method's default ``buttons`` and ``icon`` (see
+    ``_MESSAGEBOX_DEFAULTS``) when the caller left them unset.
+    """
+    default_buttons, alert_icon, _ = _MESSAGEBOX_DEFAULTS[method]
+    if not buttons and default_buttons is not None:
+        buttons = list(default_buttons)
+    if not icon and alert_icon is not None:
+        icon = _alert_icon(alert_icon)
+    return dict(kwargs, buttons=buttons, icon=icon)
+
+
+def _awaitable_messagebox(method: str) -> Callable[..., Any]:
+    """Build the awaitable twin (``a`` + `method`) of a `Messagebox` method."""
+    default_alert = _MESSAGEBOX_DEFAULTS[method][2]
+
+    async def twin(
+            message: str,
+            title: str = " ",
+            *,
+            parent: Optional[tkinter.Misc] = None,
+            alert: bool = default_alert,
+            position: Optional[Tuple[int, int]] = None,
+            buttons: Optional[List[str]] = None,
+            icon: "Optional[Union[str, tkinter.PhotoImage]]" = None,
+            localize: bool = True,
+            **kwargs: Any,
+    ) -> Optional[str]:
+        dialog = MessageDialog(**_messagebox_kwargs(
+            method, message=message, title=title, parent=parent, alert=alert,
+            buttons=buttons, icon=icon, localize=localize, **kwargs))
+        return await dialog.ashow(position)
+
+    twin.__name__ = f"a{method}"
+    twin.__qualname__ = f"Messagebox.a{method}"
+    twin.__doc__ = f"Awaitable `{method}`: resolves to the label of the button pressed."
+    return twin
+
+
+def _message_dialog(**kwargs: Any) -> MessageDialog:
+    """The dialog for a `Messagebox` call: a kept one when `DialogPool` is on."""
+    dialog = MessageDialog(**kwargs)
+    if DialogPool.is_enabled():
+        return DialogPool.for_widget(dialog).adopt(dialog)
+    return dialog
+
+
 class Messagebox:
     """Static methods that pop up a message with various button arrangements
     and alert options, and return the label of the button the user pressed
@@ -279,6 +395,12 @@ class Messagebox:
     ``icon`` is a Bootstrap Icons glyph name (e.g. ``"question-circle-fill"``),
     and replaces the default glyph on the ``show_*`` methods. See
     `MessageDialog` for the other image forms it accepts.
+
+    Each method has an awaitable twin prefixed with ``a`` (``ashow_info``,
+    ``ayesno``, ...) for applications run with ``App.run_async``.
+
+    With `DialogPool` enabled, the (non-awaitable) methods reuse a kept
+    dialog with the same buttons and icon instead of building a new one.
     """
 
     @staticmethod
@@ -295,16 +417,9 @@ class Messagebox:
             **kwargs: Any,
     ) -> Optional[str]:
         """Display a modal dialog box with an OK button and an INFO icon."""
-        dialog = MessageDialog(
-            message=message,
-            title=title,
-            parent=parent,
-            alert=alert,
-            buttons=buttons or ["OK:primary"],
-            icon=icon or _alert_icon("info"),
-            localize=localize,
-            **kwargs,
-        )
+        dialog = _message_dialog(**_messagebox_kwargs(
+            "show_info", message=message, title=title, parent=parent, alert=alert,
+            buttons=buttons, icon=icon, localize=localize, **kwargs))
         dialog.show(position)
         return dialog.result
 
@@ -322,16 +437,9 @@ class Messagebox:
             **kwargs: Any,
     ) -> Optional[str]:
         """Display a modal dialog box with an OK button and a warning icon."""
-        dialog = MessageDialog(
-            message=message,
-            title=title,
-            parent=parent,
-            alert=alert,
-            buttons=buttons or ["OK:primary"],
-            icon=icon or _alert_icon("warning"),
-            localize=localize,
-            **kwargs,
-        )
+        dialog = _message_dialog(**_messagebox_kwargs(
+            "show_warning", message=message, title=title, parent=parent, alert=alert,
+            buttons=buttons, icon=icon, localize=localize, **kwargs))
         dialog.show(position)
         return dialog.result
 
@@ -349,16 +457,9 @@ class Messagebox:
             **kwargs: Any,
     ) -> Optional[str]:
         """Display a modal dialog box with an OK button and an error icon."""
-        dialog = MessageDialog(
-            message=message,
-            title=title,
-            parent=parent,
-            alert=alert,
-            buttons=buttons or ["OK:primary"],
-            icon=icon or _alert_icon("error"),
-            localize=localize,
-            **kwargs,
-        )
+        dialog = _message_dialog(**_messagebox_kwargs(
+            "show_error", message=message, title=title, parent=parent, alert=alert,
+            buttons=buttons, icon=icon, localize=localize, **kwargs))
         dialog.show(position)
         return dialog.result
 
@@ -376,16 +477,9 @@ class Messagebox:
             **kwargs: Any,
     ) -> Optional[str]:
         """Display a modal dialog box with an OK button and a question icon."""
-        dialog = MessageDialog(
-            message=message,
-            title=title,
-            parent=parent,
-            alert=alert,
-            buttons=buttons or ["OK:primary"],
-            icon=icon or _alert_icon("question"),
-            localize=localize,
-            **kwargs,
-        )
+        dialog = _message_dialog(**_messagebox_kwargs(
+            "show_question", message=message, title=title, parent=parent, alert=alert,
+            buttons=buttons, icon=icon, localize=localize, **kwargs))
         dialog.show(position)
         return dialog.result
 
@@ -403,16 +497,9 @@ class Messagebox:
             **kwargs: Any,
     ) -> Optional[str]:
         """Display a modal dialog box with a single OK button."""
-        dialog = MessageDialog(
-            message=message,
-            title=title,
-            parent=parent,
-            alert=alert,
-            buttons=buttons or ["OK:primary"],
-            icon=icon,
-            localize=localize,
-            **kwargs,
-        )
+        dialog = _message_dialog(**_messagebox_kwargs(
+            "ok", message=message, title=title, parent=parent, alert=alert,
+            buttons=buttons, icon=icon, localize=localize, **kwargs))
         dialog.show(position)
         return dialog.result
 
@@ -430,16 +517,9 @@ class Messagebox:
             **kwargs: Any,
     ) -> Optional[str]:
         """Display a modal dialog box with OK and Cancel buttons."""
-        dialog = MessageDialog(
-            message=message,
-            title=title,
-            parent=parent,
-            alert=alert,
-            buttons=buttons,
-            icon=icon,
-            localize=localize,
-            **kwargs,
-        )
+        dialog = _message_dialog(**_messagebox_kwargs(
+            "okcancel", message=message, title=title, parent=parent, alert=alert,
+            buttons=buttons, icon=icon, localize=localize, **kwargs))
         dialog.show(position)
         return dialog.result
 
@@ -457,16 +537,9 @@ class Messagebox:
             **kwargs: Any,
     ) -> Optional[str]:
         """Display a modal dialog box with Yes and No buttons."""
-        dialog = MessageDialog(
-            message=message,
-            title=title,
-            parent=parent,
-            alert=alert,
-            buttons=buttons or ["No", "Yes"],
-            icon=icon,
-            localize=localize,
-            **kwargs,
-        )
+        dialog = _message_dialog(**_messagebox_kwargs(
+            "yesno", message=message, title=title, parent=parent, alert=alert,
+            buttons=buttons, icon=icon, localize=localize, **kwargs))
         dialog.show(position)
         return dialog.result
 
@@ -484,16 +557,9 @@ class Messagebox:
             **kwargs: Any,
     ) -> Optional[str]:
         """Display a modal dialog box with Yes, No, and Cancel buttons."""
-        dialog = MessageDialog(
-            message=message,
-            title=title,
-            parent=parent,
-            alert=alert,
-            buttons=buttons or ["Cancel", "No", "Yes"],
-            icon=icon,
-            localize=localize,
-            **kwargs,
-        )
+        dialog = _message_dialog(**_messagebox_kwargs(
+            "yesnocancel", message=message, title=title, parent=parent, alert=alert,
+            buttons=buttons, icon=icon, localize=localize, **kwargs))
         dialog.show(position)
         return dialog.result
 
@@ -511,15 +577,14 @@ class Messagebox:
             **kwargs: Any,
     ) -> Optional[str]:
         """Display a modal dialog box with Retry and Cancel buttons."""
-        dialog = MessageDialog(
-            message=message,
-            title=title,
-            parent=parent,
-            alert=alert,
-            buttons=buttons or ["Cancel", "Retry"],
-            icon=icon,
-            localize=localize,
-            **kwargs,
-        )
+        dialog = _message_dialog(**_messagebox_kwargs(
+            "retrycancel", message=message, title=title, parent=parent, alert=alert,
+            buttons=buttons, icon=icon, localize=localize, **kwargs))
         dialog.show(position)
         return dialog.result
+
+
+# The awaitable twins (`ashow_info`, `ayesno`, ...), one per table entry.
+for _method in _MESSAGEBOX_DEFAULTS:
+    setattr(Messagebox, f"a{_method}", staticmethod(_awaitable_messagebox(_method)))
+del _method
@@ -4,18 +4,25 @@ import textwrap
 import tkinter
 from tkinter import filedialog
 from datetime import date
-from typing import Any, List, Optional, Tuple
+from typing import Any, Hashable, List, Optional, Tuple
 
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 from ttkbootstrap.localization import MessageCatalog
 from ttkbootstrap.style._compat import normalize_datepicker_kwargs
 from ttkbootstrap.utils import windowing_system
-from .base import Dialog
+from .base import Dialog, DialogPool
 from .datepicker import DatePickerDialog
 from .fontdialog import FontDialog
 from .message import Messagebox
 
+# Milliseconds of typing pause before the item list is filtered again.
+_FILTER_DELAY = 150
+
+# The most matches shown in the dropdown; the rest are summarized by one
+# "…(+N)" entry at the end of the list.
+_FILTER_LIMIT = 500
+
 
 class QueryDialog(Dialog):
     """A simple modal dialog class for collecting user input."""
@@ -75,7 +82,8 @@ class QueryDialog(Dialog):
                 Optional list of items for dropdown selection. If provided,
                 shows a Combobox instead of Entry. The Combobox supports
                 filtering by typing. If items are provided, the input must
-                match one from the list.
+                match one from the list. Filtering runs once typing pauses,
+                and the dropdown shows at most the first 500 matches.
         """
         super().__init__(parent, title)
         self._prompt = prompt
@@ -87,19 +95,26 @@ class QueryDialog(Dialog):
         self._datatype = datatype
         self._padding = padding
         self._result = None
+        self._item_keys: Optional[List[str]] = None
+        self._filter_text = ""
+        self._filter_query = ""
+        self._filter_matches: Optional[List[int]] = None
+        self._filter_job: Optional[str] = None
+        self._more_label: Optional[str] = None
 
     def create_body(self, master: tkinter.Misc) -> None:
         """Build the prompt label and input widget (Entry or Combobox)."""
         frame = ttk.Frame(master, padding=self._padding)
-        if self._prompt:
-            for p in self._prompt.split("\n"):
-                prompt = "\n".join(textwrap.wrap(p, width=self._width))
-                ttk.Label(frame, text=prompt).pack(pady=(0, 5), fill=X, anchor=N)
+        self._prompt_labels: List[ttk.Label] = []
+        self._set_prompt_lines(frame, before=None)
         if self._items is None or len(self._items) == 0:
             entry = ttk.Entry(master=frame)
         else:
-            entry = ttk.Combobox(master=frame, values=self._items)
+            entry = ttk.Combobox(master=frame, values=self._shown_items(None))
             entry.bind("<KeyRelease>", self.on_filter_list)
+            entry.bind("<<ComboboxSelected>>", self._on_item_selected)
+            # a window-manager close destroys the dialog without `_finish`
+            entry.bind("<Destroy>", self._cancel_filter, "+")
         entry.insert(END, self._initialvalue)
         entry.pack(pady=(0, 5), fill=X)
         entry.bind("<Return>", self.on_submit)
@@ -108,6 +123,27 @@ class QueryDialog(Dialog):
         frame.pack(fill=X, expand=True)
         self._initial_focus = entry
 
+    def _set_prompt_lines(self, frame: tkinter.Misc, before: Optional[tkinter.Misc]) -> None:
+        """Show `self._prompt`, one wrapped label per line, reusing labels."""
+        lines = [
+            "\n".join(textwrap.wrap(p, width=self._width))
+            for p in self._prompt.split("\n")
+        ] if self._prompt else []
+        labels = self._prompt_labels
+        for label, text in zip(labels, lines):
+            label.configure(text=text)
+        for text in lines[len(labels):]:
+            label = ttk.Label(frame, text=text)
+            if before is None:
+                label.pack(pady=(0, 5), fill=X, anchor=N)
+            else:
+                label.pack(pady=(0, 5), fill=X, anchor=N, before=before)
+            labels.append(label)
+        for label in labels[len(lines):]:
+            label.destroy()
+        del labels[len(lines):]
+        self._shown_prompt = self._prompt
+
     def create_buttonbox(self, master: tkinter.Misc) -> None:
         """Build the Submit/Cancel button row."""
         frame = ttk.Frame(master, padding=(5, 10))
@@ -138,22 +174,107 @@ class QueryDialog(Dialog):
         valid_result = self.validate()
         if not valid_result:
             return  # keep toplevel open for valid response
-        self._toplevel.destroy()
+        self._finish()
         self.apply()
 
     def on_cancel(self, *_: Any) -> None:
         """Close the dialog without setting a result."""
-        self._toplevel.destroy()
+        self._finish()
         return
 
+    def _template_key(self) -> Optional[Hashable]:
+        return ("query", str(self.master), bool(self._items), repr(self._padding))
+
+    def _take_settings(self, other: Dialog) -> None:
+        super()._take_settings(other)
+        for name in ("_prompt", "_initialvalue", "_items", "_minvalue", "_maxvalue",
+                     "_width", "_datatype"):
+            setattr(self, name, getattr(other, name))
+        self._item_keys = None
+        self._filter_text = self._filter_query = ""
+        self._filter_matches = None
+
+    def _finish(self) -> None:
+        self._cancel_filter()
+        super()._finish()
+
+    def _reuse(self) -> bool:
+        super()._reuse()
+        entry = self._initial_focus
+        self._cancel_filter()
+        entry.delete(0, END)
+        entry.insert(END, self._initialvalue)
+        if self._items:
+            entry["values"] = self._shown_items(None)
+        if self._prompt == self._shown_prompt:
+            return False
+        self._set_prompt_lines(entry.master, before=entry)
+        return True
+
     def on_filter_list(self, event: tkinter.Event) -> None:
-        """Filter the Combobox values to those matching the typed text."""
-        value = event.widget.get().lower()
-        if not value:
-            event.widget["values"] = self._items
+        """Filter the Combobox values to those matching the typed text.
+
+        The filter runs once typing pauses, not on every key release.
+        """
+        widget = event.widget
+        if self._filter_job is not None:
+            widget.after_cancel(self._filter_job)
+        self._filter_job = widget.after(_FILTER_DELAY, self._filter_list, widget)
+
+    def _cancel_filter(self, *_: Any) -> None:
+        """Drop a pending filter run, whose callback dies with the entry."""
+        if self._filter_job is not None:
+            self._initial_focus.after_cancel(self._filter_job)
+            self._filter_job = None
+
+    def _filter_list(self, widget: ttk.Combobox) -> None:
+        self._filter_job = None
+        try:
+            widget["values"] = self._shown_items(self._match_items(widget.get()))
+        except tkinter.TclError:
+            pass  # the dialog closed before the filter ran
+
+    def _match_items(self, text: str) -> Optional[List[int]]:
+        """The indices of the items containing `text` (any case); None for all.
+
+        The lowercase keys are built once. When the query extends the
+        previous one, only the previous matches are searched again.
+        """
+        query = text.lower()
+        if not query:
+            matches = None
+        else:
+            if self._item_keys is None:
+                self._item_keys = [str(k).lower() for k in self._items]
+            keys = self._item_keys
+            previous = self._filter_matches
+            if previous is not None and self._filter_query and self._filter_query in query:
+                matches = [i for i in previous if query in keys[i]]
+            else:
+                matches = [i for i, key in enumerate(keys) if query in key]
+        self._filter_text = text
+        self._filter_query = query
+        self._filter_matches = matches
+        return matches
+
+    def _shown_items(self, matches: Optional[List[int]]) -> List[Any]:
+        """The dropdown values for `matches`, capped at `_FILTER_LIMIT`."""
+        items = self._items
+        if matches is None:
+            shown, total = list(items[:_FILTER_LIMIT]), len(items)
         else:
-            data = [k for k in self._items if value in k.lower()]
-            event.widget["values"] = data
+            shown, total = [items[i] for i in matches[:_FILTER_LIMIT]], len(matches)
+        if total > len(shown):
+            self._more_label = f"…(+{total - len(shown):,})"
+            shown.append(self._more_label)
+        else:
+            self._more_label = None
+        return shown
+
+    def _on_item_selected(self, event: tkinter.Event) -> None:
+        # Picking the "…(+N)" entry is not a choice; put the typed text back.
+        if self._more_label is not None and event.widget.get() == self._more_label:
+            event.widget.set(self._filter_text)
 
     def validate(self) -> bool:
         """Validate the data before closing."""
@@ -211,8 +332,20 @@ class QueryDialog(Dialog):
         pass
 
 
+def _query_dialog(*args: Any, **kwargs: Any) -> QueryDialog:
+    """The dialog for a `Querybox` call: a kept one when `DialogPool` is on."""
+    dialog = QueryDialog(*args, **kwargs)
+    if DialogPool.is_enabled():
+        return DialogPool.for_widget(dialog).adopt(dialog)
+    return dialog
+
+
 class Querybox:
-    """Static methods that request data from the end user."""
+    """Static methods that request data from the end user.
+
+    With `DialogPool` enabled, ``get_string``, ``get_item``, ``get_integer``
+    and ``get_float`` reuse a kept dialog instead of building a new one.
+    """
 
     @staticmethod
     def get_color(
@@ -294,7 +427,7 @@ class Querybox:
         ``None`` returned on cancel).
         """
         initialvalue = initialvalue or ""
-        dialog = QueryDialog(prompt, title, initialvalue, parent=parent, **kwargs)
+        dialog = _query_dialog(prompt, title, initialvalue, parent=parent, **kwargs)
         dialog.show(position)
         return dialog.result
 
@@ -311,7 +444,7 @@ class Querybox:
     ) -> Optional[str]:
         """Prompt for one item from a list. Returns it, or ``None`` if cancelled."""
         initialvalue = initialvalue or ""
-        dialog = QueryDialog(prompt, title, initialvalue, items=items, parent=parent, **kwargs)
+        dialog = _query_dialog(prompt, title, initialvalue, items=items, parent=parent, **kwargs)
         dialog.show(position)
         return dialog.result
 
@@ -330,7 +463,7 @@ class Querybox:
         """Prompt for an integer. Returns it, or ``None`` if cancelled."""
         initialvalue = initialvalue or ""
         datatype = kwargs.pop("datatype", int)
-        dialog = QueryDialog(
+        dialog = _query_dialog(
             prompt,
             title,
             initialvalue,
@@ -358,7 +491,7 @@ class Querybox:
         """Prompt for a float. Returns it, or ``None`` if cancelled."""
         initialvalue = initialvalue or ""
         datatype = kwargs.pop("datatype", float)
-        dialog = QueryDialog(
+        dialog = _query_dialog(
             prompt,
             title,
             initialvalue,
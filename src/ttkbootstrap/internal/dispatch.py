@@ -0,0 +1,218 @@
+"""Run callbacks on the Tk thread from any thread.
+
+A Tcl interpreter belongs to the thread that created it, so a worker thread
+must hand widget updates back to that thread. `UIDispatcher` is the hand-off:
+`call_soon` queues a callback from any thread and wakes the event loop once;
+the loop then runs every callback queued so far in one batch.
+
+The wakeup is a self-pipe watched with ``createfilehandler`` where Tk supports
+file handlers (every platform but Windows), so a worker only writes a byte and
+never waits on the UI thread. Elsewhere the wakeup is a cross-thread
+``after 0``, which tkinter forwards to the interpreter thread the way Tcl's
+``thread::send`` does. Either way at most one wakeup is outstanding, however
+many callbacks are queued behind it, and nothing polls while the queue is
+empty.
+
+When something other than ``mainloop`` drives Tk (``ttkbootstrap.aio`` pumps it
+from an asyncio loop), that driver installs its own waker with `set_waker`:
+tkinter only forwards cross-thread calls while ``mainloop`` is running.
+"""
+import os
+import sys
+import threading
+import tkinter
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional
+
+# The root attribute the dispatcher is stored under (one per root).
+_DISPATCHER_ATTRIBUTE = "_ttkbootstrap_dispatcher"
+
+# Guards dispatcher creation, so two threads asking for a root's dispatcher at
+# once still share one.
+_CREATE_LOCK = threading.Lock()
+
+
+class UIDispatcher:
+    """A thread-safe queue of callbacks drained on the Tk thread.
+
+    Use :meth:`for_widget` to get the dispatcher of a widget's root; create it
+    on the UI thread so the file handler is installed by the thread that owns
+    the interpreter. ``App``, ``Toplevel`` and the widgets with thread-safe
+    methods do so when they are built, so their workers only ever find it.
+    """
+
+    def __init__(self, root: tkinter.Misc) -> None:
+        self._root = root
+        self._tk = root.tk
+        self._lock = threading.Lock()
+        # Entries are [callback, args]; keyed entries are also indexed so a
+        # later call with the same key replaces the queued arguments.
+        self._pending: Deque[List[Any]] = deque()
+        self._keyed: Dict[Hashable, List[Any]] = {}
+        self._armed = False
+        self._closed = False
+        self._waker: Optional[Callable[[], None]] = None
+        self._command = root.register(self.drain)
+        self._read_fd: Optional[int] = None
+        self._write_fd: Optional[int] = None
+        if sys.platform != "win32" and hasattr(self._tk, "createfilehandler"):
+            self._open_pipe()
+        root.bind("<Destroy>", self._on_root_destroy, "+")
+
+    @classmethod
+    def for_widget(cls, widget: tkinter.Misc) -> "UIDispatcher":
+        """Return the dispatcher attached to `widget`'s root, creating it once."""
+        root = widget._root()
+        dispatcher = getattr(root, _DISPATCHER_ATTRIBUTE, None)
+        if dispatcher is None:
+            with _CREATE_LOCK:
+                dispatcher = getattr(root, _DISPATCHER_ATTRIBUTE, None)
+                if dispatcher is None:
+                    dispatcher = cls(root)
+                    setattr(root, _DISPATCHER_ATTRIBUTE, dispatcher)
+        return dispatcher
+
+    # -- scheduling ---------------------------------------------------------- #
+    def call_soon(self, callback: Callable[..., Any], *args: Any,
+                  key: Optional[Hashable] = None) -> bool:
+        """Queue ``callback(*args)`` to run on the Tk thread; safe from any thread.
+
+        Callbacks run in the order they were queued. When `key` is given and a
+        callback with the same key is still queued, only its arguments are
+        replaced -- the callback runs once, with the latest values, in its
+        original place. Returns ``False`` (and drops the callback) once the
+        root has been destroyed.
+        """
+        with self._lock:
+            if self._closed:
+                return False
+            entry = self._keyed.get(key) if key is not None else None
+            if entry is not None:
+                entry[0] = callback
+                entry[1] = args
+                return True
+            entry = [callback, args]
+            self._pending.append(entry)
+            if key is not None:
+                self._keyed[key] = entry
+            if self._armed:
+                return True
+            self._armed = True
+        self._wake()
+        return True
+
+    def pending(self) -> int:
+        """The number of callbacks queued and not yet run."""
+        with self._lock:
+            return len(self._pending)
+
+    # -- wakeup -------------------------------------------------------------- #
+    def set_waker(self, waker: Optional[Callable[[], None]]) -> None:
+        """Route wakeups through `waker` instead of the pipe / ``after 0``.
+
+        `waker` is called from the queuing thread and must arrange for
+        `drain` to run on the Tk thread. Pass ``None`` to restore the default
+        wakeup; anything still queued is re-armed through it.
+        """
+        self._waker = waker
+        if waker is not None:
+            return
+        with self._lock:
+            if self._closed or not self._pending:
+                return
+            self._armed = True
+        self._wake()
+
+    def _wake(self) -> None:
+        waker = self._waker
+        if waker is not None:
+            try:
+                waker()
+                return
+            except RuntimeError:
+                pass  # the driver's loop is closed; use the default wakeup
+        self._wake_default()
+
+    def _open_pipe(self) -> None:
+        try:
+            read_fd, write_fd = os.pipe()
+        except OSError:
+            return
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+        try:
+            self._tk.createfilehandler(read_fd, tkinter.READABLE, self._on_readable)
+        except (RuntimeError, tkinter.TclError):
+            os.close(read_fd)
+            os.close(write_fd)
+            return
+        self._read_fd, self._write_fd = read_fd, write_fd
+
+    def _wake_default(self) -> None:
+        if self._write_fd is not None:
+            try:
+                os.write(self._write_fd, b"\0")
+            except BlockingIOError:
+                pass  # a wakeup byte is already waiting to be read
+            except OSError:
+                self._disarm()
+            return
+        try:
+            self._tk.call("after", "0", self._command)
+        except (RuntimeError, tkinter.TclError):
+            # The UI thread is not in its main loop (or the interpreter is
+            # gone). Leave the callbacks queued; the next call_soon retries.
+            self._disarm()
+
+    def _disarm(self) -> None:
+        with self._lock:
+            self._armed = False
+
+    def _on_readable(self, fd: int, mask: int) -> None:
+        # Empty the pipe BEFORE taking the batch: a byte written after the
+        # batch is taken must survive to trigger the next drain.
+        try:
+            while os.read(fd, 4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+        self.drain()
+
+    def drain(self, *_: Any) -> None:
+        """Run every callback queued so far (on the Tk thread)."""
+        with self._lock:
+            batch = self._pending
+            self._pending = deque()
+            self._keyed = {}
+            self._armed = False
+        for callback, args in batch:
+            try:
+                callback(*args)
+            except Exception:
+                self._root.report_callback_exception(*sys.exc_info())
+
+    # -- teardown ------------------------------------------------------------ #
+    def close(self) -> None:
+        """Drop queued callbacks and release the wakeup pipe (idempotent)."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._pending.clear()
+            self._keyed.clear()
+        if self._read_fd is not None:
+            try:
+                self._tk.deletefilehandler(self._read_fd)
+            except (RuntimeError, tkinter.TclError):
+                pass
+            for fd in (self._read_fd, self._write_fd):
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+            self._read_fd = self._write_fd = None
+
+    def _on_root_destroy(self, event: tkinter.Event) -> None:
+        # Ignore the <Destroy> of child widgets bubbling up to the root.
+        if event.widget is self._root:
+            self.close()
@@ -15,11 +15,19 @@ Tk itself has no monitor enumeration on any platform: ``winfo screenwidth`` on
 X11 reports the union of every display, and ``winfo vrootwidth`` falls back to
 that same value unless a virtual-root window manager is running. The layout has
 to come from the platform.
+
+Asking the platform is a round trip to the display server (or a library load),
+so the layout is cached for `_LAYOUT_TTL` seconds: a burst of placements --
+a dialog, its popups, their tooltips -- shares one query. Nothing in Tk reports
+a monitor being plugged in or rearranged, hence a short expiry rather than an
+event; `forget_monitor_layout` drops the cache at once.
 """
 from __future__ import annotations
 
 import sys
+import time
 import tkinter
+from bisect import bisect_right
 from typing import List, Optional, Tuple
 
 try:
@@ -34,6 +42,13 @@ Rect = Tuple[int, int, int, int]  # (x, y, width, height)
 # on every placement
 _XINERAMA_UNAVAILABLE = False
 
+# Seconds a queried monitor layout is reused before it is queried again.
+_LAYOUT_TTL = 2.0
+
+# (expiry time, layout) of the last query; a layout of None is cached too, so a
+# platform with no enumeration is not re-asked on every placement.
+_layout_cache: Optional[Tuple[float, Optional["_MonitorLayout"]]] = None
+
 
 def _load_library(name: str):  # pragma: no cover - X11 only
     """Load a shared library by short name, or return None."""
@@ -130,6 +145,52 @@ def _monitors() -> Optional[List[Rect]]:
     return _xinerama_monitors()
 
 
+class _MonitorLayout:
+    """Monitor rects indexed by their left edge for point lookups.
+
+    A point can only lie on a monitor whose left edge is at or left of it, so
+    a bisection over the sorted left edges bounds the candidates; among those
+    that contain the point, the one listed first by the platform wins, as it
+    would in a linear scan.
+    """
+
+    __slots__ = ("rects", "_lefts", "_by_left")
+
+    def __init__(self, rects: List[Rect]) -> None:
+        self.rects = rects
+        self._by_left = sorted(
+            (rect[0], index, rect) for index, rect in enumerate(rects))
+        self._lefts = [left for left, _, _ in self._by_left]
+
+    def at(self, x: int, y: int) -> Rect:
+        """The monitor containing ``(x, y)``, else the first monitor."""
+        best = None
+        for i in range(bisect_right(self._lefts, x) - 1, -1, -1):
+            mx, index, rect = self._by_left[i]
+            _, my, mw, mh = rect
+            if x < mx + mw and my <= y < my + mh and (best is None or index < best[0]):
+                best = (index, rect)
+        return best[1] if best is not None else self.rects[0]
+
+
+def _monitor_layout() -> Optional[_MonitorLayout]:
+    """The cached monitor layout, re-queried once it is `_LAYOUT_TTL` old."""
+    global _layout_cache
+    now = time.monotonic()
+    if _layout_cache is not None and now < _layout_cache[0]:
+        return _layout_cache[1]
+    monitors = _monitors()
+    layout = _MonitorLayout(monitors) if monitors else None
+    _layout_cache = (now + _LAYOUT_TTL, layout)
+    return layout
+
+
+def forget_monitor_layout() -> None:
+    """Drop the cached monitor layout; the next placement queries it afresh."""
+    global _layout_cache
+    _layout_cache = None
+
+
 def _monitor_at_point(x: int, y: int) -> Optional[Rect]:
     """Return the ``(x, y, w, h)`` bounds of the monitor containing a point.
 
@@ -137,14 +198,10 @@ def _monitor_at_point(x: int, y: int) -> Optional[Rect]:
     back to Tk's screen/virtual-root metrics. When the layout is known but the
     point is on no monitor, the first monitor is returned as a sane default.
     """
-    monitors = _monitors()
-    if not monitors:
+    layout = _monitor_layout()
+    if layout is None:
         return None
-    for rect in monitors:
-        mx, my, mw, mh = rect
-        if mx <= x < mx + mw and my <= y < my + mh:
-            return rect
-    return monitors[0]
+    return layout.at(x, y)
 
 
 def _window_size(window: tkinter.Misc) -> Tuple[int, int]:
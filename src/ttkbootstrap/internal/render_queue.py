@@ -0,0 +1,125 @@
+"""Coalesce widget redraws into one pass per event-loop turn.
+
+Canvas- and image-backed widgets (`Floodgauge`, `Meter`, ...) repaint from
+variable traces and ``configure`` calls. A loop that sets a value a thousand
+times before returning to the event loop would otherwise repaint a thousand
+times, although only the last frame is ever shown.
+
+Widgets mark themselves dirty with `RenderQueue.invalidate` instead of
+repainting. The first invalidation of a turn schedules one ``after idle``
+pass; the pass runs every dirty callback once, in the order the keys were
+first invalidated. Tk runs idle callbacks before it redraws the screen, so the
+result is on screen in the same frame it would have been painted in anyway.
+
+``update_idletasks()`` runs the pass like any other idle work; `flush` runs it
+on demand, for code (and tests) that must read the drawn state right away.
+"""
+import sys
+import tkinter
+from typing import Any, Callable, Dict, Hashable, Optional
+
+# The root attribute the queue is stored under (one per root).
+_QUEUE_ATTRIBUTE = "_ttkbootstrap_render_queue"
+
+
+class RenderQueue:
+    """The pending redraws of one root, run together when Tk goes idle.
+
+    Use :meth:`for_widget` to get the queue of a widget's root. Unlike
+    `UIDispatcher`, the queue belongs to the Tk thread: call it from there.
+    """
+
+    def __init__(self, root: tkinter.Misc) -> None:
+        self._root = root
+        self._dirty: Dict[Hashable, Callable[[], Any]] = {}
+        self._job: Optional[str] = None
+        self._command = root.register(self._on_idle)
+        root.bind("<Destroy>", self._on_root_destroy, "+")
+
+    @classmethod
+    def for_widget(cls, widget: tkinter.Misc) -> "RenderQueue":
+        """Return the queue attached to `widget`'s root, creating it once."""
+        root = widget._root()
+        queue = getattr(root, _QUEUE_ATTRIBUTE, None)
+        if queue is None:
+            queue = cls(root)
+            setattr(root, _QUEUE_ATTRIBUTE, queue)
+        return queue
+
+    # -- scheduling ---------------------------------------------------------- #
+    def invalidate(self, key: Hashable, callback: Callable[[], Any]) -> None:
+        """Run `callback` at the next idle pass, once however often it is marked.
+
+        `key` identifies the redraw, conventionally ``(widget._w, "draw")``.
+        Marking a key that is already pending only replaces its callback; it
+        keeps its place in the pass.
+        """
+        self._dirty[key] = callback
+        if self._job is None:
+            try:
+                self._job = self._root.tk.call("after", "idle", self._command)
+            except tkinter.TclError:
+                self._dirty.clear()  # the interpreter is gone
+
+    def discard(self, key: Hashable) -> None:
+        """Forget a pending redraw (a widget being destroyed calls this)."""
+        self._dirty.pop(key, None)
+
+    def is_pending(self, key: Hashable) -> bool:
+        """Whether a redraw for `key` is waiting for the next pass."""
+        return key in self._dirty
+
+    def pending(self) -> int:
+        """The number of redraws waiting for the next pass."""
+        return len(self._dirty)
+
+    # -- running ------------------------------------------------------------- #
+    def flush(self, key: Optional[Hashable] = None) -> None:
+        """Run pending redraws now instead of at the next idle pass.
+
+        With `key`, only that redraw runs (if pending) and the others keep
+        waiting; without it, every pending redraw runs.
+        """
+        if key is not None:
+            callback = self._dirty.pop(key, None)
+            if callback is not None:
+                self._run(callback)
+            if not self._dirty:
+                self._cancel_job()
+            return
+        self._cancel_job()
+        self._run_all()
+
+    def _on_idle(self, *_: Any) -> None:
+        self._job = None
+        self._run_all()
+
+    def _run_all(self) -> None:
+        # Redraws invalidated while the batch runs land in a fresh batch (and
+        # schedule a fresh pass) rather than extending this one.
+        batch = self._dirty
+        self._dirty = {}
+        for callback in batch.values():
+            self._run(callback)
+
+    def _run(self, callback: Callable[[], Any]) -> None:
+        try:
+            callback()
+        except Exception:
+            self._root.report_callback_exception(*sys.exc_info())
+
+    def _cancel_job(self) -> None:
+        if self._job is None:
+            return
+        try:
+            self._root.tk.call("after", "cancel", self._job)
+        except tkinter.TclError:
+            pass
+        self._job = None
+
+    # -- teardown ------------------------------------------------------------ #
+    def _on_root_destroy(self, event: tkinter.Event) -> None:
+        # Ignore the <Destroy> of child widgets bubbling up to the root.
+        if event.widget is self._root:
+            self._dirty.clear()
+            self._cancel_job()
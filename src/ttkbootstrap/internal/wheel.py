@@ -115,8 +115,10 @@ def precise_deltas(event):
 
 def scale_num(widget, value) -> int:
     """Scale a pixel amount for display density, like `::tk::ScaleNum`."""
+    from ttkbootstrap.style.scaling import Scaling
+
     try:
-        scaling = float(widget.tk.call("tk", "scaling"))
+        scaling = Scaling.for_widget(widget).tk_scaling
     except (tkinter.TclError, TypeError, ValueError):
         scaling = 1.0
     return round(value * scaling * 0.75)
@@ -25,11 +25,18 @@ _dispatch_roots: "weakref.WeakSet[tkinter.Misc]" = weakref.WeakSet()
 
 
 def _dispatch_locale_change(event: Optional[tkinter.Event] = None) -> None:
-    """Re-translate every live `LocaleVar` (one root binding drives them all)."""
-    for key, ref in list(_locale_var_refs.items()):
-        var = ref()
-        if var is None:
-            continue
+    """Re-translate every live `LocaleVar` (one root binding drives them all).
+
+    The distinct sources are translated together first, in one Tcl call, so
+    each var then reads its text from the translation cache.
+    """
+    live = [(key, ref()) for key, ref in list(_locale_var_refs.items())]
+    live = [(key, var) for key, var in live if var is not None]
+    try:
+        MessageCatalog.translate_many(*{var._src for _, var in live})
+    except tkinter.TclError:
+        pass  # no catalog to warm; each var below translates (or drops) itself
+    for key, var in live:
         try:
             var._retranslate()
         except tkinter.TclError:
@@ -8,7 +8,13 @@ All commands go through ``tk.call`` (not ``tk.eval`` with hand-built command
 strings): each argument is passed as a proper Tcl value, so source strings
 containing ``{ } [ ] $`` or spaces are handled without quoting tricks or
 injection risk.
+
+Plain translations (no format arguments) are cached per root, keyed by
+``(locale, src)``, so re-translating a string costs no Tcl call. The built-in
+tables in `msgs` are loaded one locale at a time, the first time that locale
+(or a more specific one) becomes current.
 """
+import tkinter
 from os import PathLike
 from typing import Any, Optional, Union
 
@@ -18,6 +24,13 @@ from ttkbootstrap.window import get_default_root
 #: widgets (e.g. ``LocaleVar``) can re-translate themselves.
 LOCALE_CHANGED = "<<LocaleChanged>>"
 
+# The root attribute the catalog state is stored under (one per root).
+_CATALOG_ATTRIBUTE = "_ttkbootstrap_msgcat"
+
+# Translate a list of sources in one call. `apply` runs the lambda in the
+# global namespace, where `mcset` / `mcmset` from Python define their entries.
+_MC_MANY = ("sources", "lmap src $sources {::msgcat::mc $src}", "::")
+
 
 def normalize_locale(code: str) -> str:
     """Canonicalize a locale code so it reliably matches msgcat's catalog.
@@ -29,6 +42,67 @@ def normalize_locale(code: str) -> str:
     return str(code).replace("-", "_").lower()
 
 
+def _locale_chain(locale: str) -> list[str]:
+    """The locales msgcat searches for `locale`, most specific first."""
+    parts = locale.split("_")
+    return ["_".join(parts[:i]) for i in range(len(parts), 0, -1) if parts[0]]
+
+
+class _CatalogState:
+    """The Python side of one root's message catalog.
+
+    Tracks the current locale, the cached translations, and which locales'
+    built-in tables are already in the interpreter. Use :meth:`for_root`.
+    """
+
+    def __init__(self, root: tkinter.Misc) -> None:
+        self._root = root
+        self._loaded: set[str] = set()
+        self.translations: dict[tuple[str, str], str] = {}
+        self.locale = ""
+        self.use(root.tk.call("::msgcat::mclocale"))
+
+    @classmethod
+    def for_root(cls, root: tkinter.Misc) -> "_CatalogState":
+        """Return the state attached to `root`, creating it once."""
+        state = getattr(root, _CATALOG_ATTRIBUTE, None)
+        if state is None:
+            state = cls(root)
+            setattr(root, _CATALOG_ATTRIBUTE, state)
+        return state
+
+    def use(self, locale: str) -> None:
+        """Record `locale` as current and load its built-in tables."""
+        self.locale = str(locale)
+        self.load_builtin(self.locale)
+
+    def load_builtin(self, locale: str) -> None:
+        """Load the built-in tables `locale` falls back on, once each."""
+        from ttkbootstrap.localization.msgs import messages_for
+
+        for code in _locale_chain(normalize_locale(locale)):
+            if code in self._loaded:
+                continue
+            self._loaded.add(code)
+            for table in messages_for(code):
+                self._root.tk.call("::msgcat::mcmset", code, table.pairs())
+            self.translations.clear()
+
+    def translate_many(self, sources: tuple[str, ...]) -> list[str]:
+        """Translate `sources` for the current locale, in one Tcl call at most."""
+        cache = self.translations
+        locale = self.locale
+        missing = list(dict.fromkeys(
+            src for src in sources if (locale, src) not in cache
+        ))
+        if missing:
+            tk = self._root.tk
+            results = tk.splitlist(tk.call("apply", _MC_MANY, tuple(missing)))
+            for src, text in zip(missing, results):
+                cache[(locale, src)] = str(text)
+        return [cache[(locale, src)] for src in sources]
+
+
 class MessageCatalog:
     """Static wrapper for the Tcl/Tk `::msgcat` message catalog commands."""
 
@@ -61,7 +135,35 @@ class MessageCatalog:
                 The translated string.
         """
         root = get_default_root()
-        return root.tk.call("::msgcat::mc", src, *fmtargs)
+        if fmtargs:
+            return root.tk.call("::msgcat::mc", src, *fmtargs)
+        state = _CatalogState.for_root(root)
+        try:
+            return state.translations[(state.locale, src)]
+        except KeyError:
+            return state.translate_many((src,))[0]
+
+    @staticmethod
+    def translate_many(*src: str) -> list[str]:
+        """Returns the translations of several source strings according to
+        the user's current locale.
+
+        Sources that were translated before come from the cache; the rest
+        are resolved together in a single Tcl call. Use this to re-translate
+        many labels at once, e.g. after a locale change.
+
+        Parameters:
+
+            *src (str):
+                The strings to be translated.
+
+        Returns:
+
+            list[str]:
+                The translated strings, in the order given.
+        """
+        root = get_default_root()
+        return _CatalogState.for_root(root).translate_many(src)
 
     @staticmethod
     def locale(newlocale: Optional[str] = None) -> str:
@@ -86,11 +188,16 @@ class MessageCatalog:
                 string.
         """
         root = get_default_root()
+        state = _CatalogState.for_root(root)
         if newlocale:
             result = root.tk.call("::msgcat::mclocale", normalize_locale(newlocale))
+            state.use(result)
             root.event_generate(LOCALE_CHANGED, when="tail")
             return result
-        return root.tk.call("::msgcat::mclocale")
+        result = root.tk.call("::msgcat::mclocale")
+        if result != state.locale:  # changed from Tcl behind our back
+            state.use(result)
+        return result
 
     @staticmethod
     def preferences() -> list[str]:
@@ -132,7 +239,9 @@ class MessageCatalog:
         msgs = Path(dirname).as_posix()  # format path for tcl/tk
 
         root = get_default_root()
-        return int(root.tk.call("::msgcat::mcload", msgs))
+        count = int(root.tk.call("::msgcat::mcload", msgs))
+        _CatalogState.for_root(root).translations.clear()
+        return count
 
     @staticmethod
     def set(locale: str, src: str, translated: Optional[str] = None) -> None:
@@ -153,7 +262,11 @@ class MessageCatalog:
                 src is used.
         """
         root = get_default_root()
+        # Load the built-in table first, so it cannot later overwrite this entry.
+        state = _CatalogState.for_root(root)
+        state.load_builtin(locale)
         root.tk.call("::msgcat::mcset", normalize_locale(locale), src, translated or "")
+        state.translations.clear()
 
     @staticmethod
     def set_many(locale: str, *args: str) -> int:
@@ -175,9 +288,13 @@ class MessageCatalog:
                 The number of translation sets.
         """
         root = get_default_root()
+        state = _CatalogState.for_root(root)
+        state.load_builtin(locale)
         # mcmset takes a single {src trans ...} list; passing the tuple lets
         # Tkinter build a proper Tcl list (no manual brace-wrapping).
-        return int(root.tk.call("::msgcat::mcmset", normalize_locale(locale), args))
+        count = int(root.tk.call("::msgcat::mcmset", normalize_locale(locale), args))
+        state.translations.clear()
+        return count
 
     @staticmethod
     def max(*src: str) -> int:
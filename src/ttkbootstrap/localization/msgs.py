@@ -1,18 +1,28 @@
 """Pre-defined message translations for ttkbootstrap localization.
 
 Built-in translations for common UI strings (dialog buttons, actions, months and
-weekdays, font-dialog labels) across the supported locales, loaded into the
-`MessageCatalog` when the localization system initializes.
+weekdays, font-dialog labels) across the supported locales. A locale's tables
+are loaded into the `MessageCatalog` the first time that locale is used.
 """
-from ttkbootstrap.localization.msgcat import MessageCatalog
+from itertools import chain
+
+from ttkbootstrap.localization.msgcat import MessageCatalog, normalize_locale
 
 MESSAGES = []
 
 
+def messages_for(locale):
+    """The `LocaleMsgs` tables registered for the normalized `locale` code."""
+    return [m for m in MESSAGES if normalize_locale(m.locale) == locale]
+
+
 def initialize_localities():
-    """Load all custom msg files."""
-    for m in MESSAGES:
-        m.initialize()
+    """Make the custom msg files available.
+
+    Only the current locale's tables are loaded now; the others are loaded the
+    first time their locale is selected with `MessageCatalog.locale`.
+    """
+    MessageCatalog.locale()
 
 
 class LocaleMsgs:
@@ -25,12 +35,13 @@ class LocaleMsgs:
         self.locale = locale
         self.messages = msgs
 
+    def pairs(self):
+        """The messages as one flat ``(src, translated, ...)`` tuple."""
+        return tuple(chain(*self.messages))
+
     def initialize(self):
         """Initialize this locale in the MessageCatalog"""
-        from itertools import chain
-
-        messages = list(chain(*self.messages))
-        MessageCatalog.set_many(self.locale, *messages)
+        MessageCatalog.set_many(self.locale, *self.pairs())
 
 
 MESSAGES.append(
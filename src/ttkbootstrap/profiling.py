@@ -0,0 +1,524 @@
+"""Opt-in counters and timers for ttkbootstrap's hot paths.
+
+Profiling is off by default and costs a flag check per instrumented call while
+off. Turn it on, exercise the application, then read a snapshot:
+
+```python
+from ttkbootstrap import profiling
+
+profiling.enable(trace=True)
+...                                   # build the UI, switch themes, page a table
+print(app.style.stats())              # or profiling.snapshot()
+profiling.export_chrome_trace("ttkb.json")   # open in chrome://tracing / Perfetto
+```
+
+What is recorded (timer and counter names in the snapshot):
+
+- ``style.build[<variant>.<family>]`` -- time per recipe run, and
+  ``style.build.tcl[<variant>.<family>]`` -- the Tcl round trips it made
+- ``image_cache.hit`` / ``image_cache.miss`` and the ``image.render`` time
+- ``theme.walk`` time and ``theme.walk.repainted`` widgets
+- ``bootstyle.parse`` calls
+- ``tableview.load``, ``tableview.sort`` and ``tableview.search`` times
+
+Timers hold a count, total, mean, and max in milliseconds. With ``trace=True``
+every timed span is also kept (up to the newest `MAX_TRACE_EVENTS`) as a
+Chrome trace event.
+
+For tests and benchmarks, `TclRecorder` / `record_tcl_calls` record every Tcl
+round trip a widget tree makes -- arguments and latency -- and
+`assert_max_tcl_calls` turns a count into a budget. They work whether or not
+profiling is enabled.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from functools import wraps
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Tuple
+
+__all__ = [
+    "enable",
+    "disable",
+    "is_enabled",
+    "reset",
+    "snapshot",
+    "count",
+    "span",
+    "timed",
+    "profiled",
+    "count_tcl_calls",
+    "TclCall",
+    "TclRecorder",
+    "record_tcl_calls",
+    "assert_max_tcl_calls",
+    "export_chrome_trace",
+    "log_periodically",
+    "MAX_TRACE_EVENTS",
+]
+
+#: The most trace events kept; older events are dropped first.
+MAX_TRACE_EVENTS = 200_000
+
+_logger = logging.getLogger("ttkbootstrap.profiling")
+
+_enabled = False
+_tracing = False
+_lock = threading.Lock()
+_counters: Dict[str, int] = {}
+# name -> [count, total seconds, max seconds]
+_timers: Dict[str, List[float]] = {}
+_events: Deque[Dict[str, Any]] = deque(maxlen=MAX_TRACE_EVENTS)
+_epoch = time.perf_counter()
+
+
+def enable(*, trace: bool = False) -> None:
+    """Start recording. With `trace`, also keep every span for a Chrome trace."""
+    global _enabled, _tracing
+    _enabled = True
+    _tracing = trace
+
+
+def disable() -> None:
+    """Stop recording; what was recorded so far is kept until `reset`."""
+    global _enabled, _tracing
+    _enabled = False
+    _tracing = False
+
+
+def is_enabled() -> bool:
+    """Whether profiling is recording."""
+    return _enabled
+
+
+def reset() -> None:
+    """Drop every counter, timer, and trace event."""
+    with _lock:
+        _counters.clear()
+        _timers.clear()
+        _events.clear()
+
+
+def snapshot() -> Dict[str, Any]:
+    """A copy of the counters and timers recorded so far.
+
+    Returns ``{"enabled": bool, "counters": {name: int}, "timers": {name:
+    {"count", "total_ms", "mean_ms", "max_ms"}}}``.
+    """
+    with _lock:
+        counters = dict(_counters)
+        timers = {
+            name: {
+                "count": int(n),
+                "total_ms": total * 1000.0,
+                "mean_ms": total * 1000.0 / n if n else 0.0,
+                "max_ms": peak * 1000.0,
+            }
+            for name, (n, total, peak) in _timers.items()
+        }
+    return {"enabled": _enabled, "counters": counters, "timers": timers}
+
+
+# -- recording ------------------------------------------------------------- #
+def _key(name: str, label: Optional[str]) -> str:
+    return name if label is None else f"{name}[{label}]"
+
+
+def count(name: str, n: int = 1, *, label: Optional[str] = None) -> None:
+    """Add `n` to the counter `name` (``name[label]`` with a label)."""
+    if not _enabled:
+        return
+    key = _key(name, label)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + n
+
+
+def _record(key: str, start: float, elapsed: float, args: Optional[Dict[str, Any]]) -> None:
+    with _lock:
+        entry = _timers.get(key)
+        if entry is None:
+            _timers[key] = [1, elapsed, elapsed]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed
+            if elapsed > entry[2]:
+                entry[2] = elapsed
+        if _tracing:
+            event = {
+                "name": key,
+                "cat": "ttkbootstrap",
+                "ph": "X",
+                "ts": (start - _epoch) * 1e6,
+                "dur": elapsed * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+            }
+            if args:
+                event["args"] = args
+            _events.append(event)
+
+
+class _Span:
+    """Times a ``with`` block into a timer (and a trace event when tracing)."""
+
+    __slots__ = ("_key", "_args", "_start")
+
+    def __init__(self, key: str, args: Optional[Dict[str, Any]]) -> None:
+        self._key = key
+        self._args = args
+        self._start = 0.0
+
+    def set(self, **args: Any) -> None:
+        """Attach arguments to the trace event (e.g. a result size)."""
+        if self._args is None:
+            self._args = {}
+        self._args.update(args)
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        _record(self._key, self._start, time.perf_counter() - self._start, self._args)
+
+
+class _NullSpan:
+    """The span handed out while profiling is off: does nothing."""
+
+    __slots__ = ()
+
+    def set(self, **args: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str, *, label: Optional[str] = None, **args: Any) -> Any:
+    """A context manager timing its block into the timer `name`.
+
+    `label` splits the timer per instance (``name[label]``); keyword `args`
+    are attached to the trace event. While profiling is off a shared no-op is
+    returned.
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(_key(name, label), args or None)
+
+
+def timed(name: str, func: Callable[[], Any]) -> Callable[[], Any]:
+    """Wrap the zero-argument `func` to time each call into `name`.
+
+    Returns `func` itself while profiling is off. For work handed to another
+    thread, where a ``with span(...)`` around the hand-off would time the
+    wrong thing.
+    """
+    if not _enabled:
+        return func
+
+    def run() -> Any:
+        start = time.perf_counter()
+        try:
+            return func()
+        finally:
+            _record(name, start, time.perf_counter() - start, None)
+
+    return run
+
+
+def profiled(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator timing every call of a function into the timer `name`."""
+
+    def decorate(func: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(name, start, time.perf_counter() - start, None)
+
+        return wrapper
+
+    return decorate
+
+
+# -- Tcl round trips ------------------------------------------------------- #
+class _CountingTk:
+    """Stands in for a tkapp, counting the ``call``\\ s made through it."""
+
+    def __init__(self, tk: Any) -> None:
+        self._tk = tk
+        self.calls = 0
+
+    def call(self, *args: Any) -> Any:
+        self.calls += 1
+        return self._tk.call(*args)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._tk, name)
+
+
+class TclCall(NamedTuple):
+    """One recorded Tcl round trip: its arguments and how long it took."""
+
+    args: Tuple[Any, ...]
+    seconds: float
+
+    @property
+    def command(self) -> str:
+        """The command the call ran, for grouping.
+
+        Widget, image, and ensemble commands keep their subcommand
+        (``"<widget> configure"``, ``"ttk::style map"``); anything else is its
+        first word.
+        """
+        if not self.args:
+            return ""
+        head = str(self.args[0])
+        if head.startswith("."):
+            head = "<widget>"
+        elif head.startswith("pyimage"):
+            head = "<image>"
+        elif head not in _ENSEMBLES:
+            return head
+        if len(self.args) > 1:
+            return f"{head} {self.args[1]}"
+        return head
+
+
+# Tcl commands whose second word is a subcommand worth grouping by.
+_ENSEMBLES = frozenset({
+    "ttk::style", "font", "winfo", "image", "wm", "grid", "pack", "place",
+    "after", "bind", "event", "focus", "tk", "grab", "clipboard", "option",
+    "ttk::notebook", "tk::PlaceWindow",
+})
+
+
+class _RecordingTk(_CountingTk):
+    """A counting tkapp stand-in that also keeps each call's arguments and latency."""
+
+    def __init__(self, tk: Any, recorder: "TclRecorder") -> None:
+        super().__init__(tk)
+        self._recorder: Optional[TclRecorder] = recorder
+
+    def call(self, *args: Any) -> Any:
+        recorder = self._recorder
+        if recorder is None:
+            return self._tk.call(*args)
+        start = time.perf_counter()
+        try:
+            return self._tk.call(*args)
+        finally:
+            # tkinter often passes the whole command as one tuple.
+            if len(args) == 1 and isinstance(args[0], tuple):
+                args = args[0]
+            recorder.calls.append(TclCall(args, time.perf_counter() - start))
+
+    def eval(self, script: str) -> Any:
+        recorder = self._recorder
+        if recorder is None:
+            return self._tk.eval(script)
+        start = time.perf_counter()
+        try:
+            return self._tk.eval(script)
+        finally:
+            recorder.calls.append(TclCall(("eval", script), time.perf_counter() - start))
+
+
+class TclRecorder:
+    """Records every Tcl call a widget tree makes inside a ``with`` block.
+
+    On entry the interpreter handle (``.tk``) of the root, every widget under
+    it, and the `Style` is replaced by a recording stand-in; widgets, fonts,
+    and variables created inside the block pick it up from their master. On
+    exit the real handle is put back. Objects created inside the block and
+    kept afterwards hold the (now inert) stand-in, so this is a test and
+    benchmark harness, not something to leave running.
+
+    Calls made through objects that cached the handle *before* the block --
+    an existing ``Font`` object's ``measure``, say -- are not seen.
+
+    ```python
+    with TclRecorder(root) as rec:
+        ttk.Button(root, bootstyle="success").pack()
+    print(rec.count, rec.summary())
+    ```
+    """
+
+    def __init__(self, widget: Any = None) -> None:
+        self._widget = widget
+        self._root: Any = None
+        self._proxy: Optional[_RecordingTk] = None
+        self.calls: List[TclCall] = []
+
+    @property
+    def count(self) -> int:
+        """The number of Tcl calls recorded."""
+        return len(self.calls)
+
+    @property
+    def seconds(self) -> float:
+        """The total time spent in the recorded calls."""
+        return sum(call.seconds for call in self.calls)
+
+    def by_command(self) -> Dict[str, int]:
+        """Call counts per `TclCall.command`, most frequent first."""
+        counts: Dict[str, int] = {}
+        for call in self.calls:
+            counts[call.command] = counts.get(call.command, 0) + 1
+        return dict(sorted(counts.items(), key=lambda item: -item[1]))
+
+    def summary(self, limit: int = 10) -> str:
+        """A one-line-per-command digest of the most frequent commands."""
+        lines = [f"{self.count} Tcl calls, {self.seconds * 1000.0:.2f} ms"]
+        for command, n in list(self.by_command().items())[:limit]:
+            lines.append(f"  {n:6d}  {command}")
+        return "\n".join(lines)
+
+    def __enter__(self) -> "TclRecorder":
+        widget = self._widget
+        if widget is None:
+            import tkinter
+
+            widget = tkinter._get_default_root("record Tcl calls")
+        root = self._root = widget._root()
+        self._proxy = _RecordingTk(root.tk, self)
+        _swap_tk(root, root.tk, self._proxy)
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        proxy = self._proxy
+        proxy._recorder = None
+        _swap_tk(self._root, proxy, proxy._tk)
+
+
+def _swap_tk(root: Any, old: Any, new: Any) -> None:
+    """Replace the interpreter handle `old` with `new` across `root`'s tree."""
+    from ttkbootstrap.style.engine import Style
+
+    stack = [root]
+    while stack:
+        widget = stack.pop()
+        if getattr(widget, "tk", None) is old:
+            widget.tk = new
+        stack.extend(getattr(widget, "children", {}).values())
+    style = Style.instance
+    if style is not None and style.tk is old:
+        style.tk = new
+
+
+def record_tcl_calls(widget: Any = None) -> TclRecorder:
+    """Record the Tcl calls made inside a ``with`` block; see `TclRecorder`."""
+    return TclRecorder(widget)
+
+
+class assert_max_tcl_calls:
+    """Fail when a ``with`` block makes more than `limit` Tcl calls.
+
+    Locks in a Tcl call budget in tests; the failure message lists the most
+    frequent commands. The recorder is available as the ``as`` target.
+
+    ```python
+    with assert_max_tcl_calls(40, root):
+        table.goto_next_page()
+    ```
+    """
+
+    def __init__(self, limit: int, widget: Any = None) -> None:
+        self.limit = limit
+        self._recorder = TclRecorder(widget)
+
+    def __enter__(self) -> TclRecorder:
+        return self._recorder.__enter__()
+
+    def __exit__(self, exc_type: Any, *exc: Any) -> None:
+        self._recorder.__exit__(exc_type, *exc)
+        if exc_type is None and self._recorder.count > self.limit:
+            raise AssertionError(
+                f"expected at most {self.limit} Tcl calls, made "
+                f"{self._recorder.count}:\n{self._recorder.summary()}"
+            )
+
+
+class _TclCounter:
+    __slots__ = ("_owner", "_key", "_proxy")
+
+    def __init__(self, owner: Any, key: str) -> None:
+        self._owner = owner
+        self._key = key
+        self._proxy: Optional[_CountingTk] = None
+
+    def __enter__(self) -> "_TclCounter":
+        self._proxy = _CountingTk(self._owner.tk)
+        self._owner.tk = self._proxy
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        proxy = self._proxy
+        self._owner.tk = proxy._tk
+        count(self._key, proxy.calls)
+
+
+def count_tcl_calls(owner: Any, name: str, *, label: Optional[str] = None) -> Any:
+    """Count the Tcl calls made through ``owner.tk`` in a ``with`` block.
+
+    `owner` is any object holding the interpreter as ``.tk`` -- the `Style`
+    most usefully, since every style recipe talks to Tcl through it. The total
+    is added to the counter `name` (``name[label]``). A no-op while off.
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _TclCounter(owner, _key(name, label))
+
+
+# -- output ---------------------------------------------------------------- #
+def export_chrome_trace(path: str) -> int:
+    """Write the recorded spans as Chrome trace JSON; returns the event count.
+
+    Spans are kept only while profiling is enabled with ``trace=True``. Open
+    the file in ``chrome://tracing`` or https://ui.perfetto.dev.
+    """
+    with _lock:
+        events = list(_events)
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, fh)
+    return len(events)
+
+
+def log_periodically(widget: Any, interval_ms: int = 5000,
+                     logger: Optional[logging.Logger] = None) -> Callable[[], None]:
+    """Log a snapshot every `interval_ms` on `widget`'s event loop.
+
+    Logs at INFO on the ``ttkbootstrap.profiling`` logger unless `logger` is
+    given. Returns a function that stops the logging.
+    """
+    log = logger or _logger
+    job: List[Optional[str]] = [None]
+
+    def tick() -> None:
+        stats = snapshot()
+        log.info("ttkbootstrap stats: %s", json.dumps(
+            {"counters": stats["counters"], "timers": stats["timers"]}, sort_keys=True))
+        job[0] = widget.after(interval_ms, tick)
+
+    def stop() -> None:
+        if job[0] is not None:
+            try:
+                widget.after_cancel(job[0])
+            except Exception:
+                pass
+            job[0] = None
+
+    job[0] = widget.after(interval_ms, tick)
+    return stop
@@ -0,0 +1,180 @@
+"""Build a widget tree from a declarative spec (`ttkbootstrap.build`).
+
+A spec is a node or a list of nodes. A node is a tuple ``(type, options)`` or
+``(type, options, children)``, or a dict with a ``"type"`` key, a
+``"children"`` list, and the options beside them::
+
+    widgets = ttk.build([
+        ("Label", {"text": "Name", "grid": {"row": 0, "column": 0}}),
+        ("Entry", {"name": "name", "bootstyle": "info",
+                   "grid": {"row": 0, "column": 1, "sticky": "ew"}}),
+        {"type": "Frame", "pack": {"fill": "x"}, "children": [
+            ("Button", {"name": "ok", "text": "OK", "pack": {"side": "right"}}),
+        ]},
+    ], parent=form)
+    widgets["name"].get()
+
+``type`` is a widget class or the name of one exported by ``ttkbootstrap``.
+Among the options, ``name`` is the node's key in the returned map, ``pack`` /
+``grid`` / ``place`` is its geometry (a dict of options, or ``True`` for the
+defaults), and everything else goes to the widget's constructor.
+
+Building a large form this way is cheaper than creating the widgets one by
+one: each distinct bootstyle is resolved once per widget class and handed to
+the other widgets as a ready ttk style name, and the geometry of the whole
+tree is applied in a single Tcl call once every widget exists.
+"""
+import tkinter
+from tkinter.ttk import Combobox as _ttkCombobox
+from typing import Any, Dict, Hashable, List, Sequence, Tuple, Union
+
+from ttkbootstrap import profiling
+from ttkbootstrap.style.bootstyle import BootMixin, FluentGeometryMixin, Style
+
+# Runs a list of Tcl commands in one round trip; the commands are passed as a
+# nested Python tuple, which tkinter hands over as a properly quoted Tcl list.
+_RUN_ALL = ("commands", "foreach command $commands {{*}$command}")
+
+_GEOMETRY_MANAGERS = ("pack", "grid", "place")
+
+# The geometry methods whose Tcl call can be batched; a widget overriding or
+# forwarding them (ScrolledFrame hands `pack` to its container) is placed
+# through its own method instead.
+_PLAIN_GEOMETRY = {
+    "pack": (tkinter.Pack.pack_configure, FluentGeometryMixin.pack_configure),
+    "grid": (tkinter.Grid.grid_configure, FluentGeometryMixin.grid_configure),
+    "place": (tkinter.Place.place_configure, FluentGeometryMixin.place_configure),
+}
+
+Node = Union[Tuple[Any, ...], Dict[str, Any]]
+
+
+def build(spec: Union[Node, Sequence[Node]],
+          parent: tkinter.Misc) -> Dict[str, tkinter.Misc]:
+    """Create the widgets described by `spec` inside `parent`.
+
+    Parameters:
+
+        spec (tuple | dict | list):
+            A node or a list of nodes, as described in the module
+            docstring.
+
+        parent (Widget):
+            The widget the top-level nodes are created in.
+
+    Returns:
+
+        dict[str, Widget]:
+            The widget created for each node that has a ``name``.
+
+    Raises:
+
+        ValueError:
+            If a node is malformed, names an unknown widget type, uses a
+            ``name`` twice, or has more than one geometry manager.
+    """
+    builder = _TreeBuilder(parent)
+    with profiling.span("spec.build"):
+        for node in _nodes(spec):
+            builder.add(node, parent)
+        builder.flush()
+    return builder.named
+
+
+def _nodes(spec: Union[Node, Sequence[Node]]) -> Sequence[Node]:
+    """The nodes of `spec`, which is a single node or a list of them."""
+    if isinstance(spec, dict):
+        return [spec]
+    if isinstance(spec, tuple) and spec and not isinstance(spec[0], (tuple, dict)):
+        return [spec]
+    return spec
+
+
+class _TreeBuilder:
+    """Creates the widgets of one `build` call and queues their geometry."""
+
+    def __init__(self, parent: tkinter.Misc) -> None:
+        self._parent = parent
+        self.named: Dict[str, tkinter.Misc] = {}
+        # (class, bootstyle, orient) -> the ttk style the first widget got
+        self._styles: Dict[Hashable, str] = {}
+        self._geometry: List[Tuple[Any, ...]] = []
+
+    def add(self, node: Node, master: tkinter.Misc) -> tkinter.Misc:
+        cls, options, children = self._parse(node)
+        name = options.pop("name", None)
+        managers = [m for m in _GEOMETRY_MANAGERS if m in options]
+        if len(managers) > 1:
+            raise ValueError(
+                f"A node can use one geometry manager, not {' and '.join(managers)}")
+        geometry = (managers[0], options.pop(managers[0])) if managers else None
+
+        widget = self._create(cls, master, options)
+        if name is not None:
+            if name in self.named:
+                raise ValueError(f"Duplicate widget name in spec: {name!r}")
+            self.named[name] = widget
+        if geometry is not None:
+            self._place(widget, *geometry)
+        for child in _nodes(children):
+            self.add(child, widget)
+        return widget
+
+    @staticmethod
+    def _parse(node: Node) -> Tuple[type, Dict[str, Any], Sequence[Node]]:
+        if isinstance(node, dict):
+            options = dict(node)
+            kind = options.pop("type", None)
+            children = options.pop("children", ())
+        elif isinstance(node, tuple) and 1 <= len(node) <= 3:
+            kind = node[0]
+            options = dict(node[1]) if len(node) > 1 else {}
+            children = node[2] if len(node) > 2 else ()
+        else:
+            raise ValueError(f"Not a widget spec node: {node!r}")
+        if isinstance(kind, str):
+            import ttkbootstrap
+
+            cls = getattr(ttkbootstrap, kind, None)
+        else:
+            cls = kind
+        if not (isinstance(cls, type) and issubclass(cls, tkinter.Misc)):
+            raise ValueError(f"Unknown widget type in spec: {kind!r}")
+        return cls, options, children
+
+    def _create(self, cls: type, master: tkinter.Misc,
+                options: Dict[str, Any]) -> tkinter.Misc:
+        # Only widgets built by BootMixin's own constructor take the resolved
+        # style; a composite widget routes `bootstyle` its own way.
+        if cls.__init__ is not BootMixin.__init__ or "style" in options:
+            return cls(master, **options)
+        key = (cls, options.get("bootstyle") or "", options.get("orient"))
+        ttkstyle = self._styles.get(key)
+        if ttkstyle is None:
+            widget = cls(master, **options)
+            self._styles[key] = str(widget.cget("style"))
+            return widget
+        options.pop("bootstyle", None)
+        widget = cls(master, _ttkstyle=ttkstyle, **options)
+        if isinstance(widget, _ttkCombobox):
+            # the per-widget part of resolving a combobox's style
+            Style.get_instance()._get_builder().defer_combobox_popdown_style(widget)
+        return widget
+
+    def _place(self, widget: tkinter.Misc, manager: str, options: Any) -> None:
+        options = {} if options is True else dict(options)
+        method = getattr(widget, f"{manager}_configure", None)
+        if (getattr(method, "__self__", None) is widget
+                and getattr(method, "__func__", None) in _PLAIN_GEOMETRY[manager]):
+            self._geometry.append(
+                (manager, "configure", widget._w, *widget._options(options)))
+            return
+        # Keep the placement order: queued commands run before this one.
+        self.flush()
+        getattr(widget, manager)(**options)
+
+    def flush(self) -> None:
+        """Run the queued geometry commands in one Tcl call."""
+        if self._geometry:
+            commands, self._geometry = tuple(self._geometry), []
+            self._parent.tk.call("apply", _RUN_ALL, commands)
@@ -9,12 +9,78 @@ inputs, so a key cannot drift from the pixels it names.
 The renderer uses adaptive supersampling, LANCZOS downscaling, and sharpening
 while preserving exact root-scaled output dimensions. Callers pass logical UI
 sizes.
+
+Rendering is pure PIL work up to the final `PhotoImage`. While the engine
+batches a build (`Style.batched_rendering`), each cache miss is handed a blank
+`PhotoImage` of its final size at once -- the style gets its image name
+immediately -- and its pixels are rendered on a small thread pool, then pasted
+in on the Tk thread when the batch ends.
 """
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 from PIL import Image, ImageDraw, ImageFilter, ImageTk
 from PIL.Image import Resampling
 
 from ttkbootstrap.style.elements import RecolorRenderer, RecolorResult
 
+# Worker threads for batched renders. PIL releases the GIL in resize, filter,
+# point and merge, so a few threads render a theme's assets in parallel. A
+# process pool is no fit: the draw callbacks are closures and cannot be pickled.
+_MAX_RENDER_WORKERS = min(4, os.cpu_count() or 1)
+_render_pool = None
+_render_pool_lock = threading.Lock()
+
+
+def _get_render_pool():
+    """The shared render pool, created on first use."""
+    global _render_pool
+    if _render_pool is None:
+        with _render_pool_lock:
+            if _render_pool is None:
+                _render_pool = ThreadPoolExecutor(
+                    max_workers=_MAX_RENDER_WORKERS,
+                    thread_name_prefix="ttkbootstrap-render",
+                )
+    return _render_pool
+
+
+class _RenderBatch:
+    """Cache misses collected during one build, rendered off the Tk thread.
+
+    `submit` returns a blank `PhotoImage` of the final size and queues the
+    render; `finish` (on the Tk thread) pastes the rendered pixels into each.
+    The batch ends before control returns to the event loop, so no image is
+    ever displayed blank.
+    """
+
+    def __init__(self):
+        self._jobs = []
+
+    def __len__(self):
+        return len(self._jobs)
+
+    def submit(self, key, size, render):
+        photo = ImageTk.PhotoImage("RGBA", tuple(size))
+        future = _get_render_pool().submit(render)
+        self._jobs.append((key, photo, future))
+        return photo
+
+    def finish(self):
+        """Paste every rendered image; return the failed keys and first error."""
+        failed = []
+        error = None
+        for key, photo, future in self._jobs:
+            try:
+                photo.paste(future.result())
+            except Exception as exc:
+                failed.append(key)
+                if error is None:
+                    error = exc
+        self._jobs = []
+        return failed, error
+
 def _oversample(w, h):
     """Adaptive supersample factor by the larger dimension: 3x below 32px, 2x below 64px, else 1x."""
     longest = max(w, h)
@@ -32,7 +98,7 @@ def _render(size, draw_fn):
     `ImageDraw.Draw` over the oversampled `(w, h)` canvas (final size x the
     adaptive factor), so any coordinates are expressed relative to the canvas it
     is handed. After the LANCZOS downscale an UnsharpMask restores edge
-    crispness. Returns a `PhotoImage`.
+    crispness. Returns the RGBA `Image`; safe to call off the Tk thread.
     """
     w, h = size
     factor = _oversample(w, h)
@@ -42,7 +108,7 @@ def _render(size, draw_fn):
     if factor > 1:
         img = img.resize((w, h), Resampling.LANCZOS)
         img = img.filter(ImageFilter.UnsharpMask(radius=0.6, percent=60, threshold=0))
-    return ImageTk.PhotoImage(img)
+    return img
 
 
 class Assets:
@@ -69,13 +135,11 @@ class Assets:
         width = self.scaling.logical(width, minimum=1 if width > 0 else 0)
         key = ("circle", fill, size, outline, width)
 
-        def factory():
-            def draw(d, w, h):
-                ow = round(width * w / size[0]) if width else 0
-                d.ellipse((0, 0, w - 1, h - 1), fill=fill, outline=outline, width=ow)
-            return _render(size, draw)
+        def draw(d, w, h):
+            ow = round(width * w / size[0]) if width else 0
+            d.ellipse((0, 0, w - 1, h - 1), fill=fill, outline=outline, width=ow)
 
-        return self.style._get_or_create_image(key, factory)
+        return self.style._get_or_render_image(key, size, lambda: _render(size, draw))
 
     def rounded_rect(self, fill, size, radius, *, outline=None, width=0):
         """A rounded rectangle with geometry in logical UI units."""
@@ -84,16 +148,14 @@ class Assets:
         width = self.scaling.logical(width, minimum=1 if width > 0 else 0)
         key = ("rounded_rect", fill, size, radius, outline, width)
 
-        def factory():
-            def draw(d, w, h):
-                factor = w / size[0]
-                r = round(radius * factor)
-                ow = round(width * factor) if width else 0
-                d.rounded_rectangle((0, 0, w - 1, h - 1), radius=r, fill=fill,
-                                    outline=outline, width=ow)
-            return _render(size, draw)
+        def draw(d, w, h):
+            factor = w / size[0]
+            r = round(radius * factor)
+            ow = round(width * factor) if width else 0
+            d.rounded_rectangle((0, 0, w - 1, h - 1), radius=r, fill=fill,
+                                outline=outline, width=ow)
 
-        return self.style._get_or_create_image(key, factory)
+        return self.style._get_or_render_image(key, size, lambda: _render(size, draw))
 
     def rect(self, fill, size):
         """A solid axis-aligned rectangle (no anti-aliasing, no size snap)."""
@@ -119,8 +181,8 @@ class Assets:
 
         size = self.scaling.image_size(size)
         key = ("icon", name, size, color)
-        return self.style._get_or_create_image(
-            key, lambda: ImageTk.PhotoImage(IconRenderer.render(name, size, color)))
+        return self.style._get_or_render_image(
+            key, size, lambda: IconRenderer.render(name, size, color))
 
     def recolor(self, name, *, white, black, magenta=None, transform=None):
         """Recolor a manifest-backed ttk element raster and cache the result.
@@ -138,10 +200,9 @@ class Assets:
         meta = RecolorRenderer.metadata(name, self.scaling, transform)
         size = (meta.width, meta.height)
         key = ("recolor", name, size, white, black, magenta, transform)
-        image = self.style._get_or_create_image(
-            key,
-            lambda: ImageTk.PhotoImage(RecolorRenderer.render(
-                name, size, white, black, magenta, transform)),
+        image = self.style._get_or_render_image(
+            key, size,
+            lambda: RecolorRenderer.render(name, size, white, black, magenta, transform),
         )
         return RecolorResult(image=image, meta=meta)
 
@@ -154,7 +215,10 @@ class Assets:
         every color/value the draw closes over; they sit *beside* the draw so the
         key cannot silently drift from it, and the `__qualname__` keeps two
         different draws from colliding on equal `key_parts`.
+
+        Inside a batched build `draw_fn` runs on a render worker thread, so it
+        must only draw -- no Tk calls.
         """
         size = self.scaling.image_size(size)
         key = (draw_fn.__qualname__, size, *key_parts)
-        return self.style._get_or_create_image(key, lambda: _render(size, draw_fn))
+        return self.style._get_or_render_image(key, size, lambda: _render(size, draw_fn))
@@ -10,6 +10,7 @@ import re
 import warnings
 from tkinter import Grid, Pack, Place, TclError, ttk
 
+from ttkbootstrap import profiling
 from ttkbootstrap.constants import (
     BOOTSTYLE_COLORS,
     BOOTSTYLE_MODIFIERS,
@@ -504,6 +505,7 @@ class Bootstyle:
         prefix never warns/raises, matching the lenient handling of other unknown
         style-name segments.
         """
+        profiling.count("bootstyle.parse")
         if _looks_like_style_name(style_string):
             color, modifier, base, orient, surface = (
                 _classify_style_name(style_string)
@@ -826,16 +828,14 @@ class Bootstyle:
             if style.style_exists_in_theme(plain):
                 ttkstyle = plain
 
-        # Repaint the combobox popdown. It is a Tcl-level toplevel that the
-        # theme walk's winfo_children() DFS cannot reach, so it is refreshed
-        # here instead -- the walk calls this method for every ttk widget on a
-        # theme change, which keeps the popdown in sync without a subscription.
-        try:
-            if widget.winfo_class() == "TCombobox":
-                builder: StyleBuilderTTK = style._get_builder()
-                builder.update_combobox_popdown_style(widget)
-        except (AttributeError, TclError):
-            pass
+        # The combobox popdown is a Tcl-level toplevel that the theme walk's
+        # winfo_children() DFS cannot reach. Rather than creating and
+        # repainting it here for every combobox -- the walk calls this method
+        # for every ttk widget on a theme change -- it is restyled when next
+        # posted if the theme or style changed since (the family from the
+        # parse saves a `winfo_class` round trip).
+        if family == "combobox" and isinstance(widget, ttk.Combobox):
+            style._get_builder().defer_combobox_popdown_style(widget)
 
         return ttkstyle
 
@@ -1093,13 +1093,21 @@ class BootMixin(FluentGeometryMixin, BusyMixin):
         # size defaults inside apply_icon (icon-only-aware); None = "not given"
         icon_size = kwargs.pop("icon_size", None)
         icon_only = kwargs.pop("icon_only", False)
+        # An already-resolved ttk style name (`ttkbootstrap.build` resolves
+        # each distinct bootstyle once and hands the name to the rest), set
+        # by the constructor itself rather than by a second configure call.
+        resolved = kwargs.pop("_ttkstyle", None)
+        if resolved is not None:
+            kwargs["style"] = resolved
 
         # instantiate the underlying ttk widget first so winfo_class() is
         # available to the resolver below
         super().__init__(*args, **kwargs)
 
         try:
-            if style:
+            if resolved is not None:
+                pass
+            elif style:
                 if Style.get_instance().style_exists_in_theme(style):
                     super().configure(style=style)
                 else:
@@ -1,12 +1,18 @@
 """TTK combobox style recipes."""
 
 import tkinter as tk
+from functools import partial
 
 from ttkbootstrap.constants import *
 from ttkbootstrap.style import StyleBuilderTTK
 from ttkbootstrap.style.layout import El, image_element, layout
 from ttkbootstrap.style.builders.registry import register_builder
 
+# Bind tag placed ahead of the `TCombobox` class tag; its bindings restyle a
+# stale popdown just before the class bindings post it.
+_POPDOWN_TAG = "TtkbootstrapPopdown"
+_POPDOWN_HOOK_ATTRIBUTE = "_ttkbootstrap_popdown_hook"
+
 
 @register_builder("default", "combobox")
 def build_combobox_style(builder: StyleBuilderTTK, colorname=DEFAULT):
@@ -102,7 +108,8 @@ def build_combobox_style(builder: StyleBuilderTTK, colorname=DEFAULT):
 
 def update_combobox_popdown_style(builder: StyleBuilderTTK, widget):
     """Update the legacy ttk.Combobox elements. This method is
-    called every time the theme is changed in order to ensure
+    called before the popdown is posted for the first time under a
+    theme (see `defer_combobox_popdown_style`) in order to ensure
     that the legacy tkinter components embedded in this ttk widget
     are styled appropriate to the current theme.
 
@@ -138,3 +145,51 @@ def update_combobox_popdown_style(builder: StyleBuilderTTK, widget):
     if not builder.style.style_exists_in_theme(sb_style):
         builder.build_style("thin", "scrollbar", DEFAULT, required=True)
     widget.tk.call(f"{popdown}.f.sb", "configure", "-style", sb_style)
+
+
+def defer_combobox_popdown_style(widget):
+    """Style the popdown of `widget` when it is next posted.
+
+    Creating and configuring the popdown eagerly costs a toplevel, a
+    listbox and a scrollbar per combobox, most of which are never
+    opened. Instead the combobox gets a bind tag whose press and
+    `<Down>` bindings run before the class bindings that post the
+    popdown; they restyle it when the theme version or the combobox
+    style changed since it was last styled. Calling this again for the
+    same widget is a no-op.
+
+    Parameters:
+
+        widget (ttk.Combobox):
+            The combobox whose popdown is styled on demand.
+    """
+    if getattr(widget, "_popdown_deferred", False):
+        return
+    root = widget._root()
+    if not getattr(root, _POPDOWN_HOOK_ATTRIBUTE, None):
+        command = root.register(partial(_style_popdown_before_post, root))
+        for sequence in ("<ButtonPress-1>", "<KeyPress-Down>"):
+            root.tk.call("bind", _POPDOWN_TAG, sequence, f"{command} %W")
+        setattr(root, _POPDOWN_HOOK_ATTRIBUTE, command)
+    tags = list(root.tk.splitlist(root.tk.call("bindtags", widget._w)))
+    if _POPDOWN_TAG not in tags:
+        position = tags.index("TCombobox") if "TCombobox" in tags else 1
+        tags.insert(position, _POPDOWN_TAG)
+        root.tk.call("bindtags", widget._w, tuple(tags))
+    widget._popdown_deferred = True
+
+
+def _style_popdown_before_post(root, path):
+    """Restyle the popdown of the combobox at `path` if it is stale."""
+    # local import: the engine loads the builder modules
+    from ttkbootstrap.style.engine import Style
+
+    style = Style.get_instance()
+    try:
+        widget = root.nametowidget(path)
+        key = (style._theme_version, str(widget.cget("style")))
+    except (KeyError, tk.TclError):
+        return
+    if getattr(widget, "_popdown_styled", None) != key:
+        update_combobox_popdown_style(style._get_builder(), widget)
+        widget._popdown_styled = key
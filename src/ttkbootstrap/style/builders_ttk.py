@@ -3,6 +3,7 @@
 from difflib import get_close_matches
 from tkinter import ttk
 
+from ttkbootstrap import profiling
 from ttkbootstrap.constants import *
 from ttkbootstrap.style._compat import report_invalid
 from ttkbootstrap.style.assets import Assets
@@ -268,7 +269,15 @@ class StyleBuilderTTK:
         prev_surface = self._surface
         self._surface = surface or ""
         try:
-            recipe(self, colorname)
+            # A recipe requests several assets (one per state, typically); the
+            # batch renders them side by side instead of one after another.
+            label = f"{variant}.{widget_family}"
+            with (
+                profiling.span("style.build", label=label, color=colorname),
+                profiling.count_tcl_calls(self.style, "style.build.tcl", label=label),
+                self.style.batched_rendering(),
+            ):
+                recipe(self, colorname)
         finally:
             self._surface = prev_surface
         return True
@@ -376,3 +385,12 @@ class StyleBuilderTTK:
         )
 
         update_combobox_popdown_style(self, widget)
+
+    def defer_combobox_popdown_style(self, widget):
+        """Style a Combobox popdown when it is next posted; see the family module."""
+        load_builders()
+        from ttkbootstrap.style.builders.combobox import (
+            defer_combobox_popdown_style,
+        )
+
+        defer_combobox_popdown_style(widget)
@@ -6,18 +6,35 @@ content-addressed image cache. Split out of the monolithic `style.py` in 2.0.
 """
 import json
 import warnings
+from contextlib import contextmanager
+from functools import lru_cache
 from tkinter import TclError, ttk
 from typing import Any, Optional
 
+from PIL import ImageTk
+
+from ttkbootstrap import profiling
 from ttkbootstrap.internal import utility as util
 from ttkbootstrap.constants import *
 from ttkbootstrap.themes.standard import LEGACY_THEME_ALIASES, STANDARD_THEMES
 
 from ttkbootstrap.style.theme import ThemeDefinition
 from ttkbootstrap.style.scaling import Scaling
+from ttkbootstrap.style.assets import _RenderBatch
 from ttkbootstrap.style.builders_ttk import StyleBuilderTTK
 
 
+def _image_args(args):
+    """The image names in `element_create` image args, in order.
+
+    Args are a default image followed by ``(state..., image)`` specs.
+    """
+    names = []
+    for arg in args:
+        names.append(str(arg[-1] if isinstance(arg, (tuple, list)) else arg))
+    return names
+
+
 # Geometry/layout options a user's `style.configure(...)` may set that should
 # SURVIVE variant builds and theme switches (the durable style-options layer,
 # #1238/#1161). Colors are deliberately excluded: they stay theme-reactive, so a
@@ -116,6 +133,14 @@ class Style(ttk.Style):
         # icon's own computed values (e.g. stretch a square `icon_only` control).
         # See #1284.
         self._derived_styles = set()
+        # Bookkeeping that keeps the replay proportional to what a build
+        # touched: each registered style under every one of its base classes
+        # (base -> built variants), the themes whose style DB already holds
+        # every override, and the overridden names a recipe has written over
+        # since the last replay.
+        self._style_descendants = {}
+        self._replayed_themes = set()
+        self._clobbered = set()
         self._theme_names = set()
         # Optional designated light/dark theme pair for the theme_mode setter /
         # toggle_theme(); None means "derive from the -light/-dark naming".
@@ -132,6 +157,18 @@ class Style(ttk.Style):
         # dedupe and are rendered once. Replaces the per-builder theme_images
         # dicts that pinned a fresh PhotoImage per theme (the image leak).
         self._image_cache = {}
+        # The open render batch (see `batched_rendering`), or None when asset
+        # renders run inline.
+        self._render_batch = None
+        # Scaling-change bookkeeping (see `_on_scaling_change`): the image args
+        # each image element was created with, per (theme, element); the
+        # themes whose Tcl style DB still holds old-factor geometry; the
+        # (old, new) image pairs to repaint while one of them is rebuilt; and
+        # the images retired from the cache, by Tcl name.
+        self._element_images = {}
+        self._rescale_pending = set()
+        self._image_copies = None
+        self._retired_images = {}
         # Callbacks run after every theme change (register via on_theme_change),
         # so a custom style can rebuild itself against the new theme's colors.
         self._theme_change_callbacks = []
@@ -140,6 +177,7 @@ class Style(ttk.Style):
         self._dynamic_foreground = False
         super().__init__()
         self.scaling = Scaling.for_widget(self.master)
+        self.scaling.on_change(self._on_scaling_change)
 
         Style.instance = self
 
@@ -311,54 +349,62 @@ class Style(ttk.Style):
         # counterpart pass through unchanged to the legacy-dict path below.
         if themename not in existing_themes and themename not in self._theme_names:
             themename = self._resolve_theme_alias(themename)
-        if themename in existing_themes:
-            self.theme = self._theme_definitions.get(themename)
-            super().theme_use(themename)
-            # Repeat visit to an already-built theme: the walk below only
-            # rebuilds styles that mounted widgets reference, so a durable
-            # override on a style with no mounted widget is never replayed into
-            # this theme's style DB. Replay them here so an override survives a
-            # switch to any previously-visited theme, not just a first visit.
-            self._reapply_user_options_for_theme(themename)
-        # setup a new theme
-        elif themename in self._theme_names:
-            self.theme = self._theme_definitions.get(themename)
-            # Creating the builder also runs theme_create + theme_use for the
-            # new theme and builds its default (".") styles.
-            self._theme_objects[themename] = StyleBuilderTTK()
-        elif themename in STANDARD_THEMES:
-            # Legacy (pre-2.0) name: lazily adapt+register just this one theme
-            # so the first line of ~every existing app
-            # (Window(themename="darkly")) keeps working, warn once, then fall
-            # through to the normal build path below. The full legacy catalog
-            # stays opt-in via install_legacy_themes() (bulk register, so
-            # theme_names()/ttkcreator can enumerate it).
-            from ttkbootstrap.themes.legacy import theme_from_legacy_dict
+        # Batch the asset renders of the whole switch -- the new theme's
+        # default styles and every style the walk rebuilds -- so they render in
+        # parallel (see `batched_rendering`).
+        with self._rescaling(themename) as rescaled, self.batched_rendering():
+            if themename in existing_themes:
+                self.theme = self._theme_definitions.get(themename)
+                super().theme_use(themename)
+                if rescaled:
+                    # Built at an older scaling factor: redo the eager
+                    # defaults; the walk below rebuilds the mounted styles.
+                    self._theme_objects[themename].update_ttk_theme_settings()
+                # Repeat visit to an already-built theme: the walk below only
+                # rebuilds styles that mounted widgets reference, so a durable
+                # override on a style with no mounted widget is never replayed into
+                # this theme's style DB. Replay them here so an override survives a
+                # switch to any previously-visited theme, not just a first visit.
+                self._reapply_user_options_for_theme(themename)
+            # setup a new theme
+            elif themename in self._theme_names:
+                self.theme = self._theme_definitions.get(themename)
+                # Creating the builder also runs theme_create + theme_use for the
+                # new theme and builds its default (".") styles.
+                self._theme_objects[themename] = StyleBuilderTTK()
+            elif themename in STANDARD_THEMES:
+                # Legacy (pre-2.0) name: lazily adapt+register just this one theme
+                # so the first line of ~every existing app
+                # (Window(themename="darkly")) keeps working, warn once, then fall
+                # through to the normal build path below. The full legacy catalog
+                # stays opt-in via install_legacy_themes() (bulk register, so
+                # theme_names()/ttkcreator can enumerate it).
+                from ttkbootstrap.themes.legacy import theme_from_legacy_dict
 
-            warnings.warn(
-                f"{themename!r} is a legacy (pre-2.0) theme name, kept as a "
-                f"migration convenience and planned for removal in 3.0; prefer "
-                f"a 2.0 theme (see Style.theme_names()).",
-                DeprecationWarning,
-                stacklevel=2,
-            )
-            self.register_theme(
-                theme_from_legacy_dict(themename, STANDARD_THEMES[themename])
-            )
-            self.theme = self._theme_definitions.get(themename)
-            # Creating the builder also runs theme_create + theme_use for the
-            # new theme and builds its default (".") styles.
-            self._theme_objects[themename] = StyleBuilderTTK()
-        else:
-            raise TclError(themename, "is not a valid theme.")
+                warnings.warn(
+                    f"{themename!r} is a legacy (pre-2.0) theme name, kept as a "
+                    f"migration convenience and planned for removal in 3.0; prefer "
+                    f"a 2.0 theme (see Style.theme_names()).",
+                    DeprecationWarning,
+                    stacklevel=2,
+                )
+                self.register_theme(
+                    theme_from_legacy_dict(themename, STANDARD_THEMES[themename])
+                )
+                self.theme = self._theme_definitions.get(themename)
+                # Creating the builder also runs theme_create + theme_use for the
+                # new theme and builds its default (".") styles.
+                self._theme_objects[themename] = StyleBuilderTTK()
+            else:
+                raise TclError(themename, "is not a valid theme.")
 
-        # Repaint the live widget tree for the new theme. Each theme has its
-        # own clam-derived Tcl style DB, so a style configured under one theme
-        # is invisible under another; the walk rebuilds the (theme, style)
-        # pairs that mounted widgets actually reference -- O(mounted), not
-        # O(all-styles-ever-used) -- and restyles legacy tk widgets inline.
-        self._theme_version += 1
-        self._theme_walk()
+            # Repaint the live widget tree for the new theme. Each theme has its
+            # own clam-derived Tcl style DB, so a style configured under one theme
+            # is invisible under another; the walk rebuilds the (theme, style)
+            # pairs that mounted widgets actually reference -- O(mounted), not
+            # O(all-styles-ever-used) -- and restyles legacy tk widgets inline.
+            self._theme_version += 1
+            self._theme_walk()
 
         # Let theme-aware custom styles rebuild against the new theme. Run after
         # the walk so the new theme's colors/styles are fully live. The guard
@@ -663,6 +709,9 @@ class Style(ttk.Style):
     def _build_configure(self, style, **kw):
         """Calls configure of superclass; used by style builder classes."""
         super().configure(style, **kw)
+        if style in self._user_options:
+            # a recipe wrote over a durable override; the next replay restores it
+            self._clobbered.add(style)
 
     def element_create(self, elementname, etype, *args, **kw):
         """Create a ttk element, idempotently within the current theme.
@@ -678,23 +727,85 @@ class Style(ttk.Style):
         element create makes the whole recipe re-runnable.
         """
         if elementname in self.element_names():
+            if etype == "image" and self._image_copies is not None:
+                self._queue_element_repaint(elementname, args)
             return
         super().element_create(elementname, etype, *args, **kw)
+        if etype == "image" and self.theme is not None:
+            self._element_images[(self.theme.name, elementname)] = args
+
+    # -- scaling changes ---------------------------------------------------- #
+
+    def _on_scaling_change(self, old, new):
+        """Rebuild styles and assets for a new scaling factor.
+
+        Registered with `Scaling.on_change`. Every built style carries the old
+        geometry, so each theme's registry is forgotten: the active theme is
+        rebuilt now, the others the next time `theme_use` visits them. Cached
+        images are sized for the old factor and leave the cache; the ones that
+        image elements show are repainted in place as their theme is rebuilt,
+        since a ttk element cannot be redefined. All of them are kept alive:
+        canvases, widgets and callers holding an asset name may still show an
+        old image, and Tk deletes it with its last `PhotoImage` reference.
+        """
+        self._retired_images.update(self._image_cache.values())
+        self._image_cache.clear()
+        for styles in self._theme_styles.values():
+            styles.clear()
+        self._rescale_pending = set(self._theme_objects)
+        if self.theme is not None and self.theme.name in self._rescale_pending:
+            self.theme_use(self.theme.name)
+
+    @contextmanager
+    def _rescaling(self, themename):
+        """Rebuild `themename` for the current scaling factor, if it is stale.
+
+        Yields whether the theme needs the rebuild. Inside the block, a recipe
+        re-creating an existing image element records its old and new images;
+        on exit -- after the render batch has filled the new pixels in -- the
+        old images are repainted with the new ones, so the elements (still
+        bound to the old image names) show the new size.
+        """
+        if themename not in self._rescale_pending:
+            yield False
+            return
+        self._rescale_pending.discard(themename)
+        copies = self._image_copies = []
+        try:
+            yield True
+        finally:
+            self._image_copies = None
+        for old, new in copies:
+            try:
+                self.tk.call(old, "configure", "-width", 0, "-height", 0)
+                self.tk.call(old, "blank")
+                self.tk.call(old, "copy", new, "-shrink", "-compositingrule", "set")
+            except TclError:
+                pass  # the old image is gone; nothing shows it any more
+
+    def _queue_element_repaint(self, elementname, args):
+        """Pair the images of an existing element with a rebuild's new ones."""
+        before = self._element_images.get((self.theme.name, elementname))
+        if before is None:
+            return
+        for old, new in zip(_image_args(before), _image_args(args)):
+            if old != new:
+                self._image_copies.append((old, new))
 
     def _load_themes(self, EXTERNAL_THEMES=None):
         """Register the curated 2.0 theme catalog.
 
         The built-in catalog is the curated semantic-anchor `Theme` families
         (`themes/builtin.py`), each generating a `<name>-light`/`<name>-dark`
-        pair. Legacy 16-key dicts passed as `EXTERNAL_THEMES` are adapted through
-        the compat quarantine so they keep working. The full pre-2.0 name catalog
-        is opt-in via `ttkbootstrap.install_legacy_themes()`.
+        pair; their colors are read precomputed from the theme bundle. Legacy
+        16-key dicts passed as `EXTERNAL_THEMES` are adapted through the compat
+        quarantine so they keep working. The full pre-2.0 name catalog is
+        opt-in via `ttkbootstrap.install_legacy_themes()`.
         """
-        from ttkbootstrap.themes.builtin import CURATED_THEMES
+        from ttkbootstrap.themes.builtin import curated_definitions
 
-        for theme in CURATED_THEMES:
-            for definition in theme.to_definitions():
-                self.register_theme(definition)
+        for definition in curated_definitions():
+            self.register_theme(definition)
 
         # Legacy 16-key dicts (caller-provided), cleaned through the compat adapter.
         if EXTERNAL_THEMES:
@@ -713,7 +824,10 @@ class Style(ttk.Style):
             ttkstyle (str):
                 The name of the ttk style to register.
         """
-        self._style_registry.add(ttkstyle)
+        if ttkstyle not in self._style_registry:
+            self._style_registry.add(ttkstyle)
+            for name in self._style_ancestors(ttkstyle)[:-1]:
+                self._style_descendants.setdefault(name, set()).add(ttkstyle)
         theme = self.theme.name
         self._theme_styles[theme].add(ttkstyle)
         # A recipe just (re)built this style, overwriting any user override with
@@ -734,32 +848,63 @@ class Style(ttk.Style):
         if not recorded:
             return
         self._user_options.setdefault(style, {}).update(recorded)
-        for built in list(self._theme_styles.get(self.theme.name, ())):
-            # Derived styles are skipped inside _reapply_user_options (#1284), so
-            # the retroactive path needs no separate guard here.
-            if built != style and style in self._style_ancestors(built):
-                self._reapply_user_options(built)
+        theme = self.theme.name
+        # The caller writes the override into the active theme only; every
+        # other theme picks it up on its next replay.
+        self._replayed_themes &= {theme}
+        theme_styles = self._theme_styles.get(theme, ())
+        for built in self._style_descendants.get(style, ()):
+            # Derived styles own their computed values (#1284).
+            if built in theme_styles and built not in self._derived_styles:
+                self._apply_ancestor_options(built)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _style_ancestors(style):
         """ttk's dotted-name resolution chain, least- to most-specific.
 
-        ``"danger.Outline.TButton"`` -> ``["TButton", "Outline.TButton",
-        "danger.Outline.TButton"]``. Mirrors ttk stripping leading tokens, so an
-        override set on the base class fans out to its variants (#1238).
+        ``"danger.Outline.TButton"`` -> ``("TButton", "Outline.TButton",
+        "danger.Outline.TButton")``. Mirrors ttk stripping leading tokens, so an
+        override set on the base class fans out to its variants (#1238). The
+        chain of a name is computed once.
         """
         parts = style.split(".")
-        return [".".join(parts[i:]) for i in range(len(parts) - 1, -1, -1)]
+        return tuple(".".join(parts[i:]) for i in range(len(parts) - 1, -1, -1))
+
+    def _apply_ancestor_options(self, style):
+        """Write the overrides of `style` and its base classes onto `style`.
+
+        Merged most-specific-wins into one write. Returns the names whose
+        overrides went into it.
+        """
+        merged = {}
+        handled = set()
+        for name in self._style_ancestors(style):
+            opts = self._user_options.get(name)
+            if opts:
+                merged.update(opts)
+                handled.add(name)
+        if merged:
+            super().configure(style, **merged)
+        return handled
+
+    def _replay_user_options(self, names):
+        """Restore the overrides recorded on `names` onto their own names."""
+        for name in names:
+            opts = self._user_options.get(name)
+            if opts:
+                super().configure(name, **opts)
 
     def _reapply_user_options(self, built_style=None):
         """Replay durable user overrides after a style (re)build.
 
         For ``built_style``, overrides recorded on it AND on its base-class
         ancestors are merged most-specific-wins and applied in one write (the
-        base-class fan-out). Every other recorded override is restored onto its
-        own name, which also covers un-namespaced globals like ``"Sash"`` that
-        any build clobbers (#1161). Writes go through ``_build_configure`` (the
-        internal path), so they are not re-recorded.
+        base-class fan-out). Other overrides are restored onto their own name,
+        which also covers un-namespaced globals like ``"Sash"`` that a build
+        clobbers (#1161): all of them the first time the active theme replays,
+        after that only those a recipe wrote over since. Writes bypass
+        ``configure`` (the public path), so they are not re-recorded.
         """
         if not self._user_options:
             return
@@ -769,48 +914,40 @@ class Style(ttk.Style):
         # nothing else to replay onto it either.
         if built_style in self._derived_styles:
             return
-        handled = set()
-        if built_style:
-            merged = {}
-            for name in self._style_ancestors(built_style):
-                opts = self._user_options.get(name)
-                if opts:
-                    merged.update(opts)
-                    handled.add(name)
-            if merged:
-                self._build_configure(built_style, **merged)
-        for name, opts in self._user_options.items():
-            if name not in handled and opts:
-                self._build_configure(name, **opts)
+        handled = self._apply_ancestor_options(built_style) if built_style else set()
+        pending, self._clobbered = self._clobbered, set()
+        theme = self.theme.name
+        if theme not in self._replayed_themes:
+            self._replayed_themes.add(theme)
+            pending = self._user_options
+        self._replay_user_options([name for name in pending if name not in handled])
 
     def _reapply_user_options_for_theme(self, themename):
         """Replay durable overrides across a theme's registered styles.
 
         Used when `theme_use` re-visits an already-built theme (the walk only
         rebuilds mounted styles, so unmounted ones keep the recipe defaults in
-        this theme's style DB). Each registered style gets its base-class
-        ancestors merged most-specific-wins, and any recorded name not covered
-        that way -- an un-namespaced global like ``"Sash"``, or a base whose
-        widget has not mounted under this theme -- is restored onto its own
-        name. Mirrors `_reapply_user_options` but scoped to a whole theme.
+        this theme's style DB). Each registered style with an overridden base
+        class gets its ancestors merged most-specific-wins, and any recorded
+        name not covered that way -- an un-namespaced global like ``"Sash"``, or
+        a base whose widget has not mounted under this theme -- is restored
+        onto its own name. Mirrors `_reapply_user_options` but scoped to a whole
+        theme.
         """
         if not self._user_options:
             return
+        theme_styles = self._theme_styles.get(themename, ())
+        targets = set()
+        for name in self._user_options:
+            targets.update(self._style_descendants.get(name, ()))
+            targets.add(name)
         handled = set()
-        for style in list(self._theme_styles.get(themename, ())):
-            if style in self._derived_styles:
-                continue
-            merged = {}
-            for name in self._style_ancestors(style):
-                opts = self._user_options.get(name)
-                if opts:
-                    merged.update(opts)
-                    handled.add(name)
-            if merged:
-                self._build_configure(style, **merged)
-        for name, opts in self._user_options.items():
-            if name not in handled and opts:
-                self._build_configure(name, **opts)
+        for style in targets:
+            if style in theme_styles and style not in self._derived_styles:
+                handled |= self._apply_ancestor_options(style)
+        self._clobbered = set()
+        self._replayed_themes.add(themename)
+        self._replay_user_options([name for name in self._user_options if name not in handled])
 
     def _effective_style_option(self, ttk_style, option, default=None):
         """The value `ttk_style` will end up with for `option`.
@@ -864,25 +1001,30 @@ class Style(ttk.Style):
             return
 
         version = self._theme_version
-        stack = [root]
-        while stack:
-            widget = stack.pop()
-            # Honor autostyle=False: such widgets opted out of theming and are
-            # never repainted, but their (autostyled) descendants still are.
-            if not getattr(widget, "_tb_no_autostyle", False):
-                if getattr(widget, "_theme_version", None) != version:
-                    self._repaint_widget(widget)
-                    try:
-                        widget._theme_version = version
-                    except (AttributeError, TypeError):
-                        # Builtin/extension widgets that forbid new attributes
-                        # are simply repainted on every switch -- correct, just
-                        # not skippable.
-                        pass
-            try:
-                stack.extend(widget.winfo_children())
-            except TclError:
-                pass
+        repainted = 0
+        with profiling.span("theme.walk") as span:
+            stack = [root]
+            while stack:
+                widget = stack.pop()
+                # Honor autostyle=False: such widgets opted out of theming and are
+                # never repainted, but their (autostyled) descendants still are.
+                if not getattr(widget, "_tb_no_autostyle", False):
+                    if getattr(widget, "_theme_version", None) != version:
+                        self._repaint_widget(widget)
+                        repainted += 1
+                        try:
+                            widget._theme_version = version
+                        except (AttributeError, TypeError):
+                            # Builtin/extension widgets that forbid new attributes
+                            # are simply repainted on every switch -- correct, just
+                            # not skippable.
+                            pass
+                try:
+                    stack.extend(widget.winfo_children())
+                except TclError:
+                    pass
+            span.set(repainted=repainted)
+        profiling.count("theme.walk.repainted", repainted)
 
     def _repaint_widget(self, widget):
         """Restyle a single widget for the current theme.
@@ -890,7 +1032,8 @@ class Style(ttk.Style):
         ttk widgets ensure their style exists under the active theme (rebuilt
         lazily by the builder if stale); legacy tk widgets re-run their tk
         update method. The combobox popdown -- a Tcl toplevel the DFS cannot
-        reach -- is refreshed inside `update_ttk_widget_style`.
+        reach -- is restyled when next posted (armed inside
+        `update_ttk_widget_style`).
         """
         # local import breaks the engine<-bootstyle cycle (bootstyle imports engine)
         from ttkbootstrap.style.bootstyle import Bootstyle
@@ -926,12 +1069,84 @@ class Style(ttk.Style):
         """
         cached = self._image_cache.get(key)
         if cached is not None:
+            profiling.count("image_cache.hit")
             return cached[0]
-        image = factory()
+        profiling.count("image_cache.miss")
+        with profiling.span("image.render"):
+            image = factory()
         name = util.get_image_name(image)
         self._image_cache[key] = (name, image)
         return name
 
+    def _get_or_render_image(self, key, size, render):
+        """Return the Tcl name of a cached asset image, rendering it on a miss.
+
+        Like `_get_or_create_image`, but `render` returns the PIL image of
+        physical `size` rather than a `PhotoImage`. Outside a batch it runs
+        inline; inside `batched_rendering` it runs on a render worker and the
+        name returned here names a placeholder of the final size, filled in
+        when the batch ends. `render` must therefore be pure PIL work.
+        """
+        cached = self._image_cache.get(key)
+        if cached is not None:
+            profiling.count("image_cache.hit")
+            return cached[0]
+        profiling.count("image_cache.miss")
+        render = profiling.timed("image.render", render)
+        batch = self._render_batch
+        if batch is None:
+            image = ImageTk.PhotoImage(render())
+        else:
+            image = batch.submit(key, size, render)
+        name = util.get_image_name(image)
+        self._image_cache[key] = (name, image)
+        return name
+
+    @contextmanager
+    def batched_rendering(self):
+        """Render the asset cache misses of a block in parallel.
+
+        Inside the block every asset the style recipes request gets its image
+        name at once, while its pixels render on a small thread pool; they are
+        pasted in, on this thread, when the block exits -- before control goes
+        back to the event loop, so nothing is drawn blank. Theme switches and
+        each style build already batch; nested blocks join the outermost one.
+
+        An asset whose render fails is dropped from the cache, and the first
+        such error is raised when the block exits.
+        """
+        if self._render_batch is not None:
+            yield
+            return
+        batch = self._render_batch = _RenderBatch()
+        try:
+            yield
+        finally:
+            self._render_batch = None
+            failed, error = batch.finish()
+            for key in failed:
+                self._image_cache.pop(key, None)
+        if error is not None:
+            raise error
+
+    def stats(self):
+        """A snapshot of the runtime counters and timers (`ttkbootstrap.profiling`).
+
+        Everything is zero until profiling is enabled with
+        ``ttkbootstrap.profiling.enable()``. The snapshot also carries the
+        current image cache size and theme version.
+
+        Returns:
+
+            dict:
+                ``{"enabled", "counters", "timers", "image_cache_size",
+                "theme_version"}``; see `ttkbootstrap.profiling.snapshot`.
+        """
+        stats = profiling.snapshot()
+        stats["image_cache_size"] = len(self._image_cache)
+        stats["theme_version"] = self._theme_version
+        return stats
+
     def clear_image_cache(self):
         """Drop all cached widget asset images.
 
@@ -23,6 +23,7 @@ import hashlib
 import io
 import json
 import re
+import threading
 import tkinter as tk
 from pathlib import Path
 
@@ -90,15 +91,22 @@ class IconRenderer:
     _glyphmap = None        # dict[name -> single-char str]
     _metrics = None         # dict[name -> [left, top, width, height]] (em fractions)
     _font_cache = {}        # dict[int -> FreeTypeFont]
+    # Batched renders run on worker threads, and a FreeType face must not be
+    # used by two threads at once; the glyph draw is serialized, the
+    # downscale and sharpen (the bulk of the work) are not.
+    _text_lock = threading.Lock()
 
     @classmethod
     def _load_assets(cls):
         """Lazy-load the font bytes + the name->character glyphmap (once)."""
         if cls._font_bytes is None:
-            cls._font_bytes = (_ICONS_DIR / "bootstrap.ttf").read_bytes()
+            font_bytes = (_ICONS_DIR / "bootstrap.ttf").read_bytes()
             raw = json.loads(
                 (_ICONS_DIR / "glyphmap.json").read_text(encoding="utf-8"))
+            # The glyphmap first: `_font_bytes` is the loaded flag, and a
+            # render worker may be reading it concurrently.
             cls._glyphmap = {name: chr(cp) for name, cp in raw.items()}
+            cls._font_bytes = font_bytes
         return cls._font_bytes, cls._glyphmap
 
     @classmethod
@@ -169,34 +177,35 @@ class IconRenderer:
                 inner_h / max(nh, 1e-6),
                 float(max(cw, ch)),
             )))
-            font = cls._get_font(font_size)
             ink_w, ink_h = nw * font_size, nh * font_size
             # Snap the draw origin to whole pixels (the fallback branch already
             # does via //) so the ink lands on the grid rather than half-pixels,
             # which softens straight strokes on the LANCZOS downscale.
             dx = round((cw - ink_w) / 2 - nl * font_size)
             dy = round((ch - ink_h) / 2 - nt * font_size + ch * _ICON_Y_BIAS)
-            draw.text((dx, dy), glyph, font=font, fill=color)
+            with cls._text_lock:
+                draw.text((dx, dy), glyph, font=cls._get_font(font_size), fill=color)
         else:
             # Fallback for glyphs absent from icon_metrics.json: measure with
             # getbbox at render time (under-reports full-bleed ink, but always
             # works). Regenerate metrics with tools/generate_icon_metrics.py.
-            eff = max(1, min(cw, ch))
-            font = cls._get_font(eff)
-            ascent, descent = font.getmetrics()
-            bbox = font.getbbox(glyph)
-            gw, gh = bbox[2] - bbox[0], bbox[3] - bbox[1]
-            if gw > inner_w or gh > inner_h:
-                scale = min(inner_w / max(gw, 1), inner_h / max(gh, 1)) * 0.95
-                eff = max(1, int(eff * scale))
+            with cls._text_lock:
+                eff = max(1, min(cw, ch))
                 font = cls._get_font(eff)
                 ascent, descent = font.getmetrics()
                 bbox = font.getbbox(glyph)
                 gw, gh = bbox[2] - bbox[0], bbox[3] - bbox[1]
-            full_h = ascent + descent
-            dx = pad_w + (inner_w - gw) // 2 - bbox[0]
-            dy = pad_h + (inner_h - full_h) // 2 + (ascent - bbox[3]) + int(ch * _ICON_Y_BIAS)
-            draw.text((dx, dy), glyph, font=font, fill=color)
+                if gw > inner_w or gh > inner_h:
+                    scale = min(inner_w / max(gw, 1), inner_h / max(gh, 1)) * 0.95
+                    eff = max(1, int(eff * scale))
+                    font = cls._get_font(eff)
+                    ascent, descent = font.getmetrics()
+                    bbox = font.getbbox(glyph)
+                    gw, gh = bbox[2] - bbox[0], bbox[3] - bbox[1]
+                full_h = ascent + descent
+                dx = pad_w + (inner_w - gw) // 2 - bbox[0]
+                dy = pad_h + (inner_h - full_h) // 2 + (ascent - bbox[3]) + int(ch * _ICON_Y_BIAS)
+                draw.text((dx, dy), glyph, font=font, fill=color)
 
         if factor > 1:
             img = img.resize((w, h), Resampling.LANCZOS)
@@ -343,10 +352,11 @@ def icon_element(style, name, *, size, default, states=None, **options):
             color = _resolve_color(style, color)
         return assets.icon(icon_name, size, color)
 
-    default_image = resolve(default, "")
     state_images = None
-    if states:
-        state_images = {s: resolve(spec, s) for s, spec in states.items()}
+    with style.batched_rendering():
+        default_image = resolve(default, "")
+        if states:
+            state_images = {s: resolve(spec, s) for s, spec in states.items()}
     image_element(style, name, default=default_image, states=state_images, **options)
 
 
@@ -424,22 +434,24 @@ def _build_icon_style(style, base, name, size, states, compound, icon_only=False
         color = style.lookup(base, "foreground", state=state_tokens or None)
         return assets.icon(glyph, size, color or style.colors.fg)
 
-    rest_image = render(states.get("", name), [])
-
-    image_map = []
-    seen = set()
-    for entry in style.map(base, "foreground"):
-        *tokens, _color = entry
-        state_str = " ".join(tokens)
-        if not tokens or state_str in seen:
-            continue
-        seen.add(state_str)
-        image_map.append((state_str, render(states.get(state_str, name), tokens)))
-    # states= keys the base foreground map doesn't remap still need an image
-    for state_str, glyph in states.items():
-        if state_str and state_str not in seen:
+    # One glyph per state: render them as a batch (see Style.batched_rendering).
+    with style.batched_rendering():
+        rest_image = render(states.get("", name), [])
+
+        image_map = []
+        seen = set()
+        for entry in style.map(base, "foreground"):
+            *tokens, _color = entry
+            state_str = " ".join(tokens)
+            if not tokens or state_str in seen:
+                continue
             seen.add(state_str)
-            image_map.append((state_str, render(glyph, state_str.split())))
+            image_map.append((state_str, render(states.get(state_str, name), tokens)))
+        # states= keys the base foreground map doesn't remap still need an image
+        for state_str, glyph in states.items():
+            if state_str and state_str not in seen:
+                seen.add(state_str)
+                image_map.append((state_str, render(glyph, state_str.split())))
 
     config = {"image": rest_image}
     if compound is not None:
@@ -2,7 +2,15 @@
 
 Theme recipes use logical UI units. This service converts them exactly once to
 the physical pixels consumed by Tk and Pillow.
+
+Every recipe and asset converts many sizes, so the Tk scaling value and the
+windowing system are read once per root and cached. A change of ``tk scaling``
+is picked up by `Scaling.refresh` (``enable_high_dpi_awareness`` calls it), or
+by the polling watcher started with `Scaling.watch`; either notifies the
+`on_change` callbacks, which is how the style engine rebuilds its styles and
+assets for the new density.
 """
+import sys
 import tkinter
 from math import ceil, floor
 
@@ -24,6 +32,13 @@ class Scaling:
     def __init__(self, root):
         """Bind the service to `root`'s Tk interpreter."""
         self.root = root
+        # Read lazily, then cached until `refresh`.
+        self._windowing_system = None
+        self._baseline = None
+        self._tk_scaling = None
+        self._factor = None
+        self._callbacks = []
+        self._watch_id = None
 
     @classmethod
     def for_widget(cls, widget):
@@ -39,7 +54,9 @@ class Scaling:
     @property
     def windowing_system(self) -> str:
         """Name of the underlying Tk windowing system (`x11`, `win32`, or `aqua`)."""
-        return str(self.root.tk.call("tk", "windowingsystem"))
+        if self._windowing_system is None:
+            self._windowing_system = str(self.root.tk.call("tk", "windowingsystem"))
+        return self._windowing_system
 
     @property
     def baseline(self) -> float:
@@ -50,13 +67,22 @@ class Scaling:
         wrong baseline scales every asset and every pixel-valued geometry by the
         ratio between them, so the version gate matters as much as the platform.
         """
-        if self.windowing_system == "aqua" and tkinter.TkVersion < 8.7:
-            return 1.0
-        return 4 / 3
+        if self._baseline is None:
+            if self.windowing_system == "aqua" and tkinter.TkVersion < 8.7:
+                self._baseline = 1.0
+            else:
+                self._baseline = 4 / 3
+        return self._baseline
 
     @property
     def tk_scaling(self) -> float:
-        """Current Tk scaling factor, falling back to a fpixels-based estimate."""
+        """Tk scaling factor as of the last `refresh` (read on first use)."""
+        if self._tk_scaling is None:
+            self._tk_scaling = self._read_tk_scaling()
+        return self._tk_scaling
+
+    def _read_tk_scaling(self) -> float:
+        """Query ``tk scaling``, falling back to a fpixels-based estimate."""
         try:
             return float(self.root.tk.call("tk", "scaling"))
         except Exception:
@@ -65,11 +91,99 @@ class Scaling:
     @property
     def factor(self) -> float:
         """Scaling factor relative to `baseline`, snapped to the nearest quarter step when close."""
-        raw = self.tk_scaling / self.baseline
-        quarter = round(raw * 4) / 4
-        if abs(raw - quarter) <= _QUARTER_STEP_TOLERANCE:
-            return quarter
-        return raw
+        if self._factor is None:
+            raw = self.tk_scaling / self.baseline
+            quarter = round(raw * 4) / 4
+            if abs(raw - quarter) <= _QUARTER_STEP_TOLERANCE:
+                self._factor = quarter
+            else:
+                self._factor = raw
+        return self._factor
+
+    # -- density changes ------------------------------------------------------ #
+    def refresh(self) -> bool:
+        """Re-read ``tk scaling`` and report whether the factor changed.
+
+        Call after changing ``tk scaling`` by hand. When the factor changed,
+        every `on_change` callback runs with the old and new factor before
+        this returns.
+        """
+        old = self.factor
+        self._tk_scaling = self._read_tk_scaling()
+        self._factor = None
+        new = self.factor
+        if new == old:
+            return False
+        for callback in list(self._callbacks):
+            callback(old, new)
+        return True
+
+    def on_change(self, callback) -> None:
+        """Run ``callback(old_factor, new_factor)`` whenever `refresh` sees a change."""
+        if callback not in self._callbacks:
+            self._callbacks.append(callback)
+
+    def remove_change_callback(self, callback) -> None:
+        """Unregister a callback added with `on_change` (no-op if absent)."""
+        try:
+            self._callbacks.remove(callback)
+        except ValueError:
+            pass
+
+    def watch(self, interval: int = 1000) -> None:
+        """Poll for display-density changes every `interval` milliseconds.
+
+        Each poll is a single ``tk scaling`` query. On Windows, when the
+        process is per-monitor DPI aware, the poll first sets ``tk scaling``
+        from the DPI of the monitor the root window is on, so moving the
+        window to a display of another density rescales the UI.
+        """
+        self.unwatch()
+
+        def poll():
+            self._watch_id = None
+            try:
+                self._sync_window_dpi()
+                self.refresh()
+                self._watch_id = self.root.after(interval, poll)
+            except tkinter.TclError:
+                pass  # the root is gone
+
+        self._watch_id = self.root.after(interval, poll)
+
+    def unwatch(self) -> None:
+        """Stop the polling started by `watch` (no-op if not watching)."""
+        if self._watch_id is None:
+            return
+        try:
+            self.root.after_cancel(self._watch_id)
+        except tkinter.TclError:
+            pass
+        self._watch_id = None
+
+    @property
+    def watching(self) -> bool:
+        """Whether `watch` is polling."""
+        return self._watch_id is not None
+
+    def _sync_window_dpi(self) -> None:
+        """Set ``tk scaling`` from the root window's monitor DPI (Windows only).
+
+        Tk reads the density once at startup. A per-monitor aware process can
+        ask Windows for the DPI of the window's current monitor; a system
+        aware one gets the (constant) system DPI back, and nothing changes.
+        """
+        if sys.platform != "win32" or self.windowing_system != "win32":
+            return
+        try:
+            from ctypes import windll
+
+            hwnd = int(self.root.wm_frame(), 16)
+            dpi = windll.user32.GetDpiForWindow(hwnd)
+        except Exception:
+            return
+        if dpi and abs(self._read_tk_scaling() - dpi / 72) > 1e-6:
+            self.root.tk.call("tk", "scaling", dpi / 72)
 
     def logical(self, value, *, minimum: int = 0):
         """Convert logical UI units to physical pixels.
@@ -743,6 +743,11 @@ class ThemeDefinition:
 # is populated changes. Mechanism ported from bootstack; the ramp/surface math
 # is the in-repo color-helper code above.
 
+# Bump whenever a change below (or in the color helpers above) alters the
+# colors a `Theme` generates: the curated-theme bundle records the version it
+# was built with, and families built with another version are generated live.
+DERIVATION_VERSION = 1
+
 _ACCENT_ROLES = ("primary", "success", "info", "warning", "danger")
 
 # Which ramp step a SOLID fill uses per mode. On light a darker step reads
@@ -11,7 +11,15 @@ Tokyo Night, One, Everforest); five migrate distinctive ttkbootstrap identities
 and authoring a generated opposite mode. The legacy 40-theme catalog is opt-in
 via `ttkbootstrap.install_legacy_themes()` (see `themes/legacy.py`).
 """
-from ttkbootstrap.style.theme import Theme
+import json
+from dataclasses import fields
+from pathlib import Path
+
+from ttkbootstrap.style.theme import DERIVATION_VERSION, Theme, ThemeDefinition
+
+#: The precomputed colors of every curated family, written by
+#: `tools/generate_theme_bundle.py`.
+BUNDLE_PATH = Path(__file__).with_name("bundle.json")
 
 # --- From bootstack (10) ----------------------------------------------------
 
@@ -145,3 +153,38 @@ CURATED_THEMES = [
     GRUVBOX, DRACULA, TOKYO_NIGHT, ONE, EVERFOREST,
     VAPOR, MINTY, PULSE, UNITED, SANDSTONE,
 ]
+
+
+def theme_inputs(theme):
+    """The declared fields of a `Theme` family and the color-derivation
+    version, as the bundle records them."""
+    inputs = {field.name: getattr(theme, field.name) for field in fields(theme)}
+    inputs["derivation"] = DERIVATION_VERSION
+    return inputs
+
+
+def curated_definitions():
+    """Return the `ThemeDefinition`s of `CURATED_THEMES`, in catalog order.
+
+    The colors come precomputed from ``bundle.json`` rather than from the ramp
+    and contrast math each family would otherwise run at startup. A family
+    whose declared inputs or derivation version differ from the bundled ones
+    -- an edited catalog or color math the bundle was not regenerated for --
+    or a missing or unreadable bundle falls back to generating the
+    definitions live.
+    """
+    try:
+        bundle = json.loads(BUNDLE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        bundle = {}
+    definitions = []
+    for theme in CURATED_THEMES:
+        entry = bundle.get(theme.name)
+        if entry is not None and entry.get("inputs") == theme_inputs(theme):
+            definitions.extend(
+                ThemeDefinition(d["name"], d["colors"], mode=d["mode"])
+                for d in entry["definitions"]
+            )
+        else:
+            definitions.extend(theme.to_definitions())
+    return definitions
@@ -10,7 +10,8 @@ re-exported for `ttk.<tab>` discovery).
 Submodules:
     color     — color-model conversion and manipulation
     fonts     — typography over the standard Tk named fonts
-    scaling   — `enable_high_dpi_awareness`, `scale_size`
+    scaling   — `enable_high_dpi_awareness`, `scale_size`, `refresh_scaling`,
+                `watch_dpi`
     platform  — `windowing_system`
     config    — the deferred-config seam (pre-root setters)
 
@@ -37,7 +38,9 @@ from ttkbootstrap.utils.color import (
 )
 from ttkbootstrap.utils.scaling import (
     enable_high_dpi_awareness,
+    refresh_scaling,
     scale_size,
+    watch_dpi,
 )
 from ttkbootstrap.utils.platform import windowing_system
 from ttkbootstrap.utils.config import (
@@ -75,6 +78,8 @@ __all__ = [
     # scaling
     "enable_high_dpi_awareness",
     "scale_size",
+    "refresh_scaling",
+    "watch_dpi",
     # platform
     "windowing_system",
     # fonts (typography over the standard Tk named fonts)
@@ -13,9 +13,10 @@ Two surfaces:
 
 - `Fonts` -- a namespace of classmethods operating on the *live* root:
   `set_global_family` / `configure` / `describe` / `names` / `create_alias` /
-  `reset`. Each needs an interpreter, so call them after `App()` exists -- a
-  pre-root call raises a clear "too early" `RuntimeError` (it does not spawn a
-  stray root); for the pre-root case use the module-level `set_global_family`.
+  `families` / `refresh_families` / `reset`. Each needs an interpreter, so
+  call them after `App()` exists -- a pre-root call raises a clear "too early"
+  `RuntimeError` (it does not spawn a stray root); for the pre-root case use
+  the module-level `set_global_family`.
 - `set_global_family(family, *, mono_family=None)` -- the headline one-liner as
   a **module-level** function that rides the deferred-config seam (Slice 5): set
   it at the top of a file before `App()` and it applies when the root comes up;
@@ -48,6 +49,11 @@ MONOSPACE_FONTS = ("TkFixedFont",)
 # `Fonts.reset()` (wired into `App.destroy`) clears the cache proactively.
 _font_cache: "dict[str, font.Font]" = {}
 
+# The root attribute the installed font families are cached under. Enumerating
+# the font system is slow (thousands of families on a typical desktop), so it
+# is done once per root and re-done only on request.
+_FAMILIES_ATTRIBUTE = "_ttkbootstrap_font_families"
+
 
 def _named_font(name: str) -> font.Font:
     """Return the `font.Font` wrapper for named font `name` on the live root."""
@@ -152,6 +158,41 @@ class Fonts:
                 continue
         return result
 
+    @classmethod
+    def families(cls, refresh: bool = False) -> "tuple[str, ...]":
+        """Return the font families installed on the system, sorted.
+
+        The font system is enumerated once per root and cached; later calls
+        are free. Pass `refresh=True` to re-read it now, or call
+        `refresh_families` to re-read it when the application is next idle.
+        """
+        from ttkbootstrap.window import get_default_root
+
+        root = get_default_root("list font families")
+        cached = getattr(root, _FAMILIES_ATTRIBUTE, None)
+        if cached is None or refresh:
+            families = tuple(sorted(set(font.families(root))))
+            if families != cached:  # keep the old tuple when nothing changed
+                cached = families
+                setattr(root, _FAMILIES_ATTRIBUTE, cached)
+        return cached
+
+    @classmethod
+    def refresh_families(cls) -> None:
+        """Re-read the installed font families when the application is next idle.
+
+        Picks up fonts installed while the app runs without making the next
+        `families` call pay for the enumeration. Repeated calls before the
+        idle pass share one refresh.
+        """
+        from ttkbootstrap.internal.render_queue import RenderQueue
+        from ttkbootstrap.window import get_default_root
+
+        root = get_default_root("list font families")
+        RenderQueue.for_widget(root).invalidate(
+            (_FAMILIES_ATTRIBUTE, "refresh"), lambda: cls.families(refresh=True)
+        )
+
     @classmethod
     def reset(cls) -> None:
         """Drop the cached `font.Font` wrappers.
@@ -6,7 +6,8 @@ def windowing_system(widget):
 
     One of `'win32'` (Windows), `'aqua'` (macOS), or `'x11'` (Linux/Unix).
     Wraps `widget.tk.call('tk', 'windowingsystem')` so platform checks read the
-    same everywhere instead of repeating the raw Tcl call.
+    same everywhere instead of repeating the raw Tcl call. The answer is cached
+    per application root.
 
     Parameters:
 
@@ -18,4 +19,6 @@ def windowing_system(widget):
         str:
             The windowing system identifier.
     """
-    return str(widget.tk.call('tk', 'windowingsystem'))
+    from ttkbootstrap.style.scaling import Scaling
+
+    return Scaling.for_widget(widget).windowing_system
@@ -45,11 +45,11 @@ def enable_high_dpi_awareness(root=None, scaling=None):
             made after the scaling factor is changed will use the new
             scaling factor, but it is undefined whether existing
             widgets will resize themselves dynamically to accommodate
-            the new scaling factor.
+            the new scaling factor. ttkbootstrap rebuilds its styles and
+            assets for the new factor (see `refresh_scaling`).
     """
-    # Keep the existing system-DPI-aware behavior. Per-monitor-v2 awareness
-    # requires live style rebuilding when a window crosses displays, which is
-    # outside ttkbootstrap's current scaling contract.
+    # Keep the existing system-DPI-aware behavior. A process that opts into
+    # per-monitor awareness itself can follow monitor changes with `watch_dpi`.
     try:
         from ctypes import windll
         try:
@@ -59,11 +59,67 @@ def enable_high_dpi_awareness(root=None, scaling=None):
     except Exception:
         pass
 
+    if root is None or scaling is None:
+        return
     try:
-        if root is not None and scaling is not None:
-            root.tk.call('tk', 'scaling', scaling)
+        root.tk.call('tk', 'scaling', scaling)
     except Exception:
-        pass
+        return
+    refresh_scaling(root)
+
+
+def refresh_scaling(widget):
+    """Pick up a change of the Tk scaling factor.
+
+    The scaling factor is read once per application and cached, because
+    every style and asset build converts many sizes with it. After changing
+    it with a raw ``tk scaling`` call, call this function: if the factor
+    changed, the active theme's styles and image assets are rebuilt for the
+    new density right away, and other themes the next time they are used.
+    (`enable_high_dpi_awareness` calls it for you.)
+
+    Parameters:
+
+        widget (Widget):
+            Any widget of the application.
+
+    Returns:
+
+        bool:
+            `True` if the factor changed.
+    """
+    from ttkbootstrap.style.scaling import Scaling
+
+    return Scaling.for_widget(widget).refresh()
+
+
+def watch_dpi(widget, enable=True, interval=1000):
+    """Follow display-density changes while the application runs.
+
+    Polls the Tk scaling factor every `interval` milliseconds and rescales
+    the UI (as `refresh_scaling` does) when it changes. On Windows, when the
+    process is per-monitor DPI aware, the factor is first updated from the
+    DPI of the monitor the window is on, so dragging the window to a display
+    of another density rescales it.
+
+    Parameters:
+
+        widget (Widget):
+            Any widget of the application.
+
+        enable (bool):
+            `False` stops watching.
+
+        interval (int):
+            The polling interval in milliseconds.
+    """
+    from ttkbootstrap.style.scaling import Scaling
+
+    scaling = Scaling.for_widget(widget)
+    if enable:
+        scaling.watch(interval)
+    else:
+        scaling.unwatch()
 
 
 def scale_size(widget, size):
@@ -10,6 +10,7 @@ passed to a rule.
 The pre-2.0 module-level `add_*_validation` functions remain as thin deprecated
 aliases (removed in 3.0); new code should call the `Validation` namespace.
 """
+import functools
 import re
 from tkinter import Misc
 from typing import Any, Callable, Union
@@ -66,11 +67,13 @@ class ValidationEvent:
         self.insertdeletetext = S
         self.validationtype = v
         self.validationreason = V
+        self._widget_name = W
 
+    @property
+    def widget(self) -> Misc:
+        """The widget being validated, looked up when first read."""
         style = ttk.Style.get_instance()
-        self.widget = style.master.nametowidget(
-            W
-        )  # replace with another method
+        return style.master.nametowidget(self._widget_name)
 
 
 def validator(func: Callable[[ValidationEvent], bool]) -> Callable[..., bool]:
@@ -90,50 +93,162 @@ def validator(func: Callable[[ValidationEvent], bool]) -> Callable[..., bool]:
     return inner
 
 
-@validator
-def _validate_text(event: ValidationEvent) -> bool:
-    """Contents is text."""
-    if len(event.postchangetext) == 0:
-        return True
-    return str(event.postchangetext).isalpha()
+class _Rule:
+    """A built-in rule, compiled once and attached with only the substitution
+    it needs.
 
+    A rule checks the proposed value alone (``%P``), so Tk hands it a single
+    string instead of the eight fields a `ValidationEvent` carries. It can run
+    as a registered Python callback (`check`) or, with ``tcl=True``, as one of
+    the procedures in `_TCL_RULES`, in which case validation never leaves the
+    Tcl interpreter.
+    """
 
-@validator
-def _validate_number(event: ValidationEvent) -> bool:
-    """Contents is a number."""
-    if len(event.postchangetext) == 0:
-        return True
-    return str(event.postchangetext).isnumeric()
+    # The name of the rule's procedure in the ``::ttkbootstrap::validation``
+    # namespace.
+    proc = ""
 
+    def check(self, value: str) -> bool:
+        raise NotImplementedError
 
-@validator
-def _validate_options(event: ValidationEvent, options: list[Any]) -> bool:
-    """Contents is in a list of options"""
-    return event.postchangetext in options
+    def tcl_args(self) -> tuple[str, ...]:
+        """The rule's parameters, passed to its procedure after ``%P``."""
+        return ()
 
 
-@validator
-def _validate_range(
-    event: ValidationEvent, startrange: Union[int, float], endrange: Union[int, float]
-) -> bool:
-    """Contents is a number between the startrange and endrange
-    inclusive
-    """
-    if len(event.postchangetext) == 0:
-        return True
-    try:
-        num = float(event.postchangetext)
-        result = num >= startrange and num <= endrange
-        return result
-    except:
-        return False
+class _TextRule(_Rule):
+    """Contents is text (an empty field passes)."""
+
+    proc = "text"
+
+    def check(self, value: str) -> bool:
+        return not value or value.isalpha()
+
+
+class _NumericRule(_Rule):
+    """Contents is a number (an empty field passes)."""
+
+    proc = "numeric"
+
+    def check(self, value: str) -> bool:
+        return not value or value.isnumeric()
+
+
+class _RangeRule(_Rule):
+    """Contents is a number between `start` and `end` inclusive (an empty
+    field passes)."""
+
+    proc = "range"
+
+    def __init__(self, start: Union[int, float], end: Union[int, float]) -> None:
+        self.start = start
+        self.end = end
+
+    def check(self, value: str) -> bool:
+        if not value:
+            return True
+        try:
+            return self.start <= float(value) <= self.end
+        except ValueError:
+            return False
+
+    def tcl_args(self) -> tuple[str, ...]:
+        return (str(self.start), str(self.end))
+
+
+class _RegexRule(_Rule):
+    """Contents matches a regular expression, anchored at the start as
+    `re.match` is."""
+
+    proc = "regex"
 
+    def __init__(self, pattern: str) -> None:
+        self.pattern = pattern
+        self._match = re.compile(pattern).match
 
-@validator
-def _validate_regex(event: ValidationEvent, pattern: str) -> bool:
-    """Contents matches a regex expression"""
-    match = re.match(pattern, event.postchangetext)
-    return match is not None
+    def check(self, value: str) -> bool:
+        return self._match(value) is not None
+
+    def tcl_args(self) -> tuple[str, ...]:
+        return (f"^(?:{self.pattern})",)
+
+
+class _OptionsRule(_Rule):
+    """Contents is one of a list of options."""
+
+    proc = "options"
+
+    def __init__(self, options: list[Any]) -> None:
+        try:
+            self.options: Any = frozenset(options)
+        except TypeError:  # unhashable options: fall back to a linear scan
+            self.options = tuple(options)
+
+    def check(self, value: str) -> bool:
+        return value in self.options
+
+    def tcl_args(self) -> tuple[str, ...]:
+        # The proposed value is always a string, so only string options can
+        # ever match; pass just those to keep both paths in agreement.
+        return (tuple(o for o in self.options if isinstance(o, str)),)
+
+
+# Rules with hashable parameters are shared between every widget that uses
+# them, so a pattern is compiled once however many entries validate with it.
+_text_rule = functools.lru_cache(maxsize=None)(_TextRule)
+_numeric_rule = functools.lru_cache(maxsize=None)(_NumericRule)
+_range_rule = functools.lru_cache(maxsize=128)(_RangeRule)
+_regex_rule = functools.lru_cache(maxsize=128)(_RegexRule)
+
+
+# The Tcl side of the built-in rules. Each procedure takes the proposed value
+# first and the rule's parameters after it, and mirrors its `_Rule.check`;
+# the character classes are Tcl's (``string is alpha`` / ``digit``) and a
+# regex rule's pattern is a Tcl regular expression.
+_TCL_NAMESPACE = "::ttkbootstrap::validation"
+_TCL_RULES = """
+namespace eval ::ttkbootstrap::validation {
+    proc text {value} {
+        string is alpha $value
+    }
+    proc numeric {value} {
+        string is digit $value
+    }
+    proc range {value start end} {
+        if {$value eq ""} { return 1 }
+        if {![regexp {^[-+]?([0-9]+[.]?[0-9]*|[.][0-9]+)([eE][-+]?[0-9]+)?$} $value]} {
+            return 0
+        }
+        scan $value %f number
+        expr {$number >= $start && $number <= $end}
+    }
+    proc regex {value pattern} {
+        regexp -- $pattern $value
+    }
+    proc options {value options} {
+        expr {$value in $options}
+    }
+}
+"""
+
+
+def _tcl_escape(arg: Any) -> Any:
+    """Double the ``%`` in a literal argument so Tk's substitution keeps it."""
+    if isinstance(arg, tuple):
+        return tuple(_tcl_escape(a) for a in arg)
+    return str(arg).replace("%", "%%")
+
+
+def _attach_rule(widget: Misc, rule: _Rule, when: str, tcl: bool) -> None:
+    """Attach a built-in `rule` to `widget`, passing it only ``%P``."""
+    if tcl:
+        if not widget.tk.call("namespace", "exists", _TCL_NAMESPACE):
+            widget.tk.eval(_TCL_RULES)
+        command = (f"{_TCL_NAMESPACE}::{rule.proc}", "%P",
+                   *(_tcl_escape(a) for a in rule.tcl_args()))
+    else:
+        command = (widget.register(rule.check), "%P")
+    widget.configure(validate=when, validatecommand=command)
 
 
 # A common phone-number shape, shared by Validation.phonenumber.
@@ -156,6 +271,15 @@ class Validation:
     * ``"key"`` — on every keystroke, as the user types
     * ``"all"`` — in all of the above situations
 
+    The ready-made rules are compiled once and only see the proposed value,
+    so a keystroke costs one Python call with one argument. Pass ``tcl=True``
+    to run one as a Tcl procedure instead: validation then never leaves the
+    Tcl interpreter, which keeps ``when="key"`` cheap on busy forms. The Tcl
+    rules use Tcl's character classes (``numeric`` accepts decimal digits
+    only) and Tcl's regular-expression syntax; ``range`` accepts plain
+    decimal numbers only, so ``" 5"``, ``"inf"`` or ``"1_000"`` pass the
+    Python rule but not the Tcl one.
+
     Use ``Validation.add`` for a custom rule (a function decorated with
     ``@validator``).
     """
@@ -166,8 +290,8 @@ class Validation:
 
         The rule `func` receives a `ValidationEvent` and returns a boolean; it is
         usually written with the `@validator` decorator. Extra keyword arguments
-        are forwarded to the rule on each call (as `add_range_validation` forwards
-        its bounds).
+        are forwarded to the rule on each call. A custom rule receives all eight
+        of Tk's substitutions; the ready-made rules need only the proposed value.
 
         Parameters:
 
@@ -183,19 +307,19 @@ class Validation:
             kwargs (Dict):
                 Optional arguments forwarded to `func`.
         """
-        f = widget.register(lambda *e: func(*e, **kwargs))
+        f = widget.register(functools.partial(func, **kwargs) if kwargs else func)
         subs = (r"%d", r"%i", r"%P", r"%s", r"%S", r"%v", r"%V", r"%W")
         widget.configure(validate=when, validatecommand=(f, *subs))
 
     @staticmethod
-    def text(widget: Misc, when: str = "focusout") -> None:
+    def text(widget: Misc, when: str = "focusout", tcl: bool = False) -> None:
         """Require the contents to be alphabetic (an empty field passes)."""
-        Validation.add(widget, _validate_text, when=when)
+        _attach_rule(widget, _text_rule(), when, tcl)
 
     @staticmethod
-    def numeric(widget: Misc, when: str = "focusout") -> None:
+    def numeric(widget: Misc, when: str = "focusout", tcl: bool = False) -> None:
         """Require the contents to be numeric (an empty field passes)."""
-        Validation.add(widget, _validate_number, when=when)
+        _attach_rule(widget, _numeric_rule(), when, tcl)
 
     @staticmethod
     def range(
@@ -203,6 +327,7 @@ class Validation:
         start: Union[int, float],
         end: Union[int, float],
         when: str = "focusout",
+        tcl: bool = False,
     ) -> None:
         """Require a number within `start`–`end` inclusive (an empty field passes).
 
@@ -219,23 +344,32 @@ class Validation:
 
             when (str):
                 When the rule runs. See the class docstring for the options.
+
+            tcl (bool):
+                Run the rule inside the Tcl interpreter. See the class
+                docstring.
         """
-        Validation.add(widget, _validate_range, startrange=start, endrange=end, when=when)
+        _attach_rule(widget, _range_rule(start, end), when, tcl)
 
     @staticmethod
-    def regex(widget: Misc, pattern: str, when: str = "focusout") -> None:
-        """Require the contents to match the regular expression `pattern`."""
-        Validation.add(widget, _validate_regex, pattern=pattern, when=when)
+    def regex(widget: Misc, pattern: str, when: str = "focusout", tcl: bool = False) -> None:
+        """Require the contents to match the regular expression `pattern`.
+
+        The match is anchored at the start, as with `re.match`. With
+        ``tcl=True`` the pattern is a Tcl regular expression, which agrees
+        with Python's for the common syntax.
+        """
+        _attach_rule(widget, _regex_rule(pattern), when, tcl)
 
     @staticmethod
-    def options(widget: Misc, options: list[Any], when: str = "focusout") -> None:
+    def options(widget: Misc, options: list[Any], when: str = "focusout", tcl: bool = False) -> None:
         """Require the contents to be one of the values in `options`."""
-        Validation.add(widget, _validate_options, options=options, when=when)
+        _attach_rule(widget, _OptionsRule(options), when, tcl)
 
     @staticmethod
-    def phonenumber(widget: Misc, when: str = "focusout") -> None:
+    def phonenumber(widget: Misc, when: str = "focusout", tcl: bool = False) -> None:
         """Require the contents to match a common phone-number pattern."""
-        Validation.add(widget, _validate_regex, pattern=_PHONE_PATTERN, when=when)
+        _attach_rule(widget, _regex_rule(_PHONE_PATTERN), when, tcl)
 
 
 # ---------------------------------------------------------------------------
@@ -12,10 +12,10 @@ from ttkbootstrap.widgets.dateentry import DateEntry
 from ttkbootstrap.widgets.floodgauge import Floodgauge, FloodgaugeLegacy
 from ttkbootstrap.widgets.labeledscale import LabeledScale
 from ttkbootstrap.widgets.meter import Meter
-from ttkbootstrap.widgets.scrolled import ScrolledFrame, ScrolledText
+from ttkbootstrap.widgets.scrolled import ScrolledFrame, ScrolledList, ScrolledText
 from ttkbootstrap.widgets.tableview import TableColumn, TableRow, Tableview
 from ttkbootstrap.widgets.toast import ToastNotification
-from ttkbootstrap.widgets.tooltip import ToolTip
+from ttkbootstrap.widgets.tooltip import ToolTip, ToolTipRegistry
 
 # Constants from original widgets.py
 M = 3  # meter image scale, higher number increases resolution
@@ -71,10 +71,12 @@ __all__ = [
     'LabeledScale',
     'ScrolledText',
     'ScrolledFrame',
+    'ScrolledList',
     'Tableview',
     'TableColumn',
     'TableRow',
     'ToolTip',
+    'ToolTipRegistry',
     'ToastNotification',
     'M',
     'TTK_WIDGETS',
@@ -9,7 +9,7 @@ from typing import Any, Optional, Tuple, Union
 
 from ttkbootstrap import Button, Entry, Frame, apply_icon
 from ttkbootstrap.constants import BOTH, END, LEFT, X, YES
-from ttkbootstrap.dialogs import Querybox
+from ttkbootstrap.dialogs import DatePickerDialog
 from ttkbootstrap.internal.configure_delegation import (
     ConfigureDelegationMixin,
     configure_delegate,
@@ -561,18 +561,20 @@ class DateEntry(ConfigureDelegationMixin, Frame):
                 old_date = self._startdate or datetime.today()
             self._startdate = old_date
 
-            # get the new date and insert into the entry
-            new_date = Querybox.get_date(
-                parent=self.entry,
+            # get the new date and insert into the entry. The popup is kept
+            # per root and reused, so only the first click pays for building it.
+            picker = DatePickerDialog.for_widget(
+                self.entry,
                 title=self._popup_title,
                 start_date=old_date,
                 first_weekday=self._firstweekday,
                 bootstyle=self._bootstyle,
                 show_outside_days=self._show_outside_days,
-                position=self._position,
             )
-            # get_date returns None when the picker is cancelled (2.0); leave
-            # the field unchanged rather than resetting it.
+            picker.show(self._position)
+            new_date = picker.result
+            # result is None when the picker is cancelled (2.0); leave the
+            # field unchanged rather than resetting it.
             if new_date is not None:
                 self.set_date(new_date)
                 self.event_generate("<<DateEntrySelected>>")
@@ -14,6 +14,8 @@ from ttkbootstrap.internal.configure_delegation import (
     ConfigureDelegationMixin,
     configure_delegate,
 )
+from ttkbootstrap.internal.dispatch import UIDispatcher
+from ttkbootstrap.internal.render_queue import RenderQueue
 from ttkbootstrap.style import Colors, Style
 from ttkbootstrap.style._compat import normalize_floodgauge_start_args, warn_deprecated
 
@@ -36,6 +38,9 @@ class Floodgauge(ConfigureDelegationMixin, Canvas):
     tk-native ``configure``/``cget``/item surface; ``value`` is also exposed as a
     read/write property.
 
+    Redraws are deferred to the next idle pass, so any number of value or
+    option changes made in one event-loop turn repaint the canvas once.
+
     Parameters:
         master (Widget, optional):
             Parent widget.
@@ -106,6 +111,8 @@ class Floodgauge(ConfigureDelegationMixin, Canvas):
             canvas_kwargs.update(width=self._thickness, height=self._length)
 
         super().__init__(master, **canvas_kwargs)
+        # for `set_value_threadsafe`: create the dispatcher on the UI thread
+        UIDispatcher.for_widget(self)
 
         self._var_traceid = None
         self._textvar_traceid = None
@@ -127,7 +134,7 @@ class Floodgauge(ConfigureDelegationMixin, Canvas):
 
         self.bind("<Configure>", self._on_resize)
         self.bind("<<ThemeChanged>>", lambda e: self._update_theme_colors())
-        self._draw()
+        self._schedule_draw()
 
     # -- value access -------------------------------------------------------- #
     @property
@@ -140,6 +147,20 @@ class Floodgauge(ConfigureDelegationMixin, Canvas):
         # Setting the bound variable fires its write trace -> redraw.
         self.variable.set(amount)
 
+    def set_value_threadsafe(self, amount: Union[int, float]) -> bool:
+        """Set :attr:`value` from any thread.
+
+        The update runs on the UI thread. Values set faster than the event loop
+        turns are coalesced: the gauge redraws once, with the latest value.
+        Returns ``False`` if the application has already been destroyed.
+        """
+        return UIDispatcher.for_widget(self).call_soon(
+            self._set_value_if_alive, amount, key=(self._w, "value"))
+
+    def _set_value_if_alive(self, amount: Union[int, float]) -> None:
+        if self.winfo_exists():
+            self.value = amount
+
     #: Options that were bare public attributes before 2.0 -- now private,
     #: reachable through configure/cget. Read access is kept (deprecated) so
     #: nothing hard-breaks; the canonical surface is configure/cget.
@@ -177,7 +198,7 @@ class Floodgauge(ConfigureDelegationMixin, Canvas):
         self.bar_color = style.colors.get(self._bootstyle)
         self.trough_color = Colors.update_hsv(self.bar_color, 0, -0.5, 0.3)
         self.text_color = contrast_color(self.bar_color, 'hex')
-        self._draw()
+        self._schedule_draw()
 
     def _on_resize(self, event: Event) -> None:
         if self._orient == "horizontal":
@@ -186,7 +207,7 @@ class Floodgauge(ConfigureDelegationMixin, Canvas):
         else:
             self._length = event.height
             self._thickness = event.width
-        self._draw()
+        self._schedule_draw()
 
     def _apply_geometry(self) -> None:
         """Resize the canvas to match the current orient/length/thickness."""
@@ -243,11 +264,15 @@ class Floodgauge(ConfigureDelegationMixin, Canvas):
                 anchor="center"
             )
 
+    def _schedule_draw(self) -> None:
+        """Redraw at the next idle pass; repeated requests collapse into one."""
+        RenderQueue.for_widget(self).invalidate((self._w, "draw"), self._draw)
+
     def _on_var_change(self) -> None:
-        self._draw()
+        self._schedule_draw()
 
     def _on_text_change(self) -> None:
-        self._draw()
+        self._schedule_draw()
 
     def _bind_variable(self, variable: Union[IntVar, DoubleVar]) -> None:
         """Trace `variable` for value changes, dropping any prior trace.
@@ -298,6 +323,7 @@ class Floodgauge(ConfigureDelegationMixin, Canvas):
                     pass
         self._var_traceid = None
         self._textvar_traceid = None
+        RenderQueue.for_widget(self).discard((self._w, "draw"))
         super().destroy()
 
     def step(self, amount: Union[int, float] = 1) -> None:
@@ -385,7 +411,7 @@ class Floodgauge(ConfigureDelegationMixin, Canvas):
                 self._pulse_pos = pulse_height
                 self._pulse_direction = 1
 
-        self._draw()
+        self._schedule_draw()
         self._after_id = self.after(interval, lambda: self._animate_indeterminate(interval))
 
     # -- configure delegates ------------------------------------------------- #
@@ -397,21 +423,21 @@ class Floodgauge(ConfigureDelegationMixin, Canvas):
     def _cfg_value(self, value):
         if value is None:
             return self.variable.get()
-        self.variable.set(value)  # trace -> _on_var_change -> _draw
+        self.variable.set(value)  # trace -> _on_var_change -> redraw
 
     @configure_delegate("maximum")
     def _cfg_maximum(self, value):
         if value is None:
             return self._maximum
         self._maximum = value
-        self._draw()
+        self._schedule_draw()
 
     @configure_delegate("mode")
     def _cfg_mode(self, value):
         if value is None:
             return self._mode
         self._mode = value
-        self._draw()
+        self._schedule_draw()
 
     @configure_delegate("orient")
     def _cfg_orient(self, value):
@@ -419,27 +445,27 @@ class Floodgauge(ConfigureDelegationMixin, Canvas):
             return self._orient
         self._orient = value
         self._apply_geometry()
-        self._draw()
+        self._schedule_draw()
 
     @configure_delegate("mask")
     def _cfg_mask(self, value):
         if value is None:
             return self._mask
         self._mask = value
-        self._draw()
+        self._schedule_draw()
 
     @configure_delegate("text")
     def _cfg_text(self, value):
         if value is None:
             return self.textvariable.get()
-        self.textvariable.set(value)  # trace -> _on_text_change -> _draw
+        self.textvariable.set(value)  # trace -> _on_text_change -> redraw
 
     @configure_delegate("font")
     def _cfg_font(self, value):
         if value is None:
             return self._font
         self._font = value
-        self._draw()
+        self._schedule_draw()
 
     @configure_delegate("bootstyle")
     def _cfg_bootstyle(self, value):
@@ -454,7 +480,7 @@ class Floodgauge(ConfigureDelegationMixin, Canvas):
             return self._length
         self._length = value
         self._apply_geometry()
-        self._draw()
+        self._schedule_draw()
 
     @configure_delegate("thickness")
     def _cfg_thickness(self, value):
@@ -462,7 +488,7 @@ class Floodgauge(ConfigureDelegationMixin, Canvas):
             return self._thickness
         self._thickness = value
         self._apply_geometry()
-        self._draw()
+        self._schedule_draw()
 
     @configure_delegate("variable")
     def _cfg_variable(self, value):
@@ -470,14 +496,14 @@ class Floodgauge(ConfigureDelegationMixin, Canvas):
         if value is None:
             return self.variable
         self._bind_variable(value)
-        self._draw()
+        self._schedule_draw()
 
     @configure_delegate("textvariable")
     def _cfg_textvariable(self, value):
         if value is None:
             return self.textvariable
         self._bind_textvariable(value)
-        self._draw()
+        self._schedule_draw()
 
     def items(self) -> Any:
         """Get all configuration options as key-value pairs.
@@ -10,6 +10,7 @@ from ttkbootstrap import (
     DoubleVar, Frame, Label, Scale
 )
 from ttkbootstrap.constants import DEFAULT, Side
+from ttkbootstrap.internal.render_queue import RenderQueue
 
 
 class LabeledScale(Frame):
@@ -91,7 +92,6 @@ class LabeledScale(Frame):
         self._variable.set(initial)
         self._last_valid: Union[int, float] = initial
         self._bootstyle = bootstyle
-        self._adjust_id: Optional[str] = None  # pending after_idle for the label
 
         self.label = Label(self, bootstyle=bootstyle)
         self.scale = Scale(self, variable=self._variable, from_=from_, to=to, bootstyle=bootstyle)
@@ -115,15 +115,10 @@ class LabeledScale(Frame):
     def destroy(self) -> None:
         """Destroy this widget and possibly its associated variable.
 
-        Cancels any pending label-adjust idle callback first, so it cannot fire
-        into the half-torn-down widget (use-after-destroy ``AttributeError``).
+        Discards any pending label placement first, so it cannot run against
+        the half-torn-down widget (use-after-destroy ``AttributeError``).
         """
-        if self._adjust_id is not None:
-            try:
-                self.after_cancel(self._adjust_id)
-            except (ValueError, TclError):
-                pass
-            self._adjust_id = None
+        RenderQueue.for_widget(self).discard((self._w, "label"))
         try:
             self._variable.trace_remove('write', self.__tracecb)
         except AttributeError:
@@ -154,7 +149,6 @@ class LabeledScale(Frame):
         """Adjust the label position and text according to the scale value."""
 
         def adjust_label() -> None:
-            self._adjust_id = None
             # The idle callback can outlive a destroy(); bail if we are gone.
             if self.scale is None or self.label is None:
                 return
@@ -199,14 +193,9 @@ class LabeledScale(Frame):
         # `:g` renders 4.0 as "4" and 3.7 as "3.7" -- a DoubleVar-backed integer
         # scale still reads as integers.
         self.label['text'] = f"{newval:g}"
-        # Coalesce repeated adjusts (trace + <Configure> + <Map>) into one idle
-        # callback, and keep its id so destroy() can cancel it.
-        if self._adjust_id is not None:
-            try:
-                self.after_cancel(self._adjust_id)
-            except (ValueError, TclError):
-                pass
-        self._adjust_id = self.after_idle(adjust_label)
+        # Coalesce repeated adjusts (trace + <Configure> + <Map>) into one
+        # placement at the next idle pass.
+        RenderQueue.for_widget(self).invalidate((self._w, "label"), adjust_label)
 
     @property
     def value(self) -> Union[int, float]:
@@ -17,6 +17,7 @@ from ttkbootstrap.internal.configure_delegation import (
     ConfigureDelegationMixin,
     configure_delegate,
 )
+from ttkbootstrap.internal.render_queue import RenderQueue
 from ttkbootstrap.style import Bootstyle, Colors
 from ttkbootstrap.style._compat import (
     normalize_meter_kwargs,
@@ -250,6 +251,7 @@ class Meter(ConfigureDelegationMixin, Frame):
         opts.update(normalize_meter_kwargs(kwargs))
 
         super().__init__(master=master, **kwargs)
+        self._base_stale = False  # the base image needs a rebuild on render
 
         # widget variables (float-backed so fractional formats are honored)
         self.amount_min_var = DoubleVar(value=opts["amount_min"])
@@ -316,8 +318,8 @@ class Meter(ConfigureDelegationMixin, Frame):
         return utils.scale_size(self, self._meter_thickness)
 
     def _update_meter(self, *_: Any) -> None:
-        """Redraw the indicator and refresh the display text on value change."""
-        self._draw_meter()
+        """Refresh the display text and schedule an indicator redraw."""
+        self._schedule_render()
         amount_used = self.amount_used_var.get()
         self.amount_used_display_var.set(self._amount_format.format(amount_used))
 
@@ -335,6 +337,7 @@ class Meter(ConfigureDelegationMixin, Frame):
             except TclError:
                 pass
             self._amount_used_traceid = None
+        RenderQueue.for_widget(self).discard((self._w, "draw"))
         super().destroy()
 
     def _setup_widget(self) -> None:
@@ -593,7 +596,22 @@ class Meter(ConfigureDelegationMixin, Frame):
 
     def _on_theme_change(self, *_: Any) -> None:
         """Redraw the meter with updated colors from the new theme."""
-        self._draw_base_image()
+        self._schedule_render(base=True)
+
+    def _schedule_render(self, base: bool = False) -> None:
+        """Redraw the indicator (and the trough with `base`) at the next idle pass.
+
+        Value changes only repaint the indicator; option and theme changes
+        also rebuild the base image. Requests made in one event-loop turn
+        collapse into a single render.
+        """
+        self._base_stale = self._base_stale or base
+        RenderQueue.for_widget(self).invalidate((self._w, "draw"), self._render)
+
+    def _render(self) -> None:
+        if self._base_stale:
+            self._base_stale = False
+            self._draw_base_image()
         self._draw_meter()
 
     def _on_dial_interact(self, e: Event) -> None:
@@ -791,7 +809,7 @@ class Meter(ConfigureDelegationMixin, Frame):
 
     # -- configure/setitem wrappers (batch one redraw per set) --------------- #
     def _refresh(self, redraw_text: bool = False) -> None:
-        """Recompute the arc and redraw once after a batch of option changes."""
+        """Recompute the arc and schedule a redraw after a batch of option changes."""
         try:
             if self._meter_type:
                 self._set_arc_offset_range(
@@ -802,8 +820,7 @@ class Meter(ConfigureDelegationMixin, Frame):
         except AttributeError:
             return
 
-        self._draw_base_image()
-        self._draw_meter()
+        self._schedule_render(base=True)
         if redraw_text:
             self._set_meter_text()
 
@@ -2,16 +2,27 @@
 
 `ScrolledText` and `ScrolledFrame` wrap a Text widget / Frame with managed
 vertical and horizontal scrollbars that can optionally auto-hide when the mouse
-leaves the widget.
+leaves the widget. `ScrolledList` is the virtualized counterpart for very long
+lists: it builds only the rows in view and recycles them as the view scrolls.
+
+`ScrolledText` also streams: `append` batches text into one insert per frame
+(trimmed to `max_lines`), and `view_file` pages a memory-mapped file through
+the widget instead of inserting all of it.
 """
+import mmap
+import threading
 import tkinter
+from array import array
+from bisect import bisect_left
 from tkinter import Grid, Pack, Place
-from typing import Any, Callable, Optional, Tuple
+from typing import Any, Callable, List, Optional, Tuple
 
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 from ttkbootstrap.internal import wheel
 from ttkbootstrap.internal.configure_delegation import ConfigureDelegationMixin
+from ttkbootstrap.internal.dispatch import UIDispatcher
+from ttkbootstrap.internal.render_queue import RenderQueue
 from ttkbootstrap.style._compat import normalize_scrolled_kwargs, warn_deprecated
 from ttkbootstrap.utils import windowing_system
 
@@ -20,6 +31,68 @@ from ttkbootstrap.utils import windowing_system
 # (e.g. the vbar's bottom when there is no hbar to inset it).
 _SCROLLBAR_END_PAD = 1
 
+# File view: the lines held in the Text at once, and how close the view may
+# come to either end of them before the next page is loaded around it.
+_PAGE_LINES = 2000
+_PAGE_MARGIN = 200
+# Bytes per entry of a mapped file's line index.
+_INDEX_BLOCK = 1 << 16
+
+
+class _FilePager:
+    """Line-addressed, read-only access to a memory-mapped text file.
+
+    The index stores one newline count per `_INDEX_BLOCK` bytes, counted at C
+    speed, so opening a multi-hundred-MB file does not walk it line by line;
+    a line is located by bisecting the index and scanning one block.
+    """
+
+    def __init__(self, path: str, encoding: str, errors: str) -> None:
+        self._encoding = encoding
+        self._errors = errors
+        self._file = open(path, "rb")
+        try:
+            size = self._file.seek(0, 2)
+            # an empty file cannot be mapped; it reads as one empty line
+            self._map = (mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                         if size else b"")
+        except BaseException:
+            self._file.close()
+            raise
+        self._size = size
+        # _starts[i]: the number of newlines before block i
+        self._starts = array("q")
+        newlines = 0
+        for start in range(0, size, _INDEX_BLOCK):
+            self._starts.append(newlines)
+            newlines += self._map[start:start + _INDEX_BLOCK].count(b"\n")
+        self._newlines = newlines
+        unterminated = size and self._map[size - 1:size] != b"\n"
+        self.line_count = newlines + 1 if unterminated or not size else newlines
+
+    def offset(self, line: int) -> int:
+        """The byte offset at which `line` (0-based) starts."""
+        if line <= 0:
+            return 0
+        if line > self._newlines:
+            return self._size
+        # the block holding the line's preceding newline
+        block = bisect_left(self._starts, line) - 1
+        position = block * _INDEX_BLOCK - 1
+        for _ in range(line - self._starts[block]):
+            position = self._map.find(b"\n", position + 1)
+        return position + 1
+
+    def lines(self, first: int, last: int) -> str:
+        """The text of lines ``first`` to ``last`` (exclusive), decoded."""
+        data = self._map[self.offset(first):self.offset(last)]
+        return data.decode(self._encoding, self._errors)
+
+    def close(self) -> None:
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
 
 class ScrolledText(ConfigureDelegationMixin, ttk.Frame):
     """A text widget with optional vertical and horizontal scrollbars.
@@ -48,6 +121,12 @@ class ScrolledText(ConfigureDelegationMixin, ttk.Frame):
 
         app.mainloop()
         ```
+
+    For logs, `append` (or `append_threadsafe` from a worker thread) queues
+    text that is inserted once per frame, keeping at most `max_lines` lines
+    and following the end only while the view is already there. `view_file`
+    shows a file of any size by paging the lines around the view in from a
+    memory map.
     """
 
     def __init__(
@@ -59,6 +138,7 @@ class ScrolledText(ConfigureDelegationMixin, ttk.Frame):
             auto_hide: bool = False,
             vbar: bool = True,
             hbar: bool = False,
+            max_lines: Optional[int] = None,
             **kwargs: Any,
     ) -> None:
         """
@@ -88,6 +168,10 @@ class ScrolledText(ConfigureDelegationMixin, ttk.Frame):
                 on this scrollbar will also set `wrap="none"`. This
                 scrollbar is _off_ by default.
 
+            max_lines (int):
+                When set, text added with `append` trims the oldest
+                lines so that at most this many are kept.
+
             **kwargs (dict[str, Any]):
                 Other keyword arguments passed to the `Text` widget.
         """
@@ -96,6 +180,9 @@ class ScrolledText(ConfigureDelegationMixin, ttk.Frame):
         auto_hide = aliases.get("auto_hide", auto_hide)
 
         super().__init__(master, padding=padding)
+        # `append_threadsafe` needs the root's dispatcher; create it here, on
+        # the UI thread, rather than from the first worker that appends.
+        UIDispatcher.for_widget(self)
 
         # The border is owned by an inner `highlight` frame, so the text and the
         # scrollbar sit inside a single bordered box (the inner Text is kept
@@ -121,6 +208,14 @@ class ScrolledText(ConfigureDelegationMixin, ttk.Frame):
         self._hbar: Optional[ttk.Scrollbar] = None
         self._vbar: Optional[ttk.Scrollbar] = None
         self._auto_hide = auto_hide
+        self._max_lines = max_lines
+        # text handed to append/append_threadsafe, not yet inserted
+        self._appended: List[str] = []
+        self._append_lock = threading.Lock()
+        self._pager: Optional[_FilePager] = None
+        self._page = (0, 0)
+        # the Text's state before `view_file` disabled it
+        self._state_before_file = NORMAL
 
         self._text.grid(row=0, column=0, sticky=NSEW)
 
@@ -214,6 +309,15 @@ class ScrolledText(ConfigureDelegationMixin, ttk.Frame):
         """Whether the scrollbars hide when the mouse leaves the widget."""
         return self._auto_hide
 
+    @property
+    def max_lines(self) -> Optional[int]:
+        """The most lines `append` keeps, or ``None`` for no limit."""
+        return self._max_lines
+
+    @max_lines.setter
+    def max_lines(self, value: Optional[int]) -> None:
+        self._max_lines = value
+
     def hide_scrollbars(self, *args: Any) -> None:
         """Hide the scrollbars."""
         if self._vbar is not None:
@@ -228,6 +332,192 @@ class ScrolledText(ConfigureDelegationMixin, ttk.Frame):
         if self._hbar is not None:
             self._hbar.grid()
 
+    # -- streaming ----------------------------------------------------------- #
+    def append(self, text: str) -> None:
+        """Add `text` at the end, batched with the rest of this frame's appends.
+
+        Everything appended before Tk next goes idle is inserted with a single
+        ``insert``, then the oldest lines beyond `max_lines` are deleted with a
+        single ``delete``. The view follows the new text only if it was
+        scrolled to the bottom; a user reading further up is left in place.
+        Call from the UI thread; use `append_threadsafe` from other threads.
+        """
+        self._queue_append(text)
+        self._schedule_flush()
+
+    def append_threadsafe(self, text: str) -> bool:
+        """Like `append`, but safe to call from any thread.
+
+        Returns:
+
+            bool:
+                False if the application has already been destroyed.
+        """
+        self._queue_append(text)
+        return UIDispatcher.for_widget(self).call_soon(
+            self._schedule_flush, key=(self._w, "append"))
+
+    def flush(self) -> None:
+        """Insert the appended text now rather than at the next idle pass."""
+        RenderQueue.for_widget(self).flush((self._w, "append"))
+
+    def _queue_append(self, text: str) -> None:
+        if self._pager is not None:
+            raise RuntimeError(
+                "ScrolledText is showing a file; call close_file() before appending")
+        with self._append_lock:
+            self._appended.append(text)
+
+    def _schedule_flush(self) -> None:
+        RenderQueue.for_widget(self).invalidate((self._w, "append"), self._flush_appended)
+
+    def _flush_appended(self) -> None:
+        with self._append_lock:
+            chunks = self._appended
+            self._appended = []
+        if not chunks or not self._text.winfo_exists():
+            return
+        text = "".join(chunks)
+        widget = self._text
+        follow = widget.yview()[1] >= 1.0
+        limit = self._max_lines
+        replace = False
+        if limit is not None and text.count("\n") >= limit:
+            # The batch alone fills the widget: keep only its tail rather
+            # than inserting lines that would be deleted straight away.
+            text = "\n".join(text.split("\n")[-(limit + 1):])
+            replace = True
+        state = widget.cget("state")
+        if state == DISABLED:
+            widget.configure(state=NORMAL)
+        try:
+            if replace:
+                widget.delete("1.0", END)
+            widget.insert(END, text)
+            if limit is not None:
+                self._trim_lines(limit)
+        finally:
+            if state == DISABLED:
+                widget.configure(state=DISABLED)
+        if follow:
+            widget.yview_moveto(1.0)
+
+    def _trim_lines(self, limit: int) -> None:
+        # the line after the final newline only counts once it has text
+        line, column = map(int, self._text.index("end-1c").split("."))
+        excess = (line if column else line - 1) - limit
+        if excess > 0:
+            self._text.delete("1.0", f"{excess + 1}.0")
+
+    # -- file view ----------------------------------------------------------- #
+    def view_file(self, path: str, encoding: str = "utf-8", errors: str = "replace") -> None:
+        """Show the text file at `path`, paging it in around the view.
+
+        The file is memory-mapped rather than read: the widget holds a
+        window of the lines around the view and loads the next window as
+        the view nears either end of it, while the vertical scrollbar spans
+        the whole file. The view is a snapshot of the file as it was when
+        opened and the contents are read-only (the Text is disabled while
+        the file is shown); call `close_file` to go back to an ordinary
+        (empty) text in its previous state.
+        """
+        self.close_file()
+        with self._append_lock:
+            self._appended = []
+        self._pager = _FilePager(path, encoding, errors)
+        self._state_before_file = self._text.cget("state")
+        self._text.configure(state=DISABLED)
+        self._text.configure(yscrollcommand=self._on_file_scroll)
+        if self._vbar is not None:
+            self._vbar.configure(command=self._file_yview)
+        self._load_page(0)
+
+    def close_file(self) -> None:
+        """Stop showing the file opened with `view_file` and release it."""
+        pager = self._pager
+        if pager is None:
+            return
+        self._pager = None
+        RenderQueue.for_widget(self).discard((self._w, "page"))
+        pager.close()
+        self._page = (0, 0)
+        if self._text.winfo_exists():
+            self._text.configure(state=NORMAL)
+            self._text.delete("1.0", END)
+            self._text.configure(state=self._state_before_file)
+            if self._vbar is not None:
+                self._text.configure(yscrollcommand=self._vbar.set)
+                self._vbar.configure(command=self._text.yview)
+
+    def _load_page(self, top: int) -> None:
+        """Load the page of lines around file line `top` and put it at the top."""
+        pager = self._pager
+        first = max(0, min(top - _PAGE_LINES // 2, pager.line_count - _PAGE_LINES))
+        last = min(pager.line_count, first + _PAGE_LINES)
+        text = pager.lines(first, last)
+        if text.endswith("\n"):
+            text = text[:-1]  # the Text supplies the final newline itself
+        self._text.configure(state=NORMAL)
+        self._text.delete("1.0", END)
+        self._text.insert("1.0", text)
+        self._text.configure(state=DISABLED)
+        self._page = (first, last)
+        self._text.yview(f"{top - first + 1}.0")
+
+    def _top_line(self) -> int:
+        """The file line shown at the top of the view."""
+        line = int(self._text.index("@0,0").split(".")[0])
+        return self._page[0] + line - 1
+
+    def _file_yview(self, *args: Any) -> None:
+        """The vertical scrollbar's command: scroll through the whole file."""
+        if self._pager is None:
+            return
+        if args and args[0] == "moveto":
+            total = self._pager.line_count
+            top = int(float(args[1]) * total)
+            first, last = self._page
+            # stay on the loaded page while the target has room around it
+            # (or the page already reaches that end of the file)
+            if ((top >= first + _PAGE_MARGIN or first == 0)
+                    and (top < last - _PAGE_MARGIN or last == total)):
+                self._text.yview(f"{top - first + 1}.0")
+            else:
+                self._load_page(top)
+            return
+        self._text.yview(*args)
+
+    def _on_file_scroll(self, low: str, high: str) -> None:
+        """The Text's yscrollcommand: report the view's place in the file."""
+        pager = self._pager
+        if pager is None:
+            return
+        first, last = self._page
+        span = last - first
+        total = pager.line_count
+        if self._vbar is not None:
+            self._vbar.set((first + float(low) * span) / total,
+                           (first + float(high) * span) / total)
+        near_top = first > 0 and float(low) * span < _PAGE_MARGIN
+        near_bottom = last < total and (1.0 - float(high)) * span < _PAGE_MARGIN
+        if near_top or near_bottom:
+            # load the next page once the scroll that got here is done
+            RenderQueue.for_widget(self).invalidate((self._w, "page"), self._repage)
+
+    def _repage(self) -> None:
+        if self._pager is not None and self._text.winfo_exists():
+            self._load_page(self._top_line())
+
+    def destroy(self) -> None:
+        """Release a viewed file and any pending appends, then destroy."""
+        queue = RenderQueue.for_widget(self)
+        queue.discard((self._w, "append"))
+        queue.discard((self._w, "page"))
+        if self._pager is not None:
+            self._pager.close()
+            self._pager = None
+        super().destroy()
+
     def _enable_auto_hide(self) -> None:
         # add="+" so a user's own enter/leave handlers survive; keep the funcids
         # to unbind precisely when auto-hide is turned back off.
@@ -667,4 +957,371 @@ class ScrolledFrame(ttk.Frame):
     # Statically declare dynamically-assigned geometry helpers for type checkers
     content_pack: Callable[..., Any]
     content_grid: Callable[..., Any]
-    content_place: Callable[..., Any]
\ No newline at end of file
+    content_place: Callable[..., Any]
+
+
+class ScrolledList(ttk.Frame):
+    """A virtualized vertical list that builds only the rows in view.
+
+    A ScrolledFrame holds every child widget for real, which stops scaling
+    somewhere in the low thousands: each row is a live widget tree, and
+    the mousewheel tag is re-applied over the whole subtree on every hover.
+    ScrolledList instead takes an item count and two callables, and keeps
+    only enough row widgets to fill the viewport. As the view scrolls, rows
+    leaving it are recycled for the items entering it, so the cost of the
+    list is set by the viewport height, not by the number of items.
+
+    `row_factory(master)` builds one empty row widget; `update_row(row,
+    index)` fills an existing row with item `index`. Every row has the same
+    height, `row_height`.
+
+    Examples:
+
+        ```python
+        import ttkbootstrap as ttk
+
+        app = ttk.App()
+        names = [f"Item {i}" for i in range(100_000)]
+
+        sl = ttk.ScrolledList(
+            app,
+            item_count=len(names),
+            row_factory=lambda master: ttk.Label(master, padding=(8, 0)),
+            update_row=lambda row, index: row.configure(text=names[index]),
+        )
+        sl.pack(fill=BOTH, expand=YES, padx=10, pady=10)
+
+        app.mainloop()
+        ```
+    """
+
+    def __init__(
+            self,
+            master: Optional[tkinter.Misc] = None,
+            *,
+            row_factory: Callable[[tkinter.Misc], tkinter.Widget],
+            update_row: Callable[[tkinter.Widget, int], Any],
+            item_count: int = 0,
+            row_height: int = 28,
+            padding: int = 2,
+            bootstyle: str = DEFAULT,
+            auto_hide: bool = False,
+            height: int = 200,
+            width: int = 300,
+            **kwargs: Any,
+    ) -> None:
+        """
+        Parameters:
+
+            master (Widget):
+                The parent widget.
+
+            row_factory (Callable[[Widget], Widget]):
+                Called with the list's body frame to build one row widget.
+                Rows are reused for different items, so the factory should
+                build an empty row and leave the content to `update_row`.
+
+            update_row (Callable[[Widget, int], Any]):
+                Called with a row widget and an item index to show that
+                item in the row.
+
+            item_count (int):
+                The number of items in the list.
+
+            row_height (int):
+                The height of every row in screen units.
+
+            padding (int):
+                The amount of empty space to create on the outside of
+                the widget.
+
+            bootstyle (str):
+                A style keyword used to set the color and style of the
+                vertical scrollbar.
+
+            auto_hide (bool):
+                When **True**, the scrollbar hides when the mouse is not
+                within the widget.
+
+            height (int):
+                The height of the viewport in screen units.
+
+            width (int):
+                The width of the viewport in screen units.
+
+            **kwargs (dict[str, Any]):
+                Other keyword arguments passed to the outer frame.
+        """
+        if row_height < 1:
+            raise ValueError("row_height must be at least 1")
+        super().__init__(master, padding=padding, **kwargs)
+
+        self._row_factory = row_factory
+        self._update_row = update_row
+        self._count = max(0, int(item_count))
+        self._row_height = int(row_height)
+        self._height = height
+        self._offset = 0
+        self._auto_hide = auto_hide
+
+        # item index -> the row currently showing it; spare rows are unplaced
+        self._active: dict = {}
+        self._spare: list = []
+
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+        self._body: ttk.Frame = ttk.Frame(self, width=width, height=height)
+        self._body.grid(row=0, column=0, sticky=NSEW)
+
+        self._vbar: ttk.Scrollbar = ttk.Scrollbar(
+            master=self,
+            command=self.yview,
+            orient=VERTICAL,
+            bootstyle=bootstyle,
+        )
+        self._vbar.grid(row=0, column=1, sticky=NS)
+
+        # One wheel tag for the body and every row this list builds. The rows
+        # are ours, so the tag is added once when a row is created instead of
+        # re-walking a subtree on hover the way ScrolledFrame must.
+        self._wheel_tag = f"ScrolledList_{id(self)}"
+        for seq in wheel.wheel_sequences(self):
+            self.bind_class(self._wheel_tag, seq, self._on_mousewheel, "+")
+        if wheel.has_touchpad_scroll():
+            self.bind_class(
+                self._wheel_tag, wheel.TOUCHPAD_SCROLL, self._on_touchpad_scroll, "+"
+            )
+        self._add_wheel_tag(self._body)
+        self._add_wheel_tag(self._vbar)
+
+        self._body.bind("<Configure>", self._on_body_configure, "+")
+        self.bind("<Enter>", self._on_enter, "+")
+        self.bind("<Leave>", self._on_leave, "+")
+        if self._auto_hide:
+            self.hide_scrollbars()
+
+        self._render()
+
+    # -- items --------------------------------------------------------------- #
+    @property
+    def item_count(self) -> int:
+        """The number of items in the list."""
+        return self._count
+
+    @item_count.setter
+    def item_count(self, count: int) -> None:
+        self.set_item_count(count)
+
+    @property
+    def row_height(self) -> int:
+        """The height of every row in screen units."""
+        return self._row_height
+
+    @property
+    def body(self) -> ttk.Frame:
+        """The frame the rows are built in (the `row_factory` master)."""
+        return self._body
+
+    def set_item_count(self, count: int) -> None:
+        """Change the number of items and redraw the rows in view.
+
+        Rows that stay in view keep their content; call :meth:`refresh` when
+        the items themselves changed.
+        """
+        self._count = max(0, int(count))
+        for index in [i for i in self._active if i >= self._count]:
+            self._release(index)
+        self._render()
+
+    def refresh(self, index: Optional[int] = None) -> None:
+        """Re-run `update_row` for item `index`, or for every row in view."""
+        if index is None:
+            for i, row in self._active.items():
+                self._update_row(row, i)
+        elif index in self._active:
+            self._update_row(self._active[index], index)
+
+    def row_for(self, index: int) -> Optional[tkinter.Widget]:
+        """Return the row widget showing item `index`, or None when not in view."""
+        return self._active.get(index)
+
+    def visible_range(self) -> Tuple[int, int]:
+        """Return the `(first, last)` item indices in view; `last` is exclusive."""
+        rh = self._row_height
+        first = int(self._offset // rh)
+        last = int((self._offset + self._viewport_height() - 1) // rh) + 1
+        return min(first, self._count), min(last, self._count)
+
+    def see(self, index: int) -> None:
+        """Scroll the least distance that brings item `index` fully into view."""
+        if not 0 <= index < self._count:
+            return
+        top = index * self._row_height
+        bottom = top + self._row_height
+        view_h = self._viewport_height()
+        if top < self._offset:
+            self._scroll_to(top)
+        elif bottom > self._offset + view_h:
+            self._scroll_to(bottom - view_h)
+
+    # -- view (scrollbar protocol) ------------------------------------------- #
+    def yview(self, *args: Any) -> Optional[Tuple[float, float]]:
+        """Query or command the vertical view; returns `(first, last)` on query.
+
+        Accepts the same commands a Scrollbar sends: ``moveto fraction`` and
+        ``scroll number units|pages``.
+        """
+        if not args:
+            total = self._count * self._row_height
+            if total <= 0:
+                return 0.0, 1.0
+            first = self._offset / total
+            last = min(1.0, (self._offset + self._viewport_height()) / total)
+            return first, last
+        if args[0] == MOVETO:
+            self.yview_moveto(float(args[1]))
+        elif args[0] == SCROLL:
+            self.yview_scroll(int(args[1]), args[2])
+        return None
+
+    def yview_moveto(self, fraction: float) -> None:
+        """Scroll so `fraction` (0.0-1.0) of the content is above the viewport."""
+        self._scroll_to(fraction * self._count * self._row_height)
+
+    def yview_scroll(self, number: int, what: str = UNITS) -> None:
+        """Scroll vertically by `number` of `what` (units are rows)."""
+        if what == PAGES:
+            step = max(self._row_height, self._viewport_height() - self._row_height)
+        else:
+            step = self._row_height
+        self._scroll_to(self._offset + number * step)
+
+    # -- rendering ----------------------------------------------------------- #
+    def _viewport_height(self) -> int:
+        """The body height, or the requested height before it is realized."""
+        height = self._body.winfo_height()
+        return height if height > 1 else self._height
+
+    def _scroll_to(self, offset: float) -> None:
+        total = self._count * self._row_height
+        limit = max(0, total - self._viewport_height())
+        offset = int(min(max(0, offset), limit))
+        if offset != self._offset:
+            self._offset = offset
+            self._render()
+
+    def _render(self) -> None:
+        """Place a row for every item in view, recycling those that left it."""
+        limit = max(0, self._count * self._row_height - self._viewport_height())
+        self._offset = min(self._offset, limit)
+        first, last = self.visible_range()
+
+        freed = [
+            self._active.pop(i) for i in list(self._active)
+            if not first <= i < last
+        ]
+        rh = self._row_height
+        for index in range(first, last):
+            row = self._active.get(index)
+            if row is None:
+                if freed:
+                    row = freed.pop()
+                elif self._spare:
+                    row = self._spare.pop()
+                else:
+                    row = self._create_row()
+                self._update_row(row, index)
+                self._active[index] = row
+            row.place(x=0, y=index * rh - self._offset, relwidth=1, height=rh)
+        for row in freed:
+            row.place_forget()
+            self._spare.append(row)
+        self._vbar.set(*self.yview())
+
+    def _create_row(self) -> tkinter.Widget:
+        row = self._row_factory(self._body)
+        stack = [row]
+        while stack:
+            widget = stack.pop()
+            self._add_wheel_tag(widget)
+            stack.extend(widget.winfo_children())
+        return row
+
+    def _release(self, index: int) -> None:
+        row = self._active.pop(index)
+        row.place_forget()
+        self._spare.append(row)
+
+    def _add_wheel_tag(self, widget: tkinter.Misc) -> None:
+        tags = widget.bindtags()
+        if self._wheel_tag not in tags:
+            widget.bindtags((tags[0], self._wheel_tag) + tags[1:])
+
+    def _on_body_configure(self, event: tkinter.Event) -> None:
+        self._render()
+
+    # -- wheel --------------------------------------------------------------- #
+    def _on_mousewheel(self, event: tkinter.Event) -> None:
+        """Scroll by whole rows in response to the mouse wheel."""
+        delta = -round(wheel.wheel_notches(self, event))
+        if delta:
+            self.yview_scroll(delta, UNITS)
+
+    def _on_touchpad_scroll(self, event: tkinter.Event) -> None:
+        """Scroll by pixels in response to a precise-delta gesture.
+
+        The list is positioned in pixels, so unlike ScrolledFrame there is no
+        remainder to accumulate: each delta is applied as it arrives.
+        """
+        _, dy = wheel.precise_deltas(event)
+        if dy:
+            self._scroll_to(self._offset - dy)
+
+    # -- scrollbar visibility ------------------------------------------------ #
+    @property
+    def auto_hide(self) -> bool:
+        """Whether the scrollbar hides when the mouse leaves the widget."""
+        return self._auto_hide
+
+    @property
+    def vbar(self) -> ttk.Scrollbar:
+        """The vertical scrollbar."""
+        return self._vbar
+
+    def hide_scrollbars(self) -> None:
+        """Hide the scrollbar."""
+        self._vbar.grid_remove()
+
+    def show_scrollbars(self) -> None:
+        """Show the scrollbar."""
+        self._vbar.grid()
+
+    def autohide_scrollbar(self) -> None:
+        """Toggle the auto-hide behavior."""
+        self._auto_hide = not self._auto_hide
+        if self._auto_hide:
+            self.hide_scrollbars()
+        else:
+            self.show_scrollbars()
+
+    def _on_enter(self, event: tkinter.Event) -> None:
+        if self._auto_hide:
+            self.show_scrollbars()
+
+    def _on_leave(self, event: tkinter.Event) -> None:
+        if self._auto_hide:
+            self.hide_scrollbars()
+
+    # -- teardown ------------------------------------------------------------ #
+    def destroy(self) -> None:
+        """Destroy the list, its rows, and its wheel class bindings."""
+        try:
+            for seq in wheel.wheel_sequences(self):
+                self.unbind_class(self._wheel_tag, seq)
+            if wheel.has_touchpad_scroll():
+                self.unbind_class(self._wheel_tag, wheel.TOUCHPAD_SCROLL)
+        except tkinter.TclError:
+            pass
+        self._active.clear()
+        self._spare.clear()
+        super().destroy()
@@ -3,6 +3,7 @@
 A `ttk.Treeview`-based table with column sorting, row striping, pagination,
 searching, and data loading from lists, dicts, or CSV files.
 """
+import threading
 import tkinter as tk
 from datetime import datetime
 from math import ceil
@@ -10,8 +11,10 @@ from tkinter import font
 from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
 import ttkbootstrap as ttk
-from ttkbootstrap import utils
+from ttkbootstrap import profiling, utils
 from ttkbootstrap.constants import *
+from ttkbootstrap.internal.dispatch import UIDispatcher
+from ttkbootstrap.internal.render_queue import RenderQueue
 from ttkbootstrap.localization import MessageCatalog
 from ttkbootstrap.style._compat import warn_deprecated
 
@@ -352,13 +355,29 @@ class TableRow:
             tags.append("striped")
         self.view.item(self.iid, tags=tags)
 
-    def delete(self) -> None:
-        """Delete the row from the dataset"""
-        if self.iid:
-            self._table.iidmap.pop(self.iid)
-            self._table.tablerows_visible.remove(self)
-            self._table._tablerows.remove(self)
-            self._table.load_table_data()
+    def delete(self, reload=True) -> None:
+        """Delete the row from the dataset
+
+        Parameters:
+
+            reload (Union[bool, str]):
+                Whether to reload the table data after deleting. Pass
+                ``"idle"`` to reload at the next idle pass instead (see
+                `Tableview.schedule_reload`), so deleting several rows in
+                a row costs one reload. Defaults to True.
+        """
+        table = self._table
+        table._tablerows.remove(self)
+        # A row inserted with a deferred reload may not have reached the view.
+        if self in table.tablerows_visible:
+            table.tablerows_visible.remove(self)
+        if self._iid is not None:
+            table.iidmap.pop(self.iid, None)
+        if reload == "idle":
+            table.schedule_reload()
+        elif reload:
+            table.load_table_data()
+        if self._iid is not None:
             self.view.delete(self.iid)
 
     def hide(self) -> None:
@@ -572,6 +591,13 @@ class Tableview(ttk.Frame):
         self._on_select = on_select
         self._iid_field = iid_field
         self._iid_field_index = None  # Resolved column index for iid_field
+        # rows handed over by insert_rows_threadsafe, not yet inserted; the
+        # dispatcher they travel through is created here, on the UI thread
+        self._threadsafe_inserts = []
+        self._threadsafe_lock = threading.Lock()
+        UIDispatcher.for_widget(self)
+        # a reload queued by schedule_reload clears the filters when run
+        self._reload_clears_filters = False
 
         self.view: ttk.Treeview = None
         self._build_tableview_widget(coldata or [], rowdata or [], bootstyle)
@@ -802,10 +828,12 @@ class Tableview(ttk.Frame):
                 must match the number of columns in the data set for
                 the values to be visible.
 
-            reload (bool):
-                Whether to reload the table data after inserting.
-                Set to False when inserting multiple rows for better
-                performance. Defaults to True.
+            reload (Union[bool, str]):
+                Whether to reload the table data after inserting. Pass
+                ``"idle"`` to reload at the next idle pass instead (see
+                `schedule_reload`), so rows inserted one at a time in a
+                loop share a single reload; the returned row is not in
+                the view until then. Defaults to True.
 
         Returns:
 
@@ -828,7 +856,9 @@ class Tableview(ttk.Frame):
         else:
             self._tablerows.insert(index, record)
 
-        if reload:
+        if reload == "idle":
+            self.schedule_reload(self.is_filtered)
+        elif reload:
             self.load_table_data(self.is_filtered)
 
         return record
@@ -862,6 +892,45 @@ class Tableview(ttk.Frame):
         # Reload once after all rows are inserted
         self.load_table_data(self.is_filtered)
 
+    def insert_rows_threadsafe(self, index, rowdata):
+        """Like `insert_rows`, but safe to call from any thread.
+
+        The rows are inserted on the UI thread. Every batch handed over before
+        the event loop next turns is inserted together, with a single table
+        reload for all of them.
+
+        Parameters:
+
+            index (Union[int, str]):
+                As for `insert_rows`.
+
+            rowdata (list[Any, list]):
+                As for `insert_rows`.
+
+        Returns:
+
+            bool:
+                False if the application has already been destroyed.
+        """
+        rowdata = list(rowdata)
+        if not rowdata:
+            return True
+        with self._threadsafe_lock:
+            self._threadsafe_inserts.append((index, rowdata))
+        return UIDispatcher.for_widget(self).call_soon(
+            self._flush_threadsafe_inserts, key=(self._w, "insert_rows"))
+
+    def _flush_threadsafe_inserts(self):
+        with self._threadsafe_lock:
+            batches = self._threadsafe_inserts
+            self._threadsafe_inserts = []
+        if not batches or not self.winfo_exists():
+            return
+        for index, rowdata in batches:
+            for values in reversed(rowdata):
+                self.insert_row(index, values, reload=False)
+        self.load_table_data(self.is_filtered)
+
     def delete_column(self, index=None, cid=None, visible=True):
         """Delete the specified column based on the column index or the
         unique cid.
@@ -960,6 +1029,8 @@ class Tableview(ttk.Frame):
         elif index is not None:
             # visible index
             if visible:
+                # A visible index refers to the reloaded page.
+                RenderQueue.for_widget(self).flush((self._w, "reload"))
                 record = self.tablerows_visible[index]
                 record.delete()
             # original index
@@ -1117,6 +1188,29 @@ class Tableview(ttk.Frame):
             row.hide()
         self.tablerows_visible.clear()
 
+    def schedule_reload(self, clear_filters=False):
+        """Reload the table data at the next idle pass.
+
+        Every reload scheduled before the event loop next goes idle runs as
+        one `load_table_data`; it clears the filters if any of the requests
+        asked to. A direct `load_table_data` call in the meantime performs
+        the pending reload and cancels it.
+
+        Parameters:
+
+            clear_filters (bool):
+                Specifies that the table filters should be cleared
+                before loading the data into the view.
+        """
+        self._reload_clears_filters = self._reload_clears_filters or clear_filters
+        RenderQueue.for_widget(self).invalidate(
+            (self._w, "reload"), self._reload_if_alive)
+
+    def _reload_if_alive(self):
+        if self.winfo_exists():
+            self.load_table_data()
+
+    @profiling.profiled("tableview.load")
     def load_table_data(self, clear_filters=False):
         """Load records into the tableview.
 
@@ -1126,6 +1220,12 @@ class Tableview(ttk.Frame):
                 Specifies that the table filters should be cleared
                 before loading the data into the view.
         """
+        # This load supersedes a reload scheduled for the idle pass.
+        if self._reload_clears_filters:
+            clear_filters = True
+            self._reload_clears_filters = False
+        RenderQueue.for_widget(self).discard((self._w, "reload"))
+
         if len(self.tablerows) == 0:
             return
 
@@ -1415,6 +1515,7 @@ class Tableview(ttk.Frame):
 
     # COLUMN SORTING
 
+    @profiling.profiled("tableview.sort")
     def sort_column_data(self, event=None, cid=None, sort=None):
         """Sort the table rows by the specified column. This method
         may be trigged by an event or manually.
@@ -1484,6 +1585,7 @@ class Tableview(ttk.Frame):
 
     # DATA SEARCH & FILTERING
 
+    @profiling.profiled("tableview.search")
     def search_table_data(self, criteria, *columns):
         """Search the table data for records that match the search criteria.
 
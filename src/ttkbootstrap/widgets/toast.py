@@ -9,6 +9,7 @@ from tkinter import font
 from typing import Any, Optional
 
 from ttkbootstrap.constants import *
+from ttkbootstrap.internal.dispatch import UIDispatcher
 from ttkbootstrap.style._compat import warn_deprecated
 
 #: The valid ``position`` anchors (compass points).
@@ -163,6 +164,10 @@ class ToastNotification:
         self.toplevel = None
         self.container = None
         self.title_font = None
+        # for `show_threadsafe`/`hide_threadsafe`: create the dispatcher on the
+        # UI thread while it is known to be the caller
+        if tkinter._default_root is not None:
+            UIDispatcher.for_widget(tkinter._default_root)
 
         # lifecycle bookkeeping
         self._anchor: Optional[str] = None
@@ -294,6 +299,28 @@ class ToastNotification:
     def hide_toast(self, *_: Any) -> None:
         self.hide()
 
+    def show_toast_threadsafe(self) -> bool:
+        """Schedule :meth:`show_toast` on the UI thread; safe from any thread.
+
+        Returns ``False`` if the application has already been destroyed.
+
+        Raises:
+            RuntimeError: If there is no application root to show it on.
+        """
+        return self._dispatcher().call_soon(self.show_toast)
+
+    def hide_threadsafe(self) -> bool:
+        """Schedule :meth:`hide` on the UI thread; safe from any thread."""
+        return self._dispatcher().call_soon(self.hide)
+
+    def _dispatcher(self) -> UIDispatcher:
+        from tkinter import _default_root
+
+        root = self.toplevel if self.toplevel is not None else _default_root
+        if root is None:
+            raise RuntimeError("ToastNotification needs an application root")
+        return UIDispatcher.for_widget(root)
+
     def _fade_out(self) -> None:
         if self.toplevel is None:
             return
@@ -3,6 +3,10 @@
 A semi-transparent tooltip that shows text on hover and hides on leave or click.
 Supports a configurable delay, mouse-following or widget-anchored positioning,
 text wrapping/justification, an optional image, and live reconfiguration.
+
+`ToolTipRegistry` serves the same popup for many widgets at once: one set of
+``all``-tag bindings and one reusable popup per root, with the text looked up
+by widget path.
 """
 import tkinter
 from tkinter import Event, Misc
@@ -338,36 +342,389 @@ class ToolTip:
     def _calculate_position(self) -> tuple[int, int]:
         w = self.widget
         self.toplevel.update_idletasks()
-        tip_w = self.toplevel.winfo_reqwidth()
-        tip_h = self.toplevel.winfo_reqheight()
-
-        widget_x = w.winfo_rootx()
-        widget_y = w.winfo_rooty()
-        widget_w = w.winfo_width()
-        widget_h = w.winfo_height()
-
-        horiz = "center"
-        vert = "bottom"
-        for token in self.position.split():
-            if token in ("top", "bottom", "center"):
-                vert = token
-            if token in ("left", "right", "center"):
-                horiz = token
-
-        # Vertical positioning
-        if vert == "top":
-            y = widget_y - tip_h - 4
-        elif vert == "bottom":
-            y = widget_y + widget_h + 4
-        else:  # center
-            y = widget_y + (widget_h // 2) - (tip_h // 2)
-
-        # Horizontal positioning
-        if horiz == "left":
-            x = widget_x - tip_w - 4
-        elif horiz == "right":
-            x = widget_x + widget_w + 4
-        else:  # center
-            x = widget_x + (widget_w // 2) - (tip_w // 2)
-
-        return x, y
\ No newline at end of file
+        return _anchored_position(
+            self.position,
+            (w.winfo_rootx(), w.winfo_rooty(), w.winfo_width(), w.winfo_height()),
+            (self.toplevel.winfo_reqwidth(), self.toplevel.winfo_reqheight()),
+        )
+
+
+def _anchored_position(
+        position: str,
+        widget_rect: tuple[int, int, int, int],
+        tip_size: tuple[int, int],
+) -> tuple[int, int]:
+    """Return the popup's `(x, y)` for a `position` string around a widget.
+
+    `widget_rect` is the target's `(rootx, rooty, width, height)` and
+    `tip_size` the popup's requested `(width, height)`.
+    """
+    widget_x, widget_y, widget_w, widget_h = widget_rect
+    tip_w, tip_h = tip_size
+
+    horiz = "center"
+    vert = "bottom"
+    for token in position.split():
+        if token in ("top", "bottom", "center"):
+            vert = token
+        if token in ("left", "right", "center"):
+            horiz = token
+
+    # Vertical positioning
+    if vert == "top":
+        y = widget_y - tip_h - 4
+    elif vert == "bottom":
+        y = widget_y + widget_h + 4
+    else:  # center
+        y = widget_y + (widget_h // 2) - (tip_h // 2)
+
+    # Horizontal positioning
+    if horiz == "left":
+        x = widget_x - tip_w - 4
+    elif horiz == "right":
+        x = widget_x + widget_w + 4
+    else:  # center
+        x = widget_x + (widget_w // 2) - (tip_w // 2)
+
+    return x, y
+
+
+# The Tcl variable holding the path of the widget whose registry tip is armed.
+# The shared `<Motion>` binding compares against it in Tcl, so pointer motion
+# over every other widget in the application never reaches Python.
+_REGISTRY_TARGET_VAR = "::_ttkbootstrap_tooltip_target"
+# Tcl array of the widget paths the registry listens to, so the ``all``-tag
+# bindings can skip every other widget without calling into Python.
+_REGISTRY_PATHS_VAR = "::_ttkbootstrap_tooltip_paths"
+_REGISTRY_ATTRIBUTE = "_ttkbootstrap_tooltips"
+
+
+class ToolTipRegistry:
+    """Tooltips for many widgets on one root, sharing a single popup.
+
+    A :class:`ToolTip` binds its own handlers on its target and builds a fresh
+    popup on every hover, which is the right trade for a handful of widgets and
+    the wrong one for a form with thousands of cells. The registry binds its
+    handlers once, on the ``all`` tag, and keeps one pre-styled popup per root
+    that is withdrawn between hovers rather than destroyed. The tooltip text is
+    looked up by widget path, so :meth:`add` is a dictionary insert -- it does
+    not touch the widget at all.
+
+    Options (`delay`, `bootstyle`, `position`, ...) are shared by every widget
+    in the registry. Use :class:`ToolTip` for a widget that needs its own.
+
+    Examples:
+
+        ```python
+        import ttkbootstrap as ttk
+
+        app = ttk.App()
+        tips = ttk.ToolTipRegistry.for_widget(app)
+        for row in range(100):
+            for col in range(20):
+                cell = ttk.Entry(app, width=6)
+                cell.grid(row=row, column=col)
+                tips.add(cell, f"row {row}, column {col}")
+
+        app.mainloop()
+        ```
+    """
+
+    #: Options that :meth:`configure`/:meth:`cget` understand.
+    _OPTIONS = (
+        "bootstyle", "position", "delay", "wraplength", "justify", "padding",
+    )
+
+    def __init__(
+            self,
+            root: Misc,
+            *,
+            padding: int = 10,
+            justify: Literal["left", "center", "right"] = "left",
+            bootstyle: Optional[str] = None,
+            wraplength: Optional[int] = None,
+            delay: int = 250,  # milliseconds
+            position: Optional[str] = None,
+    ) -> None:
+        """
+        Prefer :meth:`for_widget`, which returns the registry already bound to
+        a root instead of installing a second set of handlers.
+
+        Parameters:
+
+            root (Tk):
+                The application root whose widgets the registry serves.
+
+            padding (int):
+                The padding between the text and the border of the tooltip
+                (default=10).
+
+            justify ('left', 'center', 'right'):
+                How to justify multi-line tooltip text (default='left').
+
+            bootstyle (str):
+                The style to apply to the tooltip label. You can use
+                any of the standard ttkbootstrap label styles.
+
+            wraplength (int):
+                The width of the tooltip window in screen units before the
+                text is wrapped to the next line. By default, this will be
+                a scaled factor of 300.
+
+            delay (int):
+                The delay in milliseconds before the tooltip appears on hover
+                (default=250).
+
+            position (str):
+                If provided, sets the position of the tooltip relative to the
+                hovered widget, as for :class:`ToolTip`. If not provided, the
+                tooltip is offset from the mouse pointer.
+        """
+        self.root = root
+        self.padding = padding
+        self.justify = justify
+        self.bootstyle = bootstyle
+        self.wraplength = wraplength or utils.scale_size(root, 300)
+        self.delay = delay
+        self.position = position.lower() if position else None
+        ToolTip._validate_position(self.position)
+
+        self.toplevel = None
+        self._label: Optional[ttk.Label] = None
+        self._texts: dict[str, str] = {}
+        self._target: Optional[str] = None
+        self._visible = False
+        self._after_id = None
+        self._install_bindings()
+
+    @classmethod
+    def for_widget(cls, widget: Misc) -> "ToolTipRegistry":
+        """Return the registry attached to `widget`'s root, creating it once."""
+        root = widget._root()
+        registry = getattr(root, _REGISTRY_ATTRIBUTE, None)
+        if registry is None:
+            registry = cls(root)
+            setattr(root, _REGISTRY_ATTRIBUTE, registry)
+        return registry
+
+    # -- registration -------------------------------------------------------- #
+    def add(self, widget: Misc, text: str) -> None:
+        """Show `text` when the pointer hovers over `widget`.
+
+        Adding a widget that is already registered replaces its text, and a
+        tooltip currently showing for it is updated in place.
+        """
+        path = str(widget)
+        if path not in self._texts:
+            self._watch(path)
+        self._texts[path] = text
+        if self._visible and path == self._target and self._label is not None:
+            self._label.configure(text=text)
+
+    def remove(self, widget: Misc) -> None:
+        """Stop showing a tooltip for `widget` (no-op when not registered)."""
+        path = str(widget)
+        if self._texts.pop(path, None) is not None:
+            self._unwatch(path)
+        if path == self._target:
+            self._disarm()
+
+    def get(self, widget: Misc, default: Optional[str] = None) -> Optional[str]:
+        """Return the text registered for `widget`, or `default`."""
+        return self._texts.get(str(widget), default)
+
+    def __contains__(self, widget: Misc) -> bool:
+        return str(widget) in self._texts
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    # -- configure / cget ---------------------------------------------------- #
+    def configure(self, cnf: Any = None, **kwargs: Any) -> Any:
+        """Query or set the options shared by every registered widget.
+
+        With a single option name and no keyword arguments, returns that
+        option's value (like :meth:`cget`). Otherwise applies the given
+        options; the shared popup picks them up on its next show.
+        """
+        if cnf is not None and not kwargs and isinstance(cnf, str):
+            return self.cget(cnf)
+        if isinstance(cnf, dict):
+            kwargs = {**cnf, **kwargs}
+        for key, value in kwargs.items():
+            if key not in self._OPTIONS:
+                raise ValueError(f"unknown tooltip option: {key!r}")
+            if key == "position":
+                value = value.lower() if value else None
+                ToolTip._validate_position(value)
+            setattr(self, key, value)
+        if kwargs and self._label is not None:
+            try:
+                self._style_label()
+            except tkinter.TclError:
+                pass
+        return None
+
+    config = configure
+
+    def cget(self, key: str) -> Any:
+        """Return the value of a shared tooltip option."""
+        if key not in self._OPTIONS:
+            raise ValueError(f"unknown tooltip option: {key!r}")
+        return getattr(self, key)
+
+    # -- bindings ------------------------------------------------------------ #
+    def _install_bindings(self) -> None:
+        """Bind the shared handlers on the ``all`` tag, once per registry.
+
+        The scripts filter in Tcl -- enter and destroy against the registered
+        paths, leave and motion against the armed target -- so events on other
+        widgets never reach Python, and pass only ``%W`` (and the pointer for
+        motion) to commands registered directly, so a hover costs one Python
+        call rather than a fully substituted :class:`tkinter.Event`.
+        """
+        tk = self.root.tk
+        enter = self.root.register(self._on_enter)
+        leave = self.root.register(self._on_leave)
+        motion = self.root.register(self._on_motion)
+        destroyed = self.root.register(self._on_destroy)
+        tk.call("set", _REGISTRY_TARGET_VAR, "")
+        tk.call("array", "set", _REGISTRY_PATHS_VAR, "")
+        registered = f"[llength [array names {_REGISTRY_PATHS_VAR} -exact %W]]"
+        targeted = f"[string equal %W ${_REGISTRY_TARGET_VAR}]"
+        tk.call("bind", "all", "<Enter>", f"+if {{{registered}}} {{{enter} %W}}")
+        tk.call("bind", "all", "<Leave>", f"+if {{{targeted}}} {{{leave} %W}}")
+        tk.call("bind", "all", "<ButtonPress>", f"+if {{{targeted}}} {{{leave} %W}}")
+        tk.call("bind", "all", "<Destroy>", f"+if {{{registered}}} {{{destroyed} %W}}")
+        tk.call("bind", "all", "<Motion>", f"+if {{{targeted}}} {{{motion} %X %Y}}")
+
+    def _watch(self, path: str) -> None:
+        self.root.tk.call("set", f"{_REGISTRY_PATHS_VAR}({path})", 1)
+
+    def _unwatch(self, path: str) -> None:
+        try:
+            self.root.tk.call("unset", "-nocomplain", f"{_REGISTRY_PATHS_VAR}({path})")
+        except tkinter.TclError:
+            pass
+
+    def _on_enter(self, path: str) -> None:
+        if path not in self._texts:
+            return
+        self._disarm()
+        self._target = path
+        self.root.tk.call("set", _REGISTRY_TARGET_VAR, path)
+        self._after_id = self.root.after(self.delay, self.show_tip)
+
+    def _on_leave(self, path: str) -> None:
+        if path == self._target:
+            self._disarm()
+
+    def _on_motion(self, x: str, y: str) -> None:
+        if self._visible and not self.position:
+            self._place(int(x) + 25, int(y) + 10)
+
+    def _on_destroy(self, path: str) -> None:
+        self._unwatch(path)
+        if self.toplevel is not None and path == str(self.toplevel):
+            self.toplevel = None
+            self._label = None
+            self._visible = False
+            return
+        if self._texts.pop(path, None) is not None and path == self._target:
+            self._disarm()
+
+    def _disarm(self) -> None:
+        """Cancel a pending show and hide the popup."""
+        after_id, self._after_id = self._after_id, None
+        if after_id:
+            try:
+                self.root.after_cancel(after_id)
+            except (ValueError, tkinter.TclError):
+                pass
+        if self._target is not None:
+            self._target = None
+            try:
+                self.root.tk.call("set", _REGISTRY_TARGET_VAR, "")
+            except tkinter.TclError:
+                pass
+        self.hide_tip()
+
+    # -- show / hide --------------------------------------------------------- #
+    def show_tip(self) -> None:
+        """Show the shared popup for the widget under the pointer."""
+        self._after_id = None
+        path = self._target
+        text = self._texts.get(path) if path else None
+        if text is None:
+            return
+        tk = self.root.tk
+        try:
+            if not tk.getboolean(tk.call("winfo", "exists", path)):
+                return
+            self._ensure_popup()
+            self._label.configure(text=text)
+            self.toplevel.update_idletasks()
+            if self.position:
+                x, y = _anchored_position(
+                    self.position,
+                    (
+                        tk.getint(tk.call("winfo", "rootx", path)),
+                        tk.getint(tk.call("winfo", "rooty", path)),
+                        tk.getint(tk.call("winfo", "width", path)),
+                        tk.getint(tk.call("winfo", "height", path)),
+                    ),
+                    (self.toplevel.winfo_reqwidth(), self.toplevel.winfo_reqheight()),
+                )
+            else:
+                x = self.root.winfo_pointerx() + 25
+                y = self.root.winfo_pointery() + 10
+            self._place(x, y)
+            self.toplevel.deiconify()
+            self._visible = True
+        except tkinter.TclError:
+            pass
+
+    def hide_tip(self) -> None:
+        """Withdraw the shared popup; it is kept for the next hover."""
+        if not self._visible:
+            return
+        self._visible = False
+        if self.toplevel is not None:
+            try:
+                self.toplevel.withdraw()
+            except tkinter.TclError:
+                pass
+
+    def _ensure_popup(self) -> None:
+        """Build the shared popup the first time it is needed."""
+        if self.toplevel is not None:
+            return
+        self.toplevel = ttk.window.Toplevel(
+            position=(0, 0),
+            master=self.root,
+            override_redirect=True,
+            window_type="tooltip",
+            alpha=0.95,
+            topmost=True,
+        )
+        self.toplevel.withdraw()
+        self._watch(str(self.toplevel))  # so its <Destroy> reaches `_on_destroy`
+        self._label = ttk.Label(master=self.toplevel)
+        self._label.pack(fill=BOTH, expand=YES)
+        self._style_label()
+
+    def _style_label(self) -> None:
+        self._label.configure(
+            justify=self.justify,
+            wraplength=self.wraplength,
+            padding=self.padding,
+        )
+        if self.bootstyle:
+            self._label.configure(bootstyle=self.bootstyle)
+        else:
+            self._label.configure(style="tooltip.TLabel")
+
+    def _place(self, x: int, y: int) -> None:
+        """Move the popup to `(x, y)`, clamped to the monitor it lands on."""
+        x, y = ensure_on_screen(self.toplevel, x, y, padding=8, titlebar_height=0)
+        self.toplevel.geometry(f"+{x}+{y}")
@@ -12,12 +12,13 @@ import sys
 import tkinter
 import warnings
 from pathlib import Path
-from typing import Any, Callable, Optional, Tuple, Union
+from typing import Any, Awaitable, Callable, Optional, Tuple, Union
 
-from ttkbootstrap import utils
+from ttkbootstrap import aio, utils
 from ttkbootstrap.constants import *
 from ttkbootstrap.internal import positioning
 from ttkbootstrap.internal.busy import BusyMixin
+from ttkbootstrap.internal.dispatch import UIDispatcher
 from ttkbootstrap.style import Style, Bootstyle
 from ttkbootstrap.style._compat import normalize_window_kwargs
 
@@ -274,6 +275,19 @@ class _BaseWindow(BusyMixin):
         self.protocol("WM_DELETE_WINDOW", _handler)
         return callback
 
+    def call_soon_threadsafe(self, callback: Callable[..., Any], *args: Any) -> bool:
+        """Run `callback(*args)` on the UI thread; safe to call from any thread.
+
+        This is how a worker thread updates widgets: it never touches a widget
+        itself, it hands the update to the event loop. The loop is woken once
+        and then runs every callback queued so far in one batch, in the order
+        they were queued -- there is no polling and no ``after`` delay.
+
+        Returns `False`, and drops the callback, once the application root has
+        been destroyed (a worker finishing after the window closed).
+        """
+        return UIDispatcher.for_widget(self).call_soon(callback, *args)
+
     # -- setup helpers -----------------------------------------------------
 
     def _setup_icon(self, iconphoto: Optional[str], default_data: Optional[str] = None) -> None:
@@ -681,6 +695,9 @@ class App(_BaseWindow, tkinter.Tk):
         super().__init__(**kwargs)
         self.winsys: str = utils.windowing_system(self)
         self._watch_for_first_map()
+        # Install the cross-thread wakeup now, on the thread that owns the
+        # interpreter, so workers can call_soon_threadsafe from the start.
+        UIDispatcher.for_widget(self)
 
         if scaling is not None:
             utils.enable_high_dpi_awareness(self, scaling)
@@ -708,6 +725,27 @@ class App(_BaseWindow, tkinter.Tk):
         if on_close is not None:
             self.on_close(on_close)
 
+    def run_async(self, main: Optional[Awaitable[Any]] = None) -> Any:
+        """Run the application on an asyncio event loop instead of `mainloop`.
+
+        Blocks until the window is closed, pumping Tk events from the loop so
+        coroutines can update widgets directly and await dialogs
+        (``await Messagebox.ashow_info(...)``). `main` is an optional
+        coroutine run alongside; it is cancelled if the window closes first.
+        Returns the result of `main`. See `ttkbootstrap.aio`.
+
+        Examples:
+
+            ```python
+            async def main():
+                await asyncio.sleep(1)
+                label.configure(text="ready")
+
+            app.run_async(main())
+            ```
+        """
+        return aio.run(self, main)
+
     @staticmethod
     def _set_app_user_model_id() -> None:
         """On win32, set an explicit AppUserModelID so the taskbar groups this
@@ -870,6 +908,9 @@ class Toplevel(_BaseWindow, tkinter.Toplevel):
         super().__init__(**kwargs)
         self.winsys: str = utils.windowing_system(self)
         self._watch_for_first_map()
+        # As in `App`: a plain `tkinter.Tk` root gets its cross-thread wakeup
+        # here, on the UI thread, before a worker can reach for it.
+        UIDispatcher.for_widget(self)
 
         # On aqua, give a borderless popup type (tooltip/splash/...) a native
         # macOS window class instead of the default chrome, so it isn't drawn
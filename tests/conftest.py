@@ -38,13 +38,14 @@ def _pin_baseline_density(app):
 
     Pinned after the root is built, since `Window()` creates the root and the
     `Style` together -- so the handful of styles `create_default_style` builds
-    eagerly are already sized to the host. Running it again re-runs those
-    recipes at the pinned density (the recipes are invoked unconditionally; the
-    build-once check is at the call site), leaving nothing sized to the display.
-    Every other style is built lazily on first use, i.e. after this.
+    eagerly are already sized to the host. `refresh` picks the new factor up
+    and, when it changed, rebuilds those styles at the pinned density, leaving
+    nothing sized to the display. Every other style is built lazily on first
+    use, i.e. after this.
     """
-    app.tk.call("tk", "scaling", Scaling.for_widget(app).baseline)
-    Style.get_instance()._get_builder().create_default_style()
+    scaling = Scaling.for_widget(app)
+    app.tk.call("tk", "scaling", scaling.baseline)
+    scaling.refresh()
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -203,3 +203,67 @@ def test_set_locale_queues_before_root(locale_reset, monkeypatch):
     config.flush_pending_config()
     assert MessageCatalog.locale() == "zz"
     assert not config._pending
+
+
+# --------------------------------------------------------------------------
+# translation cache, lazy tables, bulk re-translation
+# --------------------------------------------------------------------------
+
+def _msgcat_calls(recorder):
+    return [c for c in recorder.calls
+            if c.args and str(c.args[0]) in ("::msgcat::mc", "apply")]
+
+
+def test_repeat_translation_is_served_from_the_cache(locale_reset):
+    from ttkbootstrap import profiling
+
+    MessageCatalog.set("zz", "Owl", "Uil")
+    MessageCatalog.locale("zz")
+    assert L("Owl") == "Uil"
+    with profiling.record_tcl_calls(locale_reset) as rec:
+        assert L("Owl") == "Uil"
+        assert MessageCatalog.translate("Owl") == "Uil"
+    assert rec.count == 0
+
+
+def test_set_invalidates_the_cache(locale_reset):
+    MessageCatalog.locale("zz")
+    assert MessageCatalog.translate("Fox") == "Fox"
+    MessageCatalog.set("zz", "Fox", "Vos")
+    assert MessageCatalog.translate("Fox") == "Vos"
+
+
+def test_builtin_tables_load_when_their_locale_is_first_used(locale_reset, monkeypatch):
+    from ttkbootstrap.localization import msgs
+    from ttkbootstrap.localization.msgcat import _CatalogState
+
+    table = msgs.LocaleMsgs("zy-ZY", ("Bee", "Zybee"))
+    monkeypatch.setattr(msgs, "MESSAGES", msgs.MESSAGES + [table])
+    state = _CatalogState.for_root(locale_reset)
+    assert "zy_zy" not in state._loaded
+    MessageCatalog.locale("zy_zy")
+    assert "zy_zy" in state._loaded
+    assert MessageCatalog.translate("Bee") == "Zybee"
+
+
+def test_locale_switch_translates_all_vars_in_one_batch(locale_reset):
+    from ttkbootstrap import profiling
+
+    root = locale_reset
+    MessageCatalog.set_many("zz", "Red", "Rot", "Blue", "Blau")
+    MessageCatalog.locale("en")
+    variables = [LocaleVar(root, src) for src in ("Red", "Blue") * 200]
+    MessageCatalog.locale("zz")
+    with profiling.record_tcl_calls(root) as rec:
+        root.update()
+    assert [v.get() for v in variables[:2]] == ["Rot", "Blau"]
+    assert len(_msgcat_calls(rec)) == 1
+    for var in variables:
+        var.stop_tracking()
+
+
+def test_translate_many_keeps_order_and_duplicates(locale_reset):
+    MessageCatalog.set_many("zz", "One", "Een", "Two", "Twee")
+    MessageCatalog.locale("zz")
+    assert MessageCatalog.translate_many("Two", "One", "Two", "[x] {y}") == [
+        "Twee", "Een", "Twee", "[x] {y}"]
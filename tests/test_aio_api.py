@@ -0,0 +1,99 @@
+"""Tests for the asyncio integration (ttkbootstrap.aio and the ``ashow`` dialogs)."""
+import asyncio
+import inspect
+import threading
+
+from ttkbootstrap import aio
+from ttkbootstrap.dialogs import DatePickerDialog, MessageDialog, Messagebox
+from ttkbootstrap.internal.dispatch import UIDispatcher
+
+
+def _run_with_pump(root, coro_factory):
+    """Run `coro_factory()` while `aio.serve` pumps the (shared) root."""
+
+    async def driver():
+        server = asyncio.ensure_future(aio.serve(root))
+        try:
+            return await asyncio.wait_for(coro_factory(), timeout=5)
+        finally:
+            server.cancel()
+            try:
+                await server
+            except asyncio.CancelledError:
+                pass
+
+    return asyncio.run(driver())
+
+
+def test_serve_runs_tk_timers_alongside_coroutines(root):
+    fired = []
+
+    async def main():
+        root.after(20, fired.append, "tk")
+        await asyncio.sleep(0.1)
+        fired.append("asyncio")
+
+    _run_with_pump(root, main)
+    assert fired == ["tk", "asyncio"]
+
+
+def test_serve_drains_worker_callbacks_and_restores_the_default_waker(root):
+    ran = []
+
+    async def main():
+        done = asyncio.Event()
+        worker = threading.Thread(
+            target=root.call_soon_threadsafe, args=(lambda: (ran.append(1), done.set()),))
+        worker.start()
+        await done.wait()
+        worker.join()
+
+    _run_with_pump(root, main)
+    assert ran == [1]
+    assert UIDispatcher.for_widget(root)._waker is None
+
+
+def test_message_dialog_ashow_resolves_to_the_pressed_button(root):
+    dialog = MessageDialog(message="hi", parent=root, buttons=["OK:primary"])
+
+    async def main():
+        root.after(50, lambda: dialog._initial_focus.invoke())
+        return await dialog.ashow()
+
+    assert _run_with_pump(root, main) == "OK"
+
+
+def test_cancelling_ashow_closes_the_dialog(root):
+    dialog = MessageDialog(message="hi", parent=root)
+
+    async def main():
+        task = asyncio.ensure_future(dialog.ashow())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    _run_with_pump(root, main)
+    assert not dialog._toplevel.winfo_exists()
+
+
+def test_datepicker_ashow_resolves_to_the_selected_date(root):
+    chooser = DatePickerDialog(parent=root, autoshow=False)
+
+    async def main():
+        root.after(50, chooser._on_date_selected, 2, 3)
+        return await chooser.ashow()
+
+    picked = _run_with_pump(root, main)
+    assert picked == chooser.monthdates[2][3]
+
+
+def test_messagebox_has_awaitable_twins():
+    for name in ("show_info", "show_warning", "show_error", "show_question",
+                 "ok", "okcancel", "yesno", "yesnocancel", "retrycancel"):
+        twin = getattr(Messagebox, "a" + name)
+        assert inspect.iscoroutinefunction(twin)
+        assert (inspect.signature(twin).parameters.keys()
+                == inspect.signature(getattr(Messagebox, name)).parameters.keys())
@@ -54,6 +54,17 @@ def test_messagebox_parent_and_alert_are_keyword_only(method):
         )
 
 
+@pytest.mark.parametrize("method", _MESSAGEBOX_METHODS)
+def test_messagebox_awaitable_twin_mirrors_the_method(method):
+    sync = getattr(Messagebox, method)
+    twin = getattr(Messagebox, f"a{method}")
+    assert inspect.iscoroutinefunction(twin)
+    assert twin.__name__ == f"a{method}"
+    assert inspect.signature(twin) == inspect.signature(sync)
+    assert inspect.signature(sync).parameters["alert"].default is (
+        method in ("show_warning", "show_error"))
+
+
 def test_messagebox_rejects_positional_parent(root):
     # parent is keyword-only now, so a positional 3rd arg raises before any
     # dialog is built -- no window is shown.
@@ -127,6 +138,136 @@ def test_querybox_get_string_returns_via_result_property():
     assert "dialog._result" not in src
 
 
+def _item_dialog(root, count):
+    dlg = QueryDialog("pick", items=[f"Item {i:05d}" for i in range(count)], parent=root)
+    dlg.build()
+    return dlg, dlg._initial_focus
+
+
+def test_query_item_list_is_capped_with_a_more_entry(root):
+    from ttkbootstrap.dialogs.query import _FILTER_LIMIT
+
+    dlg, combo = _item_dialog(root, 50_000)
+    values = combo.tk.splitlist(combo.cget("values"))
+    assert len(values) == _FILTER_LIMIT + 1
+    assert values[-1] == f"…(+{50_000 - _FILTER_LIMIT:,})"
+    combo.set(values[-1])
+    combo.event_generate("<<ComboboxSelected>>")
+    assert combo.get() == ""  # the summary entry is not a choice
+    dlg._toplevel.destroy()
+
+
+def test_query_item_filter_narrows_the_previous_matches(root):
+    dlg, combo = _item_dialog(root, 50_000)
+    assert len(dlg._match_items("ITEM 1")) == 10_000
+    keys = dlg._item_keys
+    dlg._item_keys = [k if k.startswith("item 1") else "" for k in keys]
+    # an extended query only searches the previous matches, so blanking the
+    # other keys changes nothing
+    assert len(dlg._match_items("Item 12")) == 1_000
+    dlg._item_keys = keys
+    assert len(dlg._match_items("item 2")) == 10_000  # not an extension
+    combo.set("item 4999")
+    dlg._filter_list(combo)
+    assert combo.tk.splitlist(combo.cget("values")) == tuple(f"Item 4999{i}" for i in range(10))
+    dlg._toplevel.destroy()
+
+
+def test_query_item_filter_is_debounced(root, monkeypatch):
+    dlg, combo = _item_dialog(root, 100)
+    runs = []
+    monkeypatch.setattr(dlg, "_filter_list", lambda widget: runs.append(widget.get()))
+    event = type("Event", (), {"widget": combo})()
+    for text in ("I", "It", "Ite"):
+        combo.set(text)
+        dlg.on_filter_list(event)
+    assert runs == []
+    root.tk.call("after", 300)
+    root.update()
+    assert runs == ["Ite"]
+    dlg._toplevel.destroy()
+
+
+@pytest.mark.parametrize("close", ["on_submit", "on_cancel", "destroy"])
+def test_query_item_filter_is_cancelled_when_the_dialog_closes(root, close):
+    dlg, combo = _item_dialog(root, 100)
+    root.tk.call("proc", "bgerror", "message", "lappend ::query_bgerrors $message")
+    combo.set("Ite")
+    dlg.on_filter_list(type("Event", (), {"widget": combo})())
+    if close == "destroy":
+        dlg._toplevel.destroy()
+    else:
+        getattr(dlg, close)()
+    assert dlg._filter_job is None
+    root.tk.call("after", 300)
+    root.update()
+    assert not root.tk.call("info", "exists", "::query_bgerrors")
+    root.tk.call("rename", "bgerror", "")
+
+
+# --- DialogPool ------------------------------------------------------------
+
+@pytest.fixture
+def dialog_pool(root):
+    from ttkbootstrap.dialogs import DialogPool
+
+    DialogPool.enable()
+    try:
+        yield DialogPool.for_widget(root)
+    finally:
+        DialogPool.enable(False)
+        DialogPool.for_widget(root).clear()
+
+
+def test_dialog_pool_reuses_a_closed_messagebox(root, dialog_pool):
+    first = message_mod._message_dialog(
+        message="one", title="A", buttons=["OK:primary"], parent=root)
+    first.show(wait_for_result=False)
+    toplevel = first._toplevel
+    first._initial_focus.invoke()
+    root.update_idletasks()
+    assert first.result == "OK"
+    assert toplevel.winfo_exists() and toplevel.wm_state() == "withdrawn"
+    assert len(dialog_pool) == 1
+
+    second = message_mod._message_dialog(
+        message="two\nlines", title="B", buttons=["OK:primary"], parent=root)
+    assert second is first and len(dialog_pool) == 0
+    second.show(wait_for_result=False)
+    assert second._toplevel is toplevel and second.result is None
+    assert [label.cget("text") for label in second._msg_labels] == ["two", "lines"]
+    assert toplevel.title() == "B"
+    second._finish()
+
+    other = message_mod._message_dialog(
+        message="two", buttons=["No", "Yes"], parent=root)
+    assert other is not first
+
+
+def test_dialog_pool_is_off_by_default(root):
+    from ttkbootstrap.dialogs import DialogPool
+
+    assert not DialogPool.is_enabled()
+    dialog = message_mod._message_dialog(message="x", parent=root)
+    assert dialog._pool_key is None
+
+
+def test_dialog_pool_reuses_a_query_dialog(root, dialog_pool):
+    from ttkbootstrap.dialogs.query import _query_dialog
+
+    first = _query_dialog("Name?", " ", "Ada", parent=root)
+    first.show(wait_for_result=False)
+    assert first._initial_focus.get() == "Ada"
+    first.on_cancel()
+    second = _query_dialog("Your\nname?", " ", "Grace", parent=root)
+    assert second is first
+    second.show(wait_for_result=False)
+    assert second._initial_focus.get() == "Grace"
+    assert [label.cget("text") for label in second._prompt_labels] == ["Your", "name?"]
+    second.on_submit()
+    assert second.result == "Grace"
+
+
 # --- MessageDialog.command de-vestigialization -----------------------------
 
 def test_command_plain_callable_stored_without_warning(root):
@@ -253,6 +394,81 @@ def test_colorchoice_is_a_single_type():
     assert CC1 is CC2
 
 
+def test_color_dropper_grabs_off_thread_and_coalesces_the_loupe(root, monkeypatch):
+    import threading
+    import time
+    from types import SimpleNamespace
+
+    from PIL import Image
+
+    from ttkbootstrap.dialogs import colordropper
+    from ttkbootstrap.internal.render_queue import RenderQueue
+
+    screen = Image.new("RGB", (64, 64), "#ff0000")
+    screen.putpixel((20, 20), (0, 0, 255))
+    grab_threads = []
+
+    def grab():
+        grab_threads.append(threading.current_thread())
+        return screen
+
+    monkeypatch.setattr(colordropper.ImageGrab, "grab", grab)
+    dropper = colordropper.ColorDropperDialog()
+    dropper.show()
+    deadline = time.monotonic() + 2
+    while dropper.screenshot_data is None and time.monotonic() < deadline:
+        root.update()
+    try:
+        assert grab_threads and grab_threads[0] is not threading.main_thread()
+        resizes = []
+        real_resize = Image.Image.resize
+        monkeypatch.setattr(Image.Image, "resize",
+                            lambda self, *a, **k: resizes.append(1) or real_resize(self, *a, **k))
+        for x in range(10, 21):
+            dropper.on_mouse_motion(SimpleNamespace(x=x, y=20))
+        RenderQueue.for_widget(root).flush()
+        assert len(resizes) == 1  # a burst of motion draws the loupe once
+        dropper.on_mouse_motion(SimpleNamespace(x=20, y=20))
+        RenderQueue.for_widget(root).flush()
+        assert len(resizes) == 1  # same pixel, same zoom: nothing to redraw
+        assert dropper.get_hover_color() == "#0000ff"
+    finally:
+        dropper.on_right_click(None)
+
+
+def test_color_dropper_ignores_show_while_a_capture_is_pending(root, monkeypatch):
+    import threading
+    import time
+
+    from PIL import Image
+
+    from ttkbootstrap.dialogs import colordropper
+
+    release = threading.Event()
+    grabs = []
+
+    def grab():
+        grabs.append(1)
+        release.wait(2)
+        return Image.new("RGB", (8, 8), "#ff0000")
+
+    monkeypatch.setattr(colordropper.ImageGrab, "grab", grab)
+    dropper = colordropper.ColorDropperDialog()
+    dropper.show()
+    overlay = dropper.toplevel
+    dropper.show()
+    assert dropper.toplevel is overlay
+    release.set()
+    deadline = time.monotonic() + 2
+    while dropper.screenshot_data is None and time.monotonic() < deadline:
+        root.update()
+    try:
+        assert len(grabs) == 1
+        assert overlay.winfo_ismapped() or overlay.wm_state() != "withdrawn"
+    finally:
+        dropper.on_right_click(None)
+
+
 # --- get_date cancellation -------------------------------------------------
 
 def test_get_date_signature_returns_optional_and_position_kwonly():
@@ -307,6 +523,80 @@ def test_datepicker_selection_highlight_does_not_bleed_across_months(root):
             pass
 
 
+def test_datepicker_navigation_reuses_the_day_grid(root, monkeypatch):
+    # The 6x7 grid is built once and updated in place: browsing months must not
+    # create a new dates frame, must not grow the widget count beyond one
+    # button + one label per cell, and must not re-resolve the day styles.
+    import datetime
+    from ttkbootstrap.style import Bootstyle
+
+    picker = DatePickerDialog(
+        parent=root, start_date=datetime.date(2026, 7, 9), autoshow=False
+    )
+    try:
+        frame = picker.frm_dates
+        resolved = []
+        original = Bootstyle.update_ttk_widget_style
+
+        def counting(widget=None, style_string=None, **kwargs):
+            resolved.append(style_string)
+            return original(widget, style_string, **kwargs)
+
+        monkeypatch.setattr(Bootstyle, "update_ttk_widget_style", staticmethod(counting))
+        for _ in range(14):
+            picker.on_next_month()
+        picker.on_prev_year()
+        picker.on_reset_date()
+
+        assert picker.frm_dates is frame
+        assert len(frame.winfo_children()) <= 2 * 6 * 7
+        assert not [s for s in resolved if s and ("toolbutton" in s or "calendar" in s)]
+        assert picker.datevar.get() == 9
+    finally:
+        try:
+            picker.root.destroy()
+        except Exception:
+            pass
+
+
+def test_datepicker_for_widget_keeps_one_popup_per_root(root):
+    # The DateEntry popup is built once: closing withdraws it, and the next
+    # request retargets the same toplevel and redraws its grid in place.
+    import datetime
+
+    entry = ttk.Entry(root)
+    picker = DatePickerDialog.for_widget(entry, start_date=datetime.date(2026, 7, 9))
+    other = None
+    try:
+        picker.show(wait_for_result=False)
+        picker._cancel()
+        assert picker.root.winfo_exists() and picker.result is None
+
+        again = DatePickerDialog.for_widget(entry, start_date=datetime.date(2026, 8, 1))
+        assert again is picker
+        assert again.date == datetime.date(2026, 8, 1) and again.datevar.get() == 1
+
+        # a differently styled calendar is kept separately
+        other = DatePickerDialog.for_widget(entry, bootstyle="danger")
+        assert other is not picker
+    finally:
+        for dialog in (picker, other):
+            if dialog is not None and dialog.root.winfo_exists():
+                dialog.root.destroy()
+        entry.destroy()
+
+
+def test_datepicker_month_layout_is_cached():
+    import calendar
+    from ttkbootstrap.dialogs.datepicker import _month_layout
+
+    days, dates = _month_layout(6, 2026, 2)
+    cal = calendar.Calendar(firstweekday=6)
+    assert [list(week) for week in days] == cal.monthdayscalendar(2026, 2)
+    assert [list(week) for week in dates] == cal.monthdatescalendar(2026, 2)
+    assert _month_layout(6, 2026, 2) is _month_layout(6, 2026, 2)
+
+
 def test_message_and_query_dialogs_use_consistent_button_spacing(root):
     # Regression: QueryDialog packed its Submit/Cancel buttons with padx=5 while
     # MessageDialog uses padx=2, so the Querybox button row read visibly looser
@@ -367,6 +657,105 @@ def test_colorchooserdialog_build_without_global_api(root):
     dlg._toplevel.destroy()
 
 
+def test_colorchooser_spectrum_is_one_cached_image(root):
+    """The spectrum is a single image item, shared between choosers."""
+    from ttkbootstrap.dialogs.colorchooser import ColorChooser
+    first = ColorChooser(root, initialcolor="#3366cc")
+    second = ColorChooser(root, initialcolor="#cc6633")
+    items = first.color_spectrum.find_all()
+    assert [first.color_spectrum.type(i) for i in items].count("image") == 1
+    assert first.color_spectrum.itemcget(items[0], "image") == \
+        second.color_spectrum.itemcget(second.color_spectrum.find_all()[0], "image")
+    # the luminance strip is one image plus the indicator
+    assert len(first.luminance_scale.find_all()) == 2
+
+
+def test_colorchooser_spectrum_matches_color_from_coords(root):
+    from ttkbootstrap.dialogs.colorchooser import ColorChooser, _render_spectrum
+    cc = ColorChooser(root, initialcolor="#3366cc")
+    image = _render_spectrum(cc.spectrum_width, cc.spectrum_height, cc.spectrum_point)
+    assert image.size == (cc.spectrum_width, cc.spectrum_height)
+    for x, y in [(0, 0), (cc.spectrum_width // 2, cc.spectrum_height // 3)]:
+        x0 = x - x % cc.spectrum_point
+        y0 = y - y % cc.spectrum_point
+        expected = cc.color_from_coords(x0, y0)
+        got = image.getpixel((x, y))
+        assert all(abs(a - b) <= 3 for a, b in zip(got, (expected.r, expected.g, expected.b)))
+
+
+def test_colorchooser_luminance_strip_repaints_in_place(root):
+    from ttkbootstrap.dialogs.colorchooser import ColorChooser, _render_luminance
+    cc = ColorChooser(root, initialcolor="#3366cc")
+    image = cc._luminance_image
+    cc.hex.set("#cc3333")
+    cc.sync_color_values("hex")
+    cc.update_luminance_scale()
+    assert cc._luminance_image is image
+    x = cc.spectrum_width // 2
+    pixel = root.tk.call(str(image), "get", x, 1)
+    expected = _render_luminance(cc.hex.get(), cc.spectrum_width, cc.spectrum_point)
+    assert tuple(int(v) for v in root.tk.splitlist(pixel)) == expected.getpixel((x, 1))
+
+
+def test_fontdialog_enumerates_families_once(root, monkeypatch):
+    from tkinter import font
+    from ttkbootstrap.dialogs.fontdialog import FontDialog
+    from ttkbootstrap.utils.fonts import Fonts
+
+    Fonts.families()
+    calls = []
+    monkeypatch.setattr(font, "families", lambda *a: calls.append(1) or ())
+    FontDialog(root)
+    FontDialog(root)
+    assert calls == []
+
+
+def test_fontdialog_close_does_not_reenumerate_families(root, monkeypatch):
+    from tkinter import font
+    from ttkbootstrap.dialogs.fontdialog import FontDialog
+    from ttkbootstrap.utils.fonts import Fonts
+
+    Fonts.families()
+    calls = []
+    monkeypatch.setattr(font, "families", lambda *a: calls.append(1) or ())
+    for close in ("_on_submit", "_on_cancel"):
+        dlg = FontDialog(root)
+        dlg.build()
+        getattr(dlg, close)()
+        root.update_idletasks()
+    assert calls == []
+
+
+def test_fontdialog_family_list_only_creates_visible_rows(root, monkeypatch):
+    from ttkbootstrap.dialogs import fontdialog
+
+    names = [f"Family {i:04d}" for i in range(3000)]
+    keys = [n.casefold() for n in names]
+    monkeypatch.setattr(fontdialog, "_listed_families", lambda: (names, keys))
+    dlg = fontdialog.FontDialog(root)
+    dlg.build()
+    tree = dlg._initial_focus
+    assert len(tree.get_children()) == dlg._family_list._rows < 100
+    assert dlg._family_list.selection == dlg._family.get()
+    dlg._family_list.yview("moveto", "0.5")
+    top = dlg._family_list._top
+    assert top > 1000
+    assert tree.item(tree.get_children()[0], "values")[0] == dlg._families[top]
+    dlg._toplevel.destroy()
+
+
+def test_fontdialog_type_ahead_selects_by_prefix(root):
+    from ttkbootstrap.dialogs.fontdialog import FontDialog
+
+    dlg = FontDialog(root)
+    dlg.build()
+    family = dlg._families[len(dlg._families) // 2]
+    assert dlg._family_list.select_prefix(family[:3].swapcase())
+    assert dlg._family_list.selection.casefold().startswith(family[:3].casefold())
+    dlg._on_submit()
+    assert dlg.result.cget("family") == dlg._family.get()
+
+
 # --- Querybox file dialogs (native, surfaced through the facade) -----------
 
 _FILE_METHODS = ["get_open_filename", "get_open_filenames", "get_save_filename", "get_directory"]
@@ -16,6 +16,7 @@ from pathlib import Path
 import pytest
 
 import ttkbootstrap as ttk
+from ttkbootstrap import profiling
 from ttkbootstrap.style.engine import DURABLE_STYLE_OPTIONS
 
 
@@ -146,6 +147,24 @@ def test_sash_survives_theme_switch(root):
     assert int(_lookup(root, "Sash", "sashthickness")) == 9
 
 
+def test_variant_build_replays_only_what_it_touched(root):
+    # Overrides already in this theme's style DB are not written again by
+    # every later build; the built variant gets its merged overrides.
+    style = root.style
+    style.configure("TEntry", padding=3)
+    style.configure("TButton", focusthickness=7)
+    style.configure("Sash", sashthickness=9)
+    builder = style._get_builder()
+    builder.build_style("default", "entry", "danger")
+    with profiling.record_tcl_calls(root) as rec:
+        builder.build_style("default", "entry", "info")
+    written = {call.args[2] for call in rec.calls
+               if call.args[:2] == ("ttk::style", "configure")}
+    assert not written & {"TButton", "Sash"}
+    assert _padding(root, "info.TEntry") == 3
+    assert int(_lookup(root, "Sash", "sashthickness")) == 9
+
+
 # --- colors stay theme-reactive (not recorded) -----------------------------
 
 def test_color_not_recorded(root):
@@ -121,6 +121,43 @@ def test_list_directory_unreadable_returns_empty():
     assert (dirs, files) == ([], [])
 
 
+def test_list_directory_stats_entries(tmp_path):
+    (tmp_path / "f.txt").write_text("12345")
+    (tmp_path / "sub").mkdir()
+    dirs, files = fd._list_directory(str(tmp_path), ("*",), show_hidden=False)
+    assert files[0].size == 5 and files[0].mtime
+    assert dirs[0].size is None and dirs[0].mtime
+
+
+def test_scan_cache_reused_until_directory_changes(tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+    first = fd._cached_scan(str(tmp_path))
+    assert fd._cached_scan(str(tmp_path)) is first       # mtime unchanged: cached
+
+    (tmp_path / "b.txt").write_text("b")
+    os.utime(tmp_path, ns=(1, 10**9))                    # guarantee a new mtime
+    rescanned = fd._cached_scan(str(tmp_path))
+    assert rescanned is not first
+    assert sorted(row[0] for row in rescanned) == ["a.txt", "b.txt"]
+
+
+def test_scan_stops_when_cancelled(tmp_path):
+    import threading
+    (tmp_path / "a.txt").write_text("a")
+    cancelled = threading.Event()
+    cancelled.set()
+    assert fd._scan_directory(str(tmp_path), cancelled) is None
+
+
+def test_filter_scan_defers_stat(tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / ".h.txt").write_text("h")
+    dirs, files = fd._filter_scan(
+        fd._scan_directory(str(tmp_path)), ("*.txt",), show_hidden=False)
+    assert [f.name for f in files] == ["a.txt"]
+    assert files[0].size is None and files[0].mtime is None
+
+
 def test_ancestors_reaches_root():
     anc = fd._ancestors(os.getcwd())
     assert anc[0] == os.path.abspath(os.getcwd())
@@ -210,10 +247,20 @@ def _iid_for(dlg, name):
     raise AssertionError(f"{name!r} not listed; have {[e.name for e in dlg._rows.values()]}")
 
 
+def _finish_listing(dlg):
+    """Block until the dialog's current listing is fully inserted into the tree."""
+    while dlg._listing is not None:
+        dlg._listing.wait()
+        if dlg._pump_after is not None:
+            dlg._tree.after_cancel(dlg._pump_after)
+        dlg._pump_listing()
+
+
 def _build(root, tmp_path, **kwargs):
     dlg = FileDialog(root, initialdir=str(tmp_path), **kwargs)
     dlg._build()
     dlg._navigate(dlg._cwd)
+    _finish_listing(dlg)
     return dlg
 
 
@@ -241,6 +288,7 @@ def test_open_double_click_directory_navigates(root, tmp_path):
     dlg = _build(root, tmp_path, mode="open")
     dlg._tree.selection_set(_iid_for(dlg, "sub"))
     dlg._on_activate()  # double-click a directory descends into it
+    _finish_listing(dlg)
     assert dlg._cwd == str(tmp_path / "sub")
     assert "inner.txt" in [e.name for e in dlg._rows.values()]
     assert dlg._result is None  # navigating is not accepting
@@ -339,6 +387,7 @@ def test_show_hidden_toggle_relists(root, tmp_path):
     assert ".secret.txt" not in [e.name for e in dlg._rows.values()]
     dlg._hidden_var.set(True)
     dlg._refresh()
+    _finish_listing(dlg)
     assert ".secret.txt" in [e.name for e in dlg._rows.values()]
 
 
@@ -371,6 +420,68 @@ def test_row_icon_swaps_on_selection(root, tmp_path):
     assert dlg._tree.item(iid, "image")[0] == str(dlg._file_img)
 
 
+def test_row_icons_update_only_changed_rows(root, tmp_path):
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (tmp_path / name).write_text(name)
+    dlg = _build(root, tmp_path, mode="open")
+    a, b = _iid_for(dlg, "a.txt"), _iid_for(dlg, "b.txt")
+    dlg._tree.selection_set(a)
+    dlg._on_select()
+
+    touched = []
+    real = dlg._tree.item
+
+    def spy(iid, option=None, **kw):
+        if "image" in kw:
+            touched.append(iid)
+        return real(iid, option, **kw)
+
+    dlg._tree.item = spy
+    try:
+        dlg._tree.selection_set(b)
+        dlg._on_select()
+    finally:
+        del dlg._tree.item
+    assert sorted(touched) == sorted([a, b])   # c.txt is left alone
+
+
+def test_listing_stats_only_visible_rows(root, tmp_path):
+    for i in range(200):
+        (tmp_path / f"f{i:03}.txt").write_text("x" * i)
+    dlg = _build(root, tmp_path, mode="open")
+    assert len(dlg._rows) == 200
+    dlg._stat_visible()
+    first = dlg._order[0]
+    assert dlg._tree.item(first, "values")[0] == "0 B"
+    assert first not in dlg._unstated
+    assert dlg._order[-1] in dlg._unstated             # far below the view
+
+
+def test_listing_streams_in_batches(root, tmp_path, monkeypatch):
+    monkeypatch.setattr(fd, "_BATCH_ROWS", 10)
+    for i in range(25):
+        (tmp_path / f"f{i:02}.txt").write_text("x")
+    dlg = FileDialog(root, initialdir=str(tmp_path), mode="open")
+    dlg._build()
+    dlg._navigate(dlg._cwd)
+    assert len(dlg._rows) <= 10        # at most one batch before the loop runs
+    assert dlg._listing is not None
+    _finish_listing(dlg)
+    assert len(dlg._rows) == 25
+    assert [dlg._rows[i].name for i in dlg._order] == sorted(dlg._rows[i].name for i in dlg._order)
+
+
+def test_navigation_cancels_the_listing_in_flight(root, tmp_path):
+    (tmp_path / "sub").mkdir()
+    dlg = _build(root, tmp_path, mode="open")
+    job = fd._ListingJob(str(tmp_path), ("*",), show_hidden=False, dirs_only=False)
+    dlg._listing = job                 # stands in for a slow listing still running
+    dlg._navigate(str(tmp_path / "sub"))
+    assert job.cancelled.is_set()
+    _finish_listing(dlg)
+    assert dlg._cwd == str(tmp_path / "sub")
+
+
 def test_listing_uses_taller_scoped_rowheight(root, tmp_path):
     # The dialog's rows are taller than the default flush treeview, via a
     # dialog-scoped style that leaves the global Treeview untouched.
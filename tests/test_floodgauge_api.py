@@ -193,3 +193,18 @@ def test_legacy_bare_option_attrs_are_deprecated_not_removed(root):
     cats = [w for w in caught if issubclass(w.category, DeprecationWarning)]
     assert len(cats) >= 2                         # one for the read, one for the write
     assert fg.cget("maximum") == 50              # the write actually took effect
+
+
+def test_set_value_threadsafe_coalesces_to_latest(root):
+    import threading
+    import time
+
+    fg = Floodgauge(root, maximum=100)
+    worker = threading.Thread(
+        target=lambda: [fg.set_value_threadsafe(v) for v in range(1, 61)])
+    worker.start()
+    worker.join()
+    deadline = time.monotonic() + 2
+    while fg.value != 60 and time.monotonic() < deadline:
+        root.update()
+    assert fg.value == 60
@@ -12,7 +12,7 @@ import pytest
 import ttkbootstrap as ttk
 from ttkbootstrap.style import Style
 from ttkbootstrap.widgets.labeledscale import LabeledScale
-from ttkbootstrap.widgets.tooltip import ToolTip
+from ttkbootstrap.widgets.tooltip import ToolTip, ToolTipRegistry
 
 
 @pytest.fixture(scope="module", autouse=True)
@@ -117,11 +117,11 @@ def test_value_overrides_passed_variable(root):
 
 
 def test_destroy_with_pending_idle_is_safe(root):
-    """A queued after_idle(adjust_label) must not fire into a dead widget."""
+    """A queued label placement must not run against a dead widget."""
     ls = LabeledScale(root, from_=0, to=10)
     ls.pack()
-    ls._adjust()            # schedules an after_idle
-    ls.destroy()            # must cancel it
+    ls._adjust()            # queues the placement for the idle pass
+    ls.destroy()            # must discard it
     root.update_idletasks()  # flush idle queue -> would raise if not cancelled
     assert ls.scale is None
 
@@ -261,3 +261,113 @@ def test_tooltip_topmost_default_and_optout(root, monkeypatch):
 
     plain = ToolTip(btn, text="tip", topmost=False)
     assert plain.toplevel_kwargs["topmost"] is False
+
+
+# --------------------------------------------------------------------------- #
+# ToolTipRegistry
+# --------------------------------------------------------------------------- #
+
+def test_registry_is_one_per_root(root):
+    btn = ttk.Button(root, text="x")
+    assert ToolTipRegistry.for_widget(btn) is ToolTipRegistry.for_widget(root)
+
+
+def test_registry_add_does_not_touch_the_widget(root):
+    btn = ttk.Button(root, text="x")
+    btn.pack()
+    tags = btn.bindtags()
+    tips = ToolTipRegistry.for_widget(root)
+    tips.add(btn, "tip")
+    assert btn in tips and tips.get(btn) == "tip"
+    assert btn.bindtags() == tags
+    tips.remove(btn)
+    assert btn not in tips
+
+
+def test_registry_enter_arms_only_registered_widgets(root):
+    tips = ToolTipRegistry.for_widget(root)
+    plain = ttk.Button(root, text="plain")
+    tipped = ttk.Button(root, text="tipped")
+    plain.pack()
+    tipped.pack()
+    tips.add(tipped, "tip")
+    root.update_idletasks()
+    plain.event_generate("<Enter>")
+    assert tips._target is None
+    tipped.event_generate("<Enter>")
+    assert tips._target == str(tipped)
+    tipped.event_generate("<Leave>")
+    assert tips._target is None
+    tips.remove(tipped)
+
+
+def test_registry_reuses_one_popup(root):
+    tips = ToolTipRegistry.for_widget(root)
+    first = ttk.Button(root, text="one")
+    second = ttk.Button(root, text="two")
+    first.pack()
+    second.pack()
+    tips.add(first, "first tip")
+    tips.add(second, "second tip")
+    root.update_idletasks()
+    try:
+        tips._on_enter(str(first))
+        tips.show_tip()
+        popup = tips.toplevel
+        assert tips._label.cget("text") == "first tip"
+        tips._on_leave(str(first))
+        tips._on_enter(str(second))
+        tips.show_tip()
+    except tkinter.TclError:
+        pytest.skip("cannot realize a tooltip Toplevel headlessly here")
+    assert tips.toplevel is popup
+    assert tips._label.cget("text") == "second tip"
+    tips._on_leave(str(second))
+    assert popup.winfo_exists()
+    tips.remove(first)
+    tips.remove(second)
+
+
+def test_registry_drops_destroyed_widgets(root):
+    tips = ToolTipRegistry.for_widget(root)
+    btn = ttk.Button(root, text="x")
+    btn.pack()
+    tips.add(btn, "tip")
+    btn.destroy()
+    root.update_idletasks()
+    assert str(btn) not in tips._texts
+
+
+def test_registry_filters_unregistered_widgets_in_tcl(root):
+    from ttkbootstrap.widgets.tooltip import _REGISTRY_PATHS_VAR
+
+    tips = ToolTipRegistry.for_widget(root)
+
+    def watched():
+        return set(root.tk.splitlist(root.tk.call("array", "names", _REGISTRY_PATHS_VAR)))
+
+    kept = ttk.Button(root, text="kept")
+    removed = ttk.Button(root, text="removed")
+    destroyed = ttk.Button(root, text="destroyed")
+    for btn in (kept, removed, destroyed):
+        tips.add(btn, "tip")
+    tips.remove(removed)
+    destroyed.destroy()
+    assert {str(kept)} <= watched()
+    assert not {str(removed), str(destroyed)} & watched()
+    script = root.tk.call("bind", "all", "<Enter>")
+    assert f"array names {_REGISTRY_PATHS_VAR} -exact %W" in script
+    tips.remove(kept)
+    assert str(kept) not in watched()
+
+
+def test_registry_configure_validates(root):
+    tips = ToolTipRegistry.for_widget(root)
+    with pytest.raises(ValueError):
+        tips.configure(position="nope")
+    with pytest.raises(ValueError):
+        tips.cget("text")
+    delay = tips.cget("delay")
+    tips.configure(delay=500)
+    assert tips.cget("delay") == 500
+    tips.configure(delay=delay)
@@ -0,0 +1,139 @@
+"""Tests for the opt-in runtime instrumentation (ttkbootstrap.profiling)."""
+import json
+
+import pytest
+
+import ttkbootstrap as ttk
+from ttkbootstrap import profiling
+
+
+@pytest.fixture
+def recording():
+    profiling.reset()
+    profiling.enable(trace=True)
+    yield
+    profiling.disable()
+    profiling.reset()
+
+
+def test_profiling_is_off_and_free_by_default():
+    assert not profiling.is_enabled()
+    profiling.count("never")
+    with profiling.span("never"):
+        pass
+    func = lambda: None  # noqa: E731
+    assert profiling.timed("never", func) is func
+    stats = profiling.snapshot()
+    assert "never" not in stats["counters"] and "never" not in stats["timers"]
+
+
+def test_style_build_records_time_and_tcl_round_trips(root, recording):
+    root.style._get_builder().build_style("outline", "TButton", "danger")
+    stats = root.style.stats()
+    timer = stats["timers"]["style.build[outline.TButton]"]
+    assert timer["count"] == 1 and timer["total_ms"] >= 0
+    assert stats["counters"]["style.build.tcl[outline.TButton]"] > 0
+    assert stats["image_cache_size"] == len(root.style._image_cache)
+
+
+def test_image_cache_hits_and_misses_are_counted(root, recording):
+    from ttkbootstrap.style import Assets
+
+    assets = Assets(root.style)
+    assets.circle("#123456", 11)
+    assets.circle("#123456", 11)
+    counters = profiling.snapshot()["counters"]
+    assert counters["image_cache.hit"] >= 1
+    assert counters["image_cache.miss"] >= 1
+
+
+def test_theme_walk_counts_repainted_widgets(root, recording):
+    ttk.Button(root).pack()
+    start = root.style.theme.name
+    other = "bootstrap-dark" if start != "bootstrap-dark" else "bootstrap-light"
+    root.style.theme_use(other)
+    stats = profiling.snapshot()
+    assert stats["timers"]["theme.walk"]["count"] == 1
+    assert stats["counters"]["theme.walk.repainted"] >= 2  # root + button
+    assert stats["counters"]["bootstyle.parse"] > 0
+
+
+def test_tableview_operations_are_timed(root, recording):
+    from ttkbootstrap.widgets.tableview import Tableview
+
+    table = Tableview(root, coldata=["a", "b"], rowdata=[(2, "x"), (1, "y")])
+    table.sort_column_data(cid=0, sort=0)
+    timers = profiling.snapshot()["timers"]
+    assert timers["tableview.load"]["count"] >= 1
+    assert timers["tableview.sort"]["count"] == 1
+
+
+def test_chrome_trace_export(tmp_path, recording):
+    with profiling.span("custom.block", label="one", rows=3):
+        pass
+    path = tmp_path / "trace.json"
+    assert profiling.export_chrome_trace(str(path)) >= 1
+    events = json.loads(path.read_text())["traceEvents"]
+    event = next(e for e in events if e["name"] == "custom.block[one]")
+    assert event["ph"] == "X" and event["args"] == {"rows": 3}
+
+
+# -- Tcl call harness ------------------------------------------------------- #
+def test_tcl_recorder_records_calls_and_restores_the_handle(root):
+    real = root.tk
+    with profiling.record_tcl_calls(root) as rec:
+        label = ttk.Label(root, text="hi")
+        label.configure(text="there")
+    assert root.tk is real and label.tk is real and root.style.tk is real
+    assert rec.count > 0 and rec.seconds >= 0
+    assert rec.by_command()["<widget> configure"] >= 1
+    # configure calls are recorded with their arguments
+    assert any(call.args[1:3] == ("configure", "-text") for call in rec.calls
+               if len(call.args) > 2)
+    # nothing is recorded once the block is over
+    before = rec.count
+    label.configure(text="later")
+    assert rec.count == before
+
+
+def test_assert_max_tcl_calls_reports_the_busiest_commands(root):
+    label = ttk.Label(root)
+    with pytest.raises(AssertionError, match=r"(?s)at most 1 Tcl calls.*<widget> configure"):
+        with profiling.assert_max_tcl_calls(1, root):
+            for i in range(3):
+                label.configure(text=str(i))
+
+
+def test_repeat_widget_construction_stays_within_first_budget(root):
+    # The first button builds its style; an identical second one must not
+    # cost more Tcl round trips than the first.
+    with profiling.record_tcl_calls(root) as first:
+        ttk.Button(root, bootstyle="warning-outline").pack()
+    with profiling.assert_max_tcl_calls(first.count, root):
+        ttk.Button(root, bootstyle="warning-outline").pack()
+
+
+def test_theme_return_costs_no_more_than_the_first_switch(root):
+    ttk.Button(root, bootstyle="success").pack()
+    start = root.style.theme.name
+    other = "bootstrap-dark" if start != "bootstrap-dark" else "bootstrap-light"
+    with profiling.record_tcl_calls(root) as first_visit:
+        root.style.theme_use(other)
+    root.style.theme_use(start)
+    with profiling.assert_max_tcl_calls(first_visit.count, root):
+        root.style.theme_use(other)
+
+
+def test_tableview_paging_cost_does_not_grow_with_the_table(root):
+    from ttkbootstrap.widgets.tableview import Tableview
+
+    def table(rows):
+        return Tableview(root, coldata=["a", "b"], paginated=True, pagesize=20,
+                         rowdata=[(i, str(i)) for i in range(rows)])
+
+    small, large = table(100), table(2000)
+    with profiling.record_tcl_calls(root) as budget:
+        small.goto_next_page()
+    # paging touches one page of rows, however many rows the table holds
+    with profiling.assert_max_tcl_calls(budget.count, root):
+        large.goto_next_page()
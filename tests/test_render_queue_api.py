@@ -0,0 +1,97 @@
+"""Tests for the idle-time render queue (ttkbootstrap.internal.render_queue)."""
+from ttkbootstrap.internal.render_queue import RenderQueue
+from ttkbootstrap.widgets.floodgauge import Floodgauge
+from ttkbootstrap.widgets.meter import Meter
+from ttkbootstrap.widgets.tableview import Tableview
+
+
+def test_invalidations_collapse_into_one_call_per_key(root):
+    queue = RenderQueue.for_widget(root)
+    queue.flush()
+    calls = []
+    for i in range(50):
+        queue.invalidate("a", lambda i=i: calls.append(("a", i)))
+        queue.invalidate("b", lambda: calls.append("b"))
+    assert queue.pending() == 2 and calls == []
+    root.update_idletasks()  # the idle pass runs the batch
+    assert calls == [("a", 49), "b"]
+    assert queue.pending() == 0
+
+
+def test_flush_key_and_discard(root):
+    queue = RenderQueue.for_widget(root)
+    calls = []
+    queue.invalidate("a", lambda: calls.append("a"))
+    queue.invalidate("b", lambda: calls.append("b"))
+    queue.flush("b")
+    assert calls == ["b"] and queue.is_pending("a")
+    queue.discard("a")
+    queue.flush()
+    assert calls == ["b"]
+
+
+def test_a_failing_redraw_is_reported_and_the_rest_still_run(root, monkeypatch):
+    reported = []
+    monkeypatch.setattr(root, "report_callback_exception",
+                        lambda *exc: reported.append(exc[0]))
+    queue = RenderQueue.for_widget(root)
+    calls = []
+    queue.invalidate("bad", lambda: 1 / 0)
+    queue.invalidate("good", lambda: calls.append("good"))
+    queue.flush()
+    assert reported == [ZeroDivisionError] and calls == ["good"]
+
+
+def test_floodgauge_redraws_once_per_turn(root, monkeypatch):
+    fg = Floodgauge(root, maximum=1000)
+    RenderQueue.for_widget(root).flush()
+    draws = []
+    monkeypatch.setattr(fg, "_draw", lambda: draws.append(fg.value))
+    for i in range(1000):
+        fg.value = i
+    fg.configure(text="busy")
+    assert draws == []
+    RenderQueue.for_widget(root).flush()
+    assert draws == [999]
+
+
+def test_destroyed_floodgauge_drops_its_pending_redraw(root):
+    fg = Floodgauge(root)
+    fg.value = 10
+    fg.destroy()
+    assert not RenderQueue.for_widget(root).is_pending((str(fg), "draw"))
+    root.update_idletasks()
+
+
+def test_meter_text_is_immediate_and_indicator_deferred(root, monkeypatch):
+    m = Meter(root, amount_used=0, amount_total=100)
+    renders = []
+    monkeypatch.setattr(m, "_draw_meter", lambda *_: renders.append(m.value))
+    for i in range(100):
+        m.value = i
+    assert m.amount_used_display_var.get() == "99"
+    RenderQueue.for_widget(root).flush()
+    assert renders == [99]
+
+
+def test_tableview_row_inserts_share_one_reload(root, monkeypatch):
+    table = Tableview(root, coldata=["a", "b"], rowdata=[(0, "x")])
+    loads = []
+    original = table.load_table_data
+    monkeypatch.setattr(table, "load_table_data",
+                        lambda *a, **k: (loads.append(1), original(*a, **k)))
+    rows = [table.insert_row(values=(i, str(i)), reload="idle") for i in range(1, 20)]
+    rows[0].delete(reload="idle")  # deleting a row not yet shown is fine
+    assert loads == []
+    RenderQueue.for_widget(root).flush()
+    assert loads == [1]
+    assert len(table.get_rows(visible=True)) == 19
+
+
+def test_tableview_insert_row_reloads_before_returning(root):
+    table = Tableview(root, coldata=["a", "b"], rowdata=[(0, "x")])
+    row = table.insert_row(values=(1, "y"))
+    assert table.iidmap[row.iid] is row
+    row.hide()
+    row.delete()
+    assert len(table.get_rows(visible=True)) == 1
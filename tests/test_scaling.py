@@ -154,6 +154,83 @@ def test_public_utility_reuses_root_service():
     assert utils.scale_size(root, [22, 6]) == [33, 9]
 
 
+def test_factor_and_windowing_system_are_read_once_until_refresh():
+    root = _FakeRoot("x11", 4 / 3)
+    calls = []
+    original_call = root.tk.call
+    root.tk.call = lambda *args: (calls.append(args), original_call(*args))[1]
+    scaling = Scaling(root)
+    for _ in range(100):
+        scaling.logical(10)
+        assert scaling.windowing_system == "x11"
+    assert calls.count(("tk", "scaling")) == 1
+    assert calls.count(("tk", "windowingsystem")) == 1
+
+    root.tk.scaling = (4 / 3) * 2
+    assert scaling.factor == 1.0  # cached until refreshed
+    changes = []
+    scaling.on_change(lambda old, new: changes.append((old, new)))
+    assert scaling.refresh() is True
+    assert scaling.factor == 2.0 and changes == [(1.0, 2.0)]
+    assert scaling.refresh() is False and changes == [(1.0, 2.0)]
+
+
+def test_refresh_rebuilds_styles_and_repaints_image_elements(root):
+    from ttkbootstrap import Checkbutton
+
+    tk = root.tk
+    before = float(tk.call("tk", "scaling"))
+    check = Checkbutton(root, bootstyle="info")
+    check.pack()
+    root.update_idletasks()
+    padding = _button_padding(root)
+    element = "info.TCheckbutton.indicator"
+    key = (root.style.theme.name, element)
+    image = str(root.style._element_images[key][0])
+    width = int(tk.call("image", "width", image))
+    try:
+        tk.call("tk", "scaling", root.style.scaling.baseline * 2)
+        assert utils.refresh_scaling(root) is True
+        assert _button_padding(root) == [2 * value for value in padding]
+        # the element keeps its image name; the image now has the new size
+        assert int(tk.call("image", "width", image)) > width
+    finally:
+        tk.call("tk", "scaling", before)
+        root.style.scaling.refresh()
+    assert _button_padding(root) == padding
+    assert int(tk.call("image", "width", image)) == width
+
+
+def test_scaling_change_keeps_images_handed_out_alive(root):
+    tk = root.tk
+    style = root.style
+    before = float(tk.call("tk", "scaling"))
+    icon = Assets(style).icon("folder-fill", 16, style.colors.warning)
+    canvas = tkinter.Canvas(root)
+    canvas.create_image(0, 0, image=icon)
+    try:
+        for factor in (2, 1):
+            tk.call("tk", "scaling", style.scaling.baseline * factor)
+            utils.refresh_scaling(root)
+    finally:
+        tk.call("tk", "scaling", before)
+        style.scaling.refresh()
+    # the old-size image is no longer cached but still exists under its name
+    assert icon in tk.splitlist(tk.call("image", "names"))
+    assert icon in style._retired_images
+    canvas.destroy()
+
+
+def test_watch_polls_for_scaling_changes(root):
+    scaling = Scaling.for_widget(root)
+    utils.watch_dpi(root, interval=10)
+    try:
+        assert scaling.watching
+    finally:
+        utils.watch_dpi(root, enable=False)
+    assert not scaling.watching
+
+
 def test_test_root_runs_at_baseline_density(root):
     # Every exact-pixel assertion in the suite presupposes it. The shared root
     # is pinned in conftest so a contributor on a scaled display (Windows at
@@ -285,6 +362,7 @@ def test_manifest_geometry_and_image_matrix(root, factor):
     before = float(tk.call("tk", "scaling"))
     try:
         tk.call("tk", "scaling", root.style.scaling.baseline * factor)
+        root.style.scaling.refresh()
         assets = Assets(root.style)
         for name, (logical_size, logical_border, logical_padding) in (
             APPROVED_MANIFEST_GEOMETRY.items()
@@ -312,6 +390,7 @@ def test_manifest_geometry_and_image_matrix(root, factor):
         assert rotated.meta.border == _scaled((0, 2), factor)
     finally:
         tk.call("tk", "scaling", before)
+        root.style.scaling.refresh()
 
 
 @pytest.mark.parametrize(
@@ -329,6 +408,7 @@ def test_procedural_and_icon_frames_scale_once_and_keep_exact_size(
 
     try:
         tk.call("tk", "scaling", root.style.scaling.baseline * factor)
+        root.style.scaling.refresh()
         assets = Assets(root.style)
         names = (
             assets.circle("#123456", 15),
@@ -341,6 +421,7 @@ def test_procedural_and_icon_frames_scale_once_and_keep_exact_size(
             assert int(tk.call("image", "height", name)) == expected
     finally:
         tk.call("tk", "scaling", before)
+        root.style.scaling.refresh()
 
 
 def test_representative_builder_geometry_scales_once(root):
@@ -363,6 +444,7 @@ def test_representative_builder_geometry_scales_once(root):
     )
     try:
         tkapp.call("tk", "scaling", style.scaling.baseline * 1.5)
+        root.style.scaling.refresh()
         for recipe in recipes:
             recipe(builder, "danger")
 
@@ -380,6 +462,7 @@ def test_representative_builder_geometry_scales_once(root):
         assert int(text.cget("padx")) == 8
     finally:
         tkapp.call("tk", "scaling", before)
+        root.style.scaling.refresh()
         for recipe in recipes[:-1]:
             recipe(builder, "danger")
         for ttk_style in (
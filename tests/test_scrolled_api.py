@@ -10,7 +10,7 @@ import warnings
 import pytest
 
 import ttkbootstrap as ttk
-from ttkbootstrap.widgets.scrolled import ScrolledFrame, ScrolledText
+from ttkbootstrap.widgets.scrolled import ScrolledFrame, ScrolledList, ScrolledText
 
 
 # --------------------------------------------------------------------------- #
@@ -264,6 +264,80 @@ def test_scrolledframe_vscroll_is_deprecated_alias_of_vbar(root):
     assert any(issubclass(w.category, DeprecationWarning) for w in caught)
 
 
+def test_scrolledtext_appends_are_batched_and_trimmed(root, monkeypatch):
+    st = ScrolledText(root, max_lines=100)
+    inserts = []
+    real_insert = st.text.insert
+    monkeypatch.setattr(st.text, "insert",
+                        lambda *a: (inserts.append(a[0]), real_insert(*a)))
+    for i in range(250):
+        st.append(f"line {i}\n")
+    assert inserts == []
+    st.flush()
+    assert len(inserts) == 1  # one insert for the whole batch
+    assert st.get("1.0", "1.end") == "line 150"
+    for i in range(250, 260):
+        st.append(f"line {i}\n")
+    st.flush()
+    lines = st.get("1.0", "end-1c").splitlines()
+    assert len(lines) == 100 and lines[0] == "line 160" and lines[-1] == "line 259"
+
+
+def test_scrolledtext_append_follows_only_from_the_bottom(root):
+    st = ScrolledText(root, height=5)
+    st.pack()
+    st.append("".join(f"{i}\n" for i in range(200)))
+    st.flush()
+    root.update_idletasks()
+    assert st.yview()[1] == 1.0
+    st.yview_moveto(0)
+    st.append("more\n")
+    st.flush()
+    assert st.yview()[0] == 0.0  # a reader scrolled up is left in place
+    st.destroy()
+
+
+def test_scrolledtext_append_threadsafe_from_a_worker(root):
+    import threading
+    import time
+
+    st = ScrolledText(root)
+    worker = threading.Thread(
+        target=lambda: [st.append_threadsafe(f"{i}\n") for i in range(20)])
+    worker.start()
+    worker.join()
+    deadline = time.monotonic() + 2
+    while st.get("1.0", "end-1c").count("\n") < 20 and time.monotonic() < deadline:
+        root.update()
+    assert st.get("1.0", "end-1c").splitlines() == [str(i) for i in range(20)]
+
+
+def test_scrolledtext_view_file_pages_a_large_file(root, tmp_path):
+    from ttkbootstrap.widgets import scrolled
+
+    path = tmp_path / "big.log"
+    path.write_text("".join(f"row {i}\n" for i in range(10 * scrolled._PAGE_LINES)))
+    st = ScrolledText(root, height=10)
+    st.pack()
+    st.view_file(str(path))
+    root.update_idletasks()
+    assert str(st.text.cget("state")) == "disabled"
+    # only one page of the file is in the widget
+    assert int(st.index("end-1c").split(".")[0]) <= scrolled._PAGE_LINES
+    assert st.get("1.0", "1.end") == "row 0"
+    st._file_yview("moveto", "0.5")  # what dragging the scrollbar sends
+    root.update_idletasks()
+    assert st.get("@0,0", "@0,0 lineend") == f"row {5 * scrolled._PAGE_LINES}"
+    low, _ = st.vbar.get()
+    assert 0.45 < low < 0.55
+    with pytest.raises(RuntimeError):
+        st.append("x")
+    st.close_file()
+    assert st.get("1.0", "end-1c") == ""
+    assert str(st.text.cget("state")) == "normal"
+    st.destroy()
+
+
 # --------------------------------------------------------------------------- #
 # Text border theming (2.0 regression fixes)
 # --------------------------------------------------------------------------- #
@@ -289,3 +363,88 @@ def test_scrolledtext_inner_text_stays_borderless_across_theme_switch(root):
     style.theme_use("bootstrap-dark")
     root.update_idletasks()
     assert int(st._text.cget("highlightthickness")) == 0
+
+
+# --------------------------------------------------------------------------- #
+# ScrolledList
+# --------------------------------------------------------------------------- #
+def _make_list(root, count=100_000, **kwargs):
+    built = []
+    updates = []
+
+    def factory(master):
+        row = ttk.Label(master)
+        built.append(row)
+        return row
+
+    def update(row, index):
+        updates.append(index)
+        row.configure(text=f"item {index}")
+
+    sl = ScrolledList(
+        root, item_count=count, row_factory=factory, update_row=update,
+        row_height=20, height=200, **kwargs,
+    )
+    return sl, built, updates
+
+
+def test_scrolledlist_builds_only_the_rows_in_view(root):
+    sl, built, updates = _make_list(root)
+    assert sl.visible_range() == (0, 10)
+    assert len(built) == 10
+    assert sorted(updates) == list(range(10))
+    assert sl.row_for(3).cget("text") == "item 3"
+    assert sl.row_for(50) is None
+
+
+def test_scrolledlist_recycles_rows_on_scroll(root):
+    sl, built, updates = _make_list(root)
+    updates.clear()
+    sl.yview_scroll(5, "units")
+    assert sl.visible_range() == (5, 15)
+    assert sorted(updates) == list(range(10, 15))  # only the rows that entered
+    sl.yview_moveto(0.5)
+    first, last = sl.visible_range()
+    assert first == 50_000 and last - first == 10
+    assert len(built) <= 11
+    assert sl.row_for(first).cget("text") == f"item {first}"
+
+
+def test_scrolledlist_yview_follows_the_offset(root):
+    sl, _, _ = _make_list(root, count=100)
+    assert sl.yview() == (0.0, 0.1)
+    sl.yview("moveto", 1.0)  # clamps to the last full page
+    assert sl.yview() == (0.9, 1.0)
+    assert sl.visible_range() == (90, 100)
+
+
+def test_scrolledlist_see_scrolls_the_least_distance(root):
+    sl, _, _ = _make_list(root, count=100)
+    sl.see(5)
+    assert sl.visible_range() == (0, 10)
+    sl.see(25)
+    assert sl.visible_range() == (16, 26)
+
+
+def test_scrolledlist_item_count_shrinks_and_grows(root):
+    sl, built, _ = _make_list(root, count=100)
+    sl.yview_moveto(1.0)
+    sl.set_item_count(4)
+    assert sl.visible_range() == (0, 4)
+    assert sl.row_for(5) is None
+    sl.item_count = 0
+    assert sl.visible_range() == (0, 0)
+    assert sl.yview() == (0.0, 1.0)
+    sl.set_item_count(30)
+    assert sl.visible_range() == (0, 10)
+    assert len(built) <= 11
+
+
+def test_scrolledlist_rows_carry_the_wheel_tag(root):
+    sl, built, _ = _make_list(root, count=30)
+    assert all(sl._wheel_tag in row.bindtags() for row in built)
+
+
+def test_scrolledlist_rejects_a_zero_row_height(root):
+    with pytest.raises(ValueError):
+        ScrolledList(root, row_factory=ttk.Label, update_row=print, row_height=0)
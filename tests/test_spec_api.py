@@ -0,0 +1,88 @@
+"""Tests for declarative widget-tree construction (ttkbootstrap.build)."""
+import pytest
+
+import ttkbootstrap as ttk
+from ttkbootstrap import profiling
+from ttkbootstrap.style import Bootstyle
+
+
+def test_build_creates_the_tree_and_returns_named_widgets(root):
+    holder = ttk.Frame(root)
+    widgets = ttk.build([
+        ("Label", {"text": "Name", "grid": {"row": 0, "column": 0}}),
+        ("Entry", {"name": "name", "bootstyle": "info",
+                   "grid": {"row": 0, "column": 1, "sticky": "ew"}}),
+        {"type": ttk.Frame, "name": "bar", "grid": {"row": 1, "column": 0}, "children": [
+            ("Button", {"name": "ok", "text": "OK", "pack": {"side": "right", "padx": (2, 4)}}),
+        ]},
+    ], holder)
+    assert set(widgets) == {"name", "bar", "ok"}
+    assert widgets["name"].master is holder and widgets["ok"].master is widgets["bar"]
+    assert widgets["name"].cget("style") == "info.TEntry"
+    assert widgets["ok"].cget("text") == "OK"
+    grid = widgets["name"].grid_info()
+    assert (int(grid["row"]), int(grid["column"]), grid["sticky"]) == (0, 1, "ew")
+    assert widgets["ok"].pack_info()["side"] == "right"
+    holder.destroy()
+
+
+def test_build_resolves_each_bootstyle_once(root, monkeypatch):
+    holder = ttk.Frame(root)
+    resolved = []
+    original = Bootstyle.update_ttk_widget_style
+
+    def counting(widget=None, style_string=None, **kwargs):
+        resolved.append(style_string)
+        return original(widget, style_string, **kwargs)
+
+    monkeypatch.setattr(Bootstyle, "update_ttk_widget_style", staticmethod(counting))
+    spec = [("Label", {"text": str(i), "bootstyle": "success"}) for i in range(50)]
+    spec += [("Scale", {"orient": orient}) for orient in ("horizontal", "vertical") * 5]
+    ttk.build(spec, holder)
+    labels = [w for w in holder.winfo_children() if isinstance(w, ttk.Label)]
+    scales = [w for w in holder.winfo_children() if isinstance(w, ttk.Scale)]
+    assert {w.cget("style") for w in labels} == {"success.TLabel"}
+    assert {str(w.cget("style")) for w in scales} == {
+        "Horizontal.TScale", "Vertical.TScale"}
+    assert len(resolved) == 3  # one label, one scale per orientation
+    assert all(hasattr(w, "_theme_version") for w in labels + scales)
+    holder.destroy()
+
+
+def test_build_places_the_whole_tree_in_one_tcl_call(root):
+    holder = ttk.Frame(root)
+    spec = [("Label", {"text": str(i), "pack": {"fill": "x"}}) for i in range(20)]
+    with profiling.record_tcl_calls(root) as rec:
+        ttk.build(spec, holder)
+    assert not [call for call in rec.calls if call.args[:1] == ("pack",)]
+    assert len(holder.pack_slaves()) == 20
+    holder.destroy()
+
+
+def test_build_uses_a_widgets_own_geometry_method(root):
+    # ScrolledFrame forwards pack() to its container, so it is not batched
+    holder = ttk.Frame(root)
+    widgets = ttk.build([
+        ("Label", {"name": "before", "pack": True}),
+        ("ScrolledFrame", {"name": "scroller", "pack": {"fill": "both"}}, [
+            ("Label", {"name": "inside", "text": "x", "pack": True}),
+        ]),
+        ("Label", {"name": "after", "pack": True}),
+    ], holder)
+    scroller = widgets["scroller"]
+    assert scroller.container.winfo_manager() == "pack"
+    assert holder.pack_slaves() == [widgets["before"], scroller.container, widgets["after"]]
+    assert widgets["inside"].winfo_parent() == str(scroller)
+    holder.destroy()
+
+
+@pytest.mark.parametrize("spec, message", [
+    (("Nope", {}), "Unknown widget type"),
+    ([("Label", {"name": "a"}), ("Label", {"name": "a"})], "Duplicate widget name"),
+    (("Label", {"pack": True, "grid": {}}), "one geometry manager"),
+])
+def test_build_rejects_a_bad_spec(root, spec, message):
+    holder = ttk.Frame(root)
+    with pytest.raises(ValueError, match=message):
+        ttk.build(spec, holder)
+    holder.destroy()
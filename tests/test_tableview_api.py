@@ -282,3 +282,28 @@ def test_style_stays_on_the_wrapper_frame(root):
     # reporting the frame's style, not the inner Treeview's.
     tv = _make_table(root)
     assert str(tv.cget("style")) != str(tv.view.cget("style"))
+
+
+def test_insert_rows_threadsafe_batches_into_one_reload(root, monkeypatch):
+    import threading
+    import time
+
+    tv = _make_table(root)
+    before = len(tv.tablerows)
+    reloads = []
+    real_reload = tv.load_table_data
+    monkeypatch.setattr(tv, "load_table_data",
+                        lambda *a, **k: (reloads.append(1), real_reload(*a, **k)))
+
+    def work():
+        for i in range(5):
+            tv.insert_rows_threadsafe("end", [[f"w{i}", i, i]])
+
+    worker = threading.Thread(target=work)
+    worker.start()
+    worker.join()
+    deadline = time.monotonic() + 2
+    while len(tv.tablerows) < before + 5 and time.monotonic() < deadline:
+        root.update()
+    assert len(tv.tablerows) == before + 5
+    assert len(reloads) == 1
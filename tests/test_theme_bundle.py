@@ -0,0 +1,46 @@
+"""Tests for the precomputed curated-theme bundle (`themes/bundle.json`).
+
+The bundle must match what the `Theme` families generate live; when it does
+not, regenerate it with ``python tools/generate_theme_bundle.py``.
+"""
+import json
+from dataclasses import replace
+
+from ttkbootstrap.themes import builtin
+
+
+def _resolved(definitions):
+    return [(d.name, d.mode, {k: str(v) for k, v in vars(d.colors).items()})
+            for d in definitions]
+
+
+def test_bundle_matches_the_live_catalog():
+    live = [d for theme in builtin.CURATED_THEMES for d in theme.to_definitions()]
+    assert _resolved(builtin.curated_definitions()) == _resolved(live)
+    bundle = json.loads(builtin.BUNDLE_PATH.read_text(encoding="utf-8"))
+    assert [bundle[t.name]["inputs"] for t in builtin.CURATED_THEMES] == [
+        builtin.theme_inputs(t) for t in builtin.CURATED_THEMES]
+
+
+def test_edited_family_is_generated_live(monkeypatch):
+    edited = replace(builtin.BOOTSTRAP, primary="#123456")
+    monkeypatch.setattr(
+        builtin, "CURATED_THEMES", [edited] + builtin.CURATED_THEMES[1:])
+    definitions = builtin.curated_definitions()
+    assert _resolved(definitions[:2]) == _resolved(edited.to_definitions())
+
+
+def test_new_derivation_version_is_generated_live(monkeypatch):
+    monkeypatch.setattr(builtin, "DERIVATION_VERSION", builtin.DERIVATION_VERSION + 1)
+    calls = []
+    to_definitions = builtin.Theme.to_definitions
+    monkeypatch.setattr(builtin.Theme, "to_definitions",
+                        lambda self: calls.append(self.name) or to_definitions(self))
+    builtin.curated_definitions()
+    assert calls == [t.name for t in builtin.CURATED_THEMES]
+
+
+def test_missing_bundle_falls_back_to_live(monkeypatch, tmp_path):
+    monkeypatch.setattr(builtin, "BUNDLE_PATH", tmp_path / "missing.json")
+    live = [d for theme in builtin.CURATED_THEMES for d in theme.to_definitions()]
+    assert _resolved(builtin.curated_definitions()) == _resolved(live)
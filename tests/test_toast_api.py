@@ -224,4 +224,21 @@ def test_separate_corners_are_independent(root):
     assert _TOAST_STACK.offset_for(t1) == 0
     assert _TOAST_STACK.offset_for(t2) == 0
     t1.hide()
-    t2.hide()
\ No newline at end of file
+    t2.hide()
+
+def test_show_and_hide_threadsafe_run_on_the_ui_thread(root):
+    import threading
+    import time
+
+    t = ToastNotification("T", "M", position=(5, 50, "se"))
+    worker = threading.Thread(target=t.show_toast_threadsafe)
+    worker.start()
+    worker.join()
+    deadline = time.monotonic() + 2
+    while t.toplevel is None and time.monotonic() < deadline:
+        root.update()
+    assert t in _TOAST_STACK._corners["se"]
+    t.hide_threadsafe()
+    while t in _TOAST_STACK._corners.get("se", []) and time.monotonic() < deadline:
+        root.update()
+    assert t not in _TOAST_STACK._corners.get("se", [])
@@ -19,7 +19,8 @@ from ttkbootstrap import utils
 # top-level exposure
 # --------------------------------------------------------------------------
 
-_UTILITY_NAMES = ("enable_high_dpi_awareness", "scale_size", "windowing_system")
+_UTILITY_NAMES = ("enable_high_dpi_awareness", "scale_size", "windowing_system",
+                  "refresh_scaling", "watch_dpi")
 _COLOR_NAMES = (
     "color_to_rgb", "color_to_hex", "color_to_hsl",
     "update_hsl_value", "contrast_color", "conform_color_model",
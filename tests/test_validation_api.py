@@ -0,0 +1,62 @@
+"""Tests for the validation rules (ttkbootstrap.validation)."""
+import pytest
+
+import ttkbootstrap as ttk
+from ttkbootstrap.validation import Validation, validator
+
+
+def _check(entry, value):
+    entry.delete(0, "end")
+    entry.insert(0, value)
+    return entry.validate()
+
+
+@pytest.mark.parametrize("tcl", [False, True])
+@pytest.mark.parametrize("attach, good, bad", [
+    (lambda e, **k: Validation.text(e, **k), ["", "abc"], ["ab1"]),
+    (lambda e, **k: Validation.numeric(e, **k), ["", "123"], ["12a", "1.5"]),
+    (lambda e, **k: Validation.range(e, 0, 120, **k), ["", "0", "99.5", "120", "010", "1e2"], ["121", "-1", "x", "0x10"]),
+    (lambda e, **k: Validation.regex(e, r"\d+%", **k), ["50%", "5%x"], ["50", "%"]),
+    (lambda e, **k: Validation.options(e, ["low", "very high"], **k), ["low", "very high"], ["", "high"]),
+    (lambda e, **k: Validation.phonenumber(e, **k), ["(555) 123-4567", "555.123.4567"], ["555"]),
+])
+def test_builtin_rules_agree_in_python_and_tcl(root, attach, good, bad, tcl):
+    entry = ttk.Entry(root)
+    attach(entry, tcl=tcl)
+    assert [_check(entry, v) for v in good] == [True] * len(good)
+    assert [_check(entry, v) for v in bad] == [False] * len(bad)
+    assert "invalid" in entry.state()
+    entry.destroy()
+
+
+def test_builtin_rules_pass_only_the_proposed_value(root):
+    entry = ttk.Entry(root)
+    Validation.numeric(entry, when="key")
+    command = root.tk.splitlist(entry.cget("validatecommand"))
+    assert command[1:] == ("%P",)
+    entry.destroy()
+
+
+def test_tcl_rules_never_call_back_into_python(root):
+    entry = ttk.Entry(root)
+    Validation.range(entry, 1, 10, tcl=True)
+    command = root.tk.splitlist(entry.cget("validatecommand"))
+    # a namespaced Tcl procedure, not a command registered for a Python callable
+    assert command[0] == "::ttkbootstrap::validation::range"
+    assert _check(entry, "5") and not _check(entry, "50")
+    entry.destroy()
+
+
+def test_custom_rules_still_receive_the_full_event(root):
+    seen = []
+
+    @validator
+    def max_length(event, limit):
+        seen.append((event.postchangetext, event.widget))
+        return len(event.postchangetext) <= limit
+
+    entry = ttk.Entry(root)
+    Validation.add(entry, max_length, limit=3)
+    assert _check(entry, "abc") and not _check(entry, "abcd")
+    assert seen[-1] == ("abcd", entry)
+    entry.destroy()
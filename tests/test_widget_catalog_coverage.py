@@ -28,6 +28,7 @@ _EXTRA_WIDGETS = {"ToastNotification", "ToolTip"}
 _PAGE_ALIASES = {
     "ToastNotification": "toast",
     "ScrolledFrame": "scrolled",
+    "ScrolledList": "scrolled",
     "ScrolledText": "scrolled",
 }
 
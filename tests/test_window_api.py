@@ -697,6 +697,16 @@ def test_on_close_on_app_root_veto(root):
 # screeninfo when installed and from X11's Xinerama extension otherwise. The
 # ctypes query itself needs a real X server; these cover the chain around it.
 
+
+@pytest.fixture(autouse=True)
+def _fresh_monitor_layout():
+    # The layout is cached across placements; tests that swap its source must
+    # not see a layout cached by an earlier test (or leave theirs behind).
+    positioning.forget_monitor_layout()
+    yield
+    positioning.forget_monitor_layout()
+
+
 def test_xinerama_query_is_skipped_off_x11(monkeypatch):
     # It must not try to load libX11 on Windows or macOS.
     import sys
@@ -736,6 +746,40 @@ def test_monitor_at_point_returns_none_when_no_source_answers(monkeypatch):
     assert positioning._monitor_at_point(10, 10) is None
 
 
+def test_monitor_layout_is_queried_once_per_ttl(monkeypatch):
+    queries = []
+    layout = [(0, 0, 1920, 1080), (1920, 0, 2560, 1440)]
+    monkeypatch.setattr(positioning, "_monitors", lambda: queries.append(1) or layout)
+    clock = [100.0]
+    monkeypatch.setattr(positioning.time, "monotonic", lambda: clock[0])
+    for _ in range(50):
+        assert positioning._monitor_at_point(2000, 10) == layout[1]
+    assert queries == [1]
+    clock[0] += positioning._LAYOUT_TTL
+    positioning._monitor_at_point(10, 10)
+    assert queries == [1, 1]
+    positioning.forget_monitor_layout()
+    positioning._monitor_at_point(10, 10)
+    assert len(queries) == 3
+
+
+def test_monitor_lookup_matches_a_linear_scan():
+    # a display left of and one above the primary, plus a mirrored clone
+    rects = [(0, 0, 1920, 1080), (-1280, 100, 1280, 1024), (0, -1440, 2560, 1440),
+             (0, 0, 1920, 1080)]
+    layout = positioning._MonitorLayout(rects)
+
+    def scan(x, y):
+        for mx, my, mw, mh in rects:
+            if mx <= x < mx + mw and my <= y < my + mh:
+                return (mx, my, mw, mh)
+        return rects[0]
+
+    for x in range(-1500, 2700, 97):
+        for y in range(-1500, 1200, 89):
+            assert layout.at(x, y) == scan(x, y)
+
+
 def test_placement_stays_on_screen_when_no_layout_is_available(root, monkeypatch):
     # macOS without `screeninfo` has no monitor enumeration at all -- Xinerama is
     # X11-only -- so the layout is unknown and placement falls back to Tk's own
@@ -779,3 +823,94 @@ def test_clamp_uses_the_monitor_under_the_point_not_the_whole_desktop(root, monk
     x, _ = positioning.ensure_on_screen(top, 1800, 300, size=(400, 200))
     assert x + 400 <= 1920, "the window should be pulled fully onto the left monitor"
     top.destroy()
+
+
+# --------------------------------------------------------------------------
+# call_soon_threadsafe
+# --------------------------------------------------------------------------
+
+def _pump_until(app, predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        app.update()
+    return predicate()
+
+
+def test_call_soon_threadsafe_runs_worker_callbacks_in_order_on_ui_thread(root):
+    import threading
+
+    ran = []
+    ui_thread = threading.get_ident()
+
+    def record(i):
+        ran.append((i, threading.get_ident()))
+
+    worker = threading.Thread(
+        target=lambda: [root.call_soon_threadsafe(record, i) for i in range(50)])
+    worker.start()
+    worker.join()
+    assert _pump_until(root, lambda: len(ran) == 50)
+    assert [i for i, _ in ran] == list(range(50))
+    assert {tid for _, tid in ran} == {ui_thread}
+
+
+def test_call_soon_threadsafe_drains_queued_callbacks_in_one_batch(root):
+    from ttkbootstrap.internal.dispatch import UIDispatcher
+
+    dispatcher = UIDispatcher.for_widget(root)
+    assert dispatcher is UIDispatcher.for_widget(root)   # one per root
+    ran = []
+    for i in range(10):
+        root.call_soon_threadsafe(ran.append, i)
+    assert dispatcher.pending() == 10
+    dispatcher.drain()
+    assert ran == list(range(10)) and dispatcher.pending() == 0
+
+
+@pytest.mark.parametrize("build", [
+    lambda root: ttk.Toplevel(master=root),
+    lambda root: ttk.ScrolledText(root),
+    lambda root: ttk.Floodgauge(root),
+    lambda root: ttk.Tableview(root),
+])
+def test_widgets_with_threadsafe_methods_create_the_dispatcher_up_front(root, build):
+    from ttkbootstrap.internal.dispatch import _DISPATCHER_ATTRIBUTE, UIDispatcher
+
+    # as under a plain tkinter.Tk root, which no App has set up
+    original = getattr(root, _DISPATCHER_ATTRIBUTE)
+    delattr(root, _DISPATCHER_ATTRIBUTE)
+    try:
+        widget = build(root)
+        created = getattr(root, _DISPATCHER_ATTRIBUTE, None)
+        assert isinstance(created, UIDispatcher)
+        created.close()
+        widget.destroy()
+    finally:
+        setattr(root, _DISPATCHER_ATTRIBUTE, original)
+
+
+def test_dispatcher_coalesces_keyed_callbacks(root):
+    from ttkbootstrap.internal.dispatch import UIDispatcher
+
+    dispatcher = UIDispatcher.for_widget(root)
+    seen = []
+    for i in range(5):
+        dispatcher.call_soon(seen.append, i, key="latest")
+    assert dispatcher.pending() == 1
+    assert _pump_until(root, lambda: seen)
+    assert seen == [4]
+
+
+def test_call_soon_threadsafe_reports_callback_errors(root, monkeypatch):
+    reported = []
+    monkeypatch.setattr(root, "report_callback_exception",
+                        lambda *exc: reported.append(exc[0]))
+    after = []
+
+    def boom():
+        raise ValueError("boom")
+
+    root.call_soon_threadsafe(boom)
+    root.call_soon_threadsafe(after.append, "still ran")
+    assert _pump_until(root, lambda: after)
+    assert reported == [ValueError]
@@ -0,0 +1,55 @@
+"""Tests for the on-demand combobox popdown styling.
+
+The popdown is a Tcl-level toplevel, created and styled just before it is
+first posted under a theme instead of when the combobox is built or its theme
+changes.
+"""
+import ttkbootstrap as ttk
+from ttkbootstrap import profiling
+
+
+def _popdown_exists(cb):
+    return bool(int(cb.tk.call("winfo", "exists", f"{cb}.popdown")))
+
+
+def _before_post(root, cb):
+    """Run what the press/<Down> bindings run ahead of posting the popdown."""
+    root.tk.call(root._ttkbootstrap_popdown_hook, str(cb))
+
+
+def _listbox_background(cb):
+    return str(cb.tk.call(f"{cb}.popdown.f.l", "cget", "-background")).lower()
+
+
+def test_popdown_is_not_created_with_the_combobox(root):
+    cb = ttk.Combobox(root, values=["a", "b"])
+    cb.configure(bootstyle="info")
+    assert not _popdown_exists(cb)
+    tags = root.tk.splitlist(root.tk.call("bindtags", cb._w))
+    assert tags.index("TtkbootstrapPopdown") == tags.index("TCombobox") - 1
+    assert list(tags).count("TtkbootstrapPopdown") == 1
+    cb.destroy()
+
+
+def test_popdown_is_styled_before_its_first_post(root):
+    cb = ttk.Combobox(root, values=["a", "b"])
+    _before_post(root, cb)
+    assert _popdown_exists(cb)
+    assert _listbox_background(cb) == str(root.style.colors.inputbg).lower()
+    assert str(cb.tk.call(f"{cb}.popdown.f.sb", "cget", "-style")) == (
+        "Thin.Vertical.TScrollbar")
+    # nothing changed since, so the next post does not restyle it
+    with profiling.record_tcl_calls(root) as rec:
+        _before_post(root, cb)
+    assert not [call for call in rec.calls if "configure" in call.args[1:2]]
+    cb.destroy()
+
+
+def test_popdown_is_restyled_after_a_theme_change(root):
+    style = root.style
+    cb = ttk.Combobox(root, values=["a", "b"])
+    _before_post(root, cb)
+    style.theme_use("bootstrap-dark")
+    _before_post(root, cb)
+    assert _listbox_background(cb) == str(style.colors.inputbg).lower()
+    cb.destroy()
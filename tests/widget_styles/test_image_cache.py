@@ -105,3 +105,43 @@ def test_clear_image_cache_empties(root):
 
     style.clear_image_cache()
     assert len(style._image_cache) == 0
+
+
+def test_batched_rendering_fills_placeholders_on_exit(root):
+    """Inside a batch the name is handed out at once; the pixels land on exit."""
+    import threading
+
+    from ttkbootstrap.style import Assets
+
+    style = root.style
+    assets = Assets(style)
+    threads = []
+
+    def draw(d, w, h):
+        threads.append(threading.current_thread())
+        d.rectangle((0, 0, w - 1, h - 1), fill="#ff0000")
+
+    with style.batched_rendering():
+        name = assets.image((10, 10), draw, "batch-test-red")
+        # a second request for the same key inside the batch is a cache hit
+        assert assets.image((10, 10), draw, "batch-test-red") == name
+
+    assert threads and threads[0] is not threading.main_thread()
+    image = style._image_cache[(draw.__qualname__, style.scaling.image_size((10, 10)),
+                                "batch-test-red")][1]
+    px = root.tk.call(name, "get", image.width() // 2, image.height() // 2)
+    assert tuple(int(c) for c in root.tk.splitlist(px)) == (255, 0, 0)
+
+
+def test_batched_render_failure_is_evicted_and_raised(root):
+    """A render that fails inside a batch raises on exit and is not cached."""
+    import pytest
+
+    from ttkbootstrap.style import Assets
+
+    style = root.style
+    before = len(style._image_cache)
+    with pytest.raises(ValueError):
+        with style.batched_rendering():
+            Assets(style).icon("no-such-glyph-anywhere", 16, "#000000")
+    assert len(style._image_cache) == before
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""Generate the precomputed color table for the curated built-in themes.
+
+Every curated `Theme` family (`ttkbootstrap.themes.builtin.CURATED_THEMES`)
+derives its `<name>-light` / `<name>-dark` colors from a handful of anchors:
+the ramps, the per-mode solid steps, the on-colors and the border mix. The
+inputs are constants, so this tool runs the derivation once and writes the
+resolved `Colors` fields to `themes/bundle.json`, which `Style` reads at
+startup instead of recomputing them. Re-run it whenever a curated family or
+the color derivation in `style/theme.py` changes:
+
+    python tools/generate_theme_bundle.py
+
+Each family entry records the inputs it was generated from, including
+`DERIVATION_VERSION` from `style/theme.py`. A family whose declared inputs or
+derivation version no longer match is generated live at startup. Changing the
+derivation math without bumping that version is not detected at startup:
+`tests/test_theme_bundle.py` compares the bundle with the live output and
+fails until the version is bumped and the bundle regenerated.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+_SRC = Path(__file__).resolve().parent.parent / "src"
+if str(_SRC) not in sys.path:
+    sys.path.insert(0, str(_SRC))
+
+from ttkbootstrap.style.theme import Colors  # noqa: E402
+from ttkbootstrap.themes.builtin import (  # noqa: E402
+    BUNDLE_PATH,
+    CURATED_THEMES,
+    theme_inputs,
+)
+
+
+def build_bundle() -> dict[str, dict]:
+    """Return the bundle: family name -> its inputs and generated definitions."""
+    bundle = {}
+    for theme in CURATED_THEMES:
+        bundle[theme.name] = {
+            "inputs": theme_inputs(theme),
+            "definitions": [
+                {
+                    "name": definition.name,
+                    "mode": definition.mode,
+                    "colors": {
+                        label: str(getattr(definition.colors, label))
+                        for label in Colors.label_iter()
+                    },
+                }
+                for definition in theme.to_definitions()
+            ],
+        }
+    return bundle
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", type=Path, default=BUNDLE_PATH, help=f"Output path (default: {BUNDLE_PATH}).")
+    args = parser.parse_args()
+
+    bundle = build_bundle()
+    args.out.write_text(json.dumps(bundle, indent=1) + "\n", encoding="utf-8")
+    count = sum(len(entry["definitions"]) for entry in bundle.values())
+    print(f"Wrote {count} theme definitions from {len(bundle)} families to {args.out}.")
+
+
+if __name__ == "__main__":
+    main()